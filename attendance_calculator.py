@@ -1,21 +1,239 @@
 """
 Attendance calculator for computing individual and team attendance metrics.
 """
-from typing import List, Dict
-from collections import defaultdict
-from models import Meeting
+import copy
+import json
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import List, Dict, Iterable, Optional
+from models import EPOCH, Meeting
+from identity import IdentityResolver
+from presence import covered_seconds
+
+
+@dataclass
+class AttendancePartial:
+    """
+    Compact, mergeable attendance aggregate for one or more exports.
+
+    Holds the number of real meetings (2+ real participants), the sum of
+    unique real participants over those meetings, and per-identity attended
+    counts with the name/email of each identity's first appearance. Partials
+    merge associatively in file order, so a quarter or year can be rolled up
+    from stored per-file partials with the same result as computing it from
+    all the meetings at once.
+
+    In time-weighted mode (presence_threshold set) a person attends a meeting
+    only when the union of their sessions covers at least that fraction of
+    it, and each participant record also carries 'covered_seconds'.
+    """
+    total_meetings: int = 0
+    total_participant_count: int = 0
+    # identifier -> {'name': str, 'email': str or None, 'meetings_attended': int}
+    participants: Dict[str, dict] = field(default_factory=dict)
+    # ISO dates of the first and last counted meeting, None if there are none
+    period_start: Optional[str] = None
+    period_end: Optional[str] = None
+    sources: List[str] = field(default_factory=list)
+    # Time-weighted mode only: the threshold and the summed length of the counted meetings
+    presence_threshold: Optional[float] = None
+    total_meeting_seconds: int = 0
+
+    @property
+    def time_weighted(self) -> bool:
+        return self.presence_threshold is not None
+
+    def merge(self, other: 'AttendancePartial') -> 'AttendancePartial':
+        """Returns a new partial combining this one with a later one."""
+        if self.presence_threshold != other.presence_threshold:
+            raise ValueError(
+                f"Cannot merge partials with different presence thresholds "
+                f"({self.presence_threshold} and {other.presence_threshold})"
+            )
+
+        participants = {identifier: dict(data) for identifier, data in self.participants.items()}
+        for identifier, data in other.participants.items():
+            record = participants.get(identifier)
+            if record is None:
+                participants[identifier] = dict(data)
+            else:
+                record['meetings_attended'] += data['meetings_attended']
+                if 'covered_seconds' in data:
+                    record['covered_seconds'] += data['covered_seconds']
+
+        starts = [date for date in (self.period_start, other.period_start) if date]
+        ends = [date for date in (self.period_end, other.period_end) if date]
+        return AttendancePartial(
+            total_meetings=self.total_meetings + other.total_meetings,
+            total_participant_count=self.total_participant_count + other.total_participant_count,
+            participants=participants,
+            period_start=min(starts) if starts else None,
+            period_end=max(ends) if ends else None,
+            sources=self.sources + other.sources,
+            presence_threshold=self.presence_threshold,
+            total_meeting_seconds=self.total_meeting_seconds + other.total_meeting_seconds
+        )
+
+    @classmethod
+    def merge_all(cls, partials: Iterable['AttendancePartial']) -> 'AttendancePartial':
+        """Merges partials in order; an empty iterable gives an empty partial."""
+        merged = None
+        for partial in partials:
+            merged = copy.deepcopy(partial) if merged is None else merged.merge(partial)
+        return merged if merged is not None else cls()
+
+    def individual_stats(self) -> Dict[str, dict]:
+        """Builds the calculate_individual_attendance result from this partial."""
+        total_meetings = self.total_meetings
+        individual_stats = {}
+        for identifier, data in self.participants.items():
+            stats = individual_stats[identifier] = {
+                'name': data['name'],
+                'email': data['email'],
+                'meetings_attended': data['meetings_attended'],
+                'total_meetings': total_meetings,
+                'attendance_percentage': round(
+                    (data['meetings_attended'] / total_meetings * 100) if total_meetings > 0 else 0, 2
+                )
+            }
+            if self.time_weighted:
+                total_seconds = self.total_meeting_seconds
+                stats['covered_minutes'] = round(data['covered_seconds'] / 60, 2)
+                stats['presence_percentage'] = round(
+                    (data['covered_seconds'] / total_seconds * 100) if total_seconds > 0 else 0, 2
+                )
+        return individual_stats
+
+    def team_stats(self, individual_stats: Dict[str, dict] = None) -> dict:
+        """Builds the calculate_team_attendance result from this partial."""
+        if individual_stats is None:
+            individual_stats = self.individual_stats()
+
+        total_meetings = self.total_meetings
+        total_unique_participants = len(individual_stats)
+
+        # Calculate average attendance percentage
+        if individual_stats:
+            avg_attendance = sum(
+                data['attendance_percentage'] for data in individual_stats.values()
+            ) / len(individual_stats)
+        else:
+            avg_attendance = 0
+
+        # Calculate average participants per meeting (only count meetings with 2+ participants)
+        total_participant_count = self.total_participant_count
+        avg_participants = total_participant_count / total_meetings if total_meetings > 0 else 0
+
+        team_stats = {
+            'total_meetings': total_meetings,
+            'total_unique_participants': total_unique_participants,
+            'average_attendance_percentage': round(avg_attendance, 2),
+            'average_participants_per_meeting': round(avg_participants, 2)
+        }
+        if self.time_weighted:
+            team_stats['presence_threshold'] = self.presence_threshold
+            team_stats['average_presence_percentage'] = round(
+                sum(data['presence_percentage'] for data in individual_stats.values()) / len(individual_stats)
+                if individual_stats else 0, 2
+            )
+        return team_stats
+
+    def to_dict(self) -> dict:
+        return {
+            'total_meetings': self.total_meetings,
+            'total_participant_count': self.total_participant_count,
+            # Stored as a list to keep first-appearance order explicit
+            'participants': [
+                [identifier, data['name'], data['email'], data['meetings_attended']]
+                + ([data['covered_seconds']] if self.time_weighted else [])
+                for identifier, data in self.participants.items()
+            ],
+            'period_start': self.period_start,
+            'period_end': self.period_end,
+            'sources': self.sources,
+            'presence_threshold': self.presence_threshold,
+            'total_meeting_seconds': self.total_meeting_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AttendancePartial':
+        participants = {}
+        for identifier, name, email, attended, *covered in data['participants']:
+            participants[identifier] = {'name': name, 'email': email, 'meetings_attended': attended}
+            if covered:
+                participants[identifier]['covered_seconds'] = covered[0]
+        return cls(
+            total_meetings=data['total_meetings'],
+            total_participant_count=data['total_participant_count'],
+            participants=participants,
+            period_start=data.get('period_start'),
+            period_end=data.get('period_end'),
+            sources=list(data.get('sources', [])),
+            presence_threshold=data.get('presence_threshold'),
+            total_meeting_seconds=data.get('total_meeting_seconds', 0),
+        )
+
+    def save(self, path: str):
+        """Writes the partial as JSON."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'AttendancePartial':
+        """Reads a partial written by save()."""
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
 
 
 class AttendanceCalculator:
-    """Calculates attendance statistics from meeting data."""
-    
-    def __init__(self, meetings: List[Meeting]):
+    """
+    Calculates attendance statistics from meeting data.
+
+    All per-meeting and per-participant aggregates are computed in a single
+    pass over the meetings and cached, so asking for both individual and team
+    statistics only walks the data once. The cache records a fingerprint of
+    the meetings it was computed from: each meeting object, its participant
+    list and that list's length, and its start and end time. Reassigning or
+    editing `meetings` (e.g. `meetings[0] = other`), or replacing, adding or
+    removing a meeting's participants, is detected and recomputes the
+    aggregates; only a Participant edited in place needs `invalidate_cache()`.
+
+    With a presence_threshold (0-1) attendance is time-weighted: each person's
+    join/leave intervals in a meeting are merged (overlapping rejoins count
+    once), and the meeting counts as attended only if the covered time is at
+    least that fraction of the meeting. Individual statistics then also
+    report covered minutes and the presence percentage.
+    """
+
+    def __init__(self, meetings: List[Meeting], identity_resolver: IdentityResolver = None,
+                 presence_threshold: float = None):
+        if presence_threshold is not None and not 0 <= presence_threshold <= 1:
+            raise ValueError(f"presence_threshold must be between 0 and 1, got {presence_threshold}")
+        self.presence_threshold = presence_threshold
+        # Share one resolver across calculators so each person is classified once per run
+        self.identity_resolver = identity_resolver or IdentityResolver()
         self.meetings = meetings
-    
+        # Number of passes made over the meetings (for diagnostics and tests)
+        self.pass_count = 0
+
+    @property
+    def meetings(self) -> List[Meeting]:
+        return self._meetings
+
+    @meetings.setter
+    def meetings(self, meetings: List[Meeting]):
+        self._meetings = meetings
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Discards cached aggregates so the next request recomputes them."""
+        self._aggregates = None
+        self._fingerprint = None
+
     def calculate_individual_attendance(self) -> Dict[str, dict]:
         """
         Calculates attendance percentage for each participant.
-        
+
         Returns:
             Dictionary mapping participant identifier to attendance data:
             {
@@ -28,53 +246,12 @@ class AttendanceCalculator:
                 }
             }
         """
-        # Count total meetings (excluding meetings with only bots)
-        total_meetings = self._count_real_meetings()
-        
-        # Track attendance for each participant
-        participant_attendance = defaultdict(lambda: {
-            'name': '',
-            'email': None,
-            'meetings_attended': 0,
-            'total_meetings': total_meetings
-        })
-        
-        for meeting in self.meetings:
-            # Get unique participants in this meeting (excluding bots)
-            unique_participants = meeting.get_unique_participants()
-            
-            # Only count this meeting if it has at least 2 real participants
-            if len(unique_participants) >= 2:
-                for participant in meeting.participants:
-                    identifier = participant.email if participant.email else participant.name
-                    
-                    # Skip bot participants
-                    if self._is_bot(identifier):
-                        continue
-                    
-                    # Update attendance record
-                    if not participant_attendance[identifier]['name']:
-                        participant_attendance[identifier]['name'] = participant.name
-                        participant_attendance[identifier]['email'] = participant.email
-                    
-                    # Only count once per meeting (in case participant appears multiple times)
-                    if identifier in unique_participants:
-                        participant_attendance[identifier]['meetings_attended'] += 1
-                        # Remove from set so we don't count again
-                        unique_participants.remove(identifier)
-        
-        # Calculate percentages
-        for identifier, data in participant_attendance.items():
-            attended = data['meetings_attended']
-            total = data['total_meetings']
-            data['attendance_percentage'] = round((attended / total * 100) if total > 0 else 0, 2)
-        
-        return dict(participant_attendance)
-    
+        return self._get_aggregates().individual_stats()
+
     def calculate_team_attendance(self) -> dict:
         """
         Calculates overall team attendance statistics.
-        
+
         Returns:
             Dictionary with team-level metrics:
             {
@@ -84,46 +261,168 @@ class AttendanceCalculator:
                 'average_participants_per_meeting': float
             }
         """
-        individual_stats = self.calculate_individual_attendance()
-        
-        total_meetings = self._count_real_meetings()
-        total_unique_participants = len(individual_stats)
-        
-        # Calculate average attendance percentage
-        if individual_stats:
-            avg_attendance = sum(
-                data['attendance_percentage'] for data in individual_stats.values()
-            ) / len(individual_stats)
-        else:
-            avg_attendance = 0
-        
-        # Calculate average participants per meeting (only count meetings with 2+ participants)
-        total_participant_count = sum(
-            len(meeting.get_unique_participants()) for meeting in self.meetings
-            if len(meeting.get_unique_participants()) >= 2
+        return self._get_aggregates().team_stats()
+
+    def partial_aggregate(self, source: str = None) -> AttendancePartial:
+        """
+        Returns the mergeable partial aggregate for these meetings.
+
+        Args:
+            source: Optional name (e.g. the input file) recorded in the partial
+        """
+        partial = copy.deepcopy(self._get_aggregates())
+        if source is not None:
+            partial.sources = [source]
+        return partial
+
+    def _get_aggregates(self) -> AttendancePartial:
+        """Returns cached aggregates, recomputing them if the meetings changed (see the class docstring)."""
+        fingerprint = self._meetings_fingerprint()
+        if self._aggregates is None or not self._same_fingerprint(fingerprint):
+            self._aggregates = self._compute_aggregates()
+            self._fingerprint = fingerprint
+        return self._aggregates
+
+    def _meetings_fingerprint(self) -> list:
+        """
+        Returns one entry per meeting, in O(meetings). The objects themselves are
+        kept (not their id()), so a new object can never match a freed one.
+        """
+        return [(meeting, meeting.participants, len(meeting.participants), meeting.start_time, meeting.end_time)
+                for meeting in self._meetings]
+
+    def _same_fingerprint(self, fingerprint: list) -> bool:
+        cached = self._fingerprint
+        if cached is None or len(cached) != len(fingerprint):
+            return False
+        return all(
+            meeting is cached_meeting and participants is cached_participants and count == cached_count
+            and start == cached_start and end == cached_end
+            for (meeting, participants, count, start, end),
+                (cached_meeting, cached_participants, cached_count, cached_start, cached_end)
+            in zip(fingerprint, cached)
         )
-        avg_participants = total_participant_count / total_meetings if total_meetings > 0 else 0
-        
-        return {
-            'total_meetings': total_meetings,
-            'total_unique_participants': total_unique_participants,
-            'average_attendance_percentage': round(avg_attendance, 2),
-            'average_participants_per_meeting': round(avg_participants, 2)
-        }
-    
+
+    def _compute_aggregates(self) -> AttendancePartial:
+        """
+        Computes all meeting and participant aggregates in one pass.
+
+        Participants are resolved to integer identity IDs (None for bots) once
+        per row, and each meeting's unique real participants are determined once.
+        """
+        self.pass_count += 1
+        resolver = self.identity_resolver
+        threshold = self.presence_threshold
+        total_meetings = 0
+        total_participant_count = 0
+        total_meeting_seconds = 0
+        participant_attendance = {}
+        period_start = None
+        period_end = None
+
+        for meeting in self._meetings:
+            # Get unique participants in this meeting (excluding bots)
+            identity_ids = [resolver.resolve(participant) for participant in meeting.participants]
+            unique_participants = set(identity_ids)
+            unique_participants.discard(None)
+
+            # Only count this meeting if it has at least 2 real participants
+            if len(unique_participants) < 2:
+                continue
+            total_meetings += 1
+            total_participant_count += len(unique_participants)
+            if period_start is None or meeting.start_time < period_start:
+                period_start = meeting.start_time
+            if period_end is None or meeting.start_time > period_end:
+                period_end = meeting.start_time
+
+            if threshold is not None:
+                total_meeting_seconds += self._add_time_weighted(
+                    meeting, identity_ids, participant_attendance, threshold
+                )
+                continue
+
+            for participant, identity_id in zip(meeting.participants, identity_ids):
+                # Skip bot participants
+                if identity_id is None:
+                    continue
+
+                # Update attendance record
+                record = participant_attendance.get(identity_id)
+                if record is None:
+                    record = participant_attendance[identity_id] = {
+                        'name': participant.name,
+                        'email': participant.email,
+                        'meetings_attended': 0,
+                    }
+
+                # Only count once per meeting (in case participant appears multiple times)
+                if identity_id in unique_participants:
+                    record['meetings_attended'] += 1
+                    # Remove from set so we don't count again
+                    unique_participants.remove(identity_id)
+
+        return AttendancePartial(
+            total_meetings=total_meetings,
+            total_participant_count=total_participant_count,
+            participants={
+                resolver.identifier(identity_id): data
+                for identity_id, data in participant_attendance.items()
+            },
+            period_start=period_start.date().isoformat() if period_start else None,
+            period_end=period_end.date().isoformat() if period_end else None,
+            presence_threshold=threshold,
+            total_meeting_seconds=total_meeting_seconds,
+        )
+
+    @staticmethod
+    def _add_time_weighted(meeting: Meeting, identity_ids: List[Optional[int]],
+                           participant_attendance: Dict[int, dict], threshold: float) -> int:
+        """
+        Adds one meeting's time-weighted attendance to the records.
+
+        Each person's sessions are merged with a sort-and-sweep interval union
+        clipped to the meeting, so overlapping rejoins are counted once.
+
+        Returns:
+            The meeting's length in seconds
+        """
+        second = timedelta(seconds=1)
+        meeting_start = (meeting.start_time - EPOCH) // second
+        meeting_end = (meeting.end_time - EPOCH) // second
+        meeting_seconds = max(meeting_end - meeting_start, 0)
+
+        intervals = {}
+        for participant, identity_id in zip(meeting.participants, identity_ids):
+            # Skip bot participants
+            if identity_id is None:
+                continue
+            if identity_id not in participant_attendance:
+                participant_attendance[identity_id] = {
+                    'name': participant.name,
+                    'email': participant.email,
+                    'meetings_attended': 0,
+                    'covered_seconds': 0,
+                }
+            intervals.setdefault(identity_id, []).append(
+                ((participant.join_time - EPOCH) // second, (participant.leave_time - EPOCH) // second)
+            )
+
+        for identity_id, sessions in intervals.items():
+            covered = covered_seconds(sessions, meeting_start, meeting_end)
+            record = participant_attendance[identity_id]
+            record['covered_seconds'] += covered
+            # A zero-length meeting is attended by anyone who shows up
+            if meeting_seconds == 0 or covered >= threshold * meeting_seconds:
+                record['meetings_attended'] += 1
+        return meeting_seconds
+
     def _count_real_meetings(self) -> int:
         """
         Counts meetings that have at least 2 real participants (not just bots).
         """
-        count = 0
-        for meeting in self.meetings:
-            unique_participants = meeting.get_unique_participants()
-            if len(unique_participants) >= 2:
-                count += 1
-        return count
-    
+        return self._get_aggregates().total_meetings
+
     def _is_bot(self, identifier: str) -> bool:
         """Checks if an identifier belongs to a bot."""
-        identifier_lower = identifier.lower()
-        return 'textalize' in identifier_lower or 'bot@' in identifier_lower
-
+        return self.identity_resolver.is_bot(identifier)
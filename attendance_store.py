@@ -0,0 +1,451 @@
+"""
+Indexed SQLite store of parsed Zoom exports for historical attendance queries.
+
+Usage:
+    python attendance_store.py attendance.db load sample-input/*.csv
+    python attendance_store.py attendance.db report --start 2025-06-01 --end 2025-06-30
+    python attendance_store.py attendance.db trend person@example.com
+    python attendance_store.py attendance.db missed person@example.com --start 2025-06-01
+"""
+import os
+import sqlite3
+import argparse
+from datetime import date, datetime, timedelta
+from typing import List, Tuple, Union
+from csv_reader import ZoomCSVReader
+from models import EPOCH, Meeting, Participant, to_epoch_seconds, from_epoch_seconds
+from attendance_calculator import AttendancePartial
+from identity import IdentityResolver
+from manifest import hash_file
+from meeting_index import normalize_meeting_id
+
+
+# Bump when the schema changes; older databases are rejected rather than migrated,
+# except version 1, whose meeting IDs are normalized in place
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    loaded_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS identities (
+    identity_id INTEGER PRIMARY KEY,
+    identifier TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS meetings (
+    meeting_pk INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(file_id),
+    meeting_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    host_name TEXT NOT NULL,
+    host_email TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER NOT NULL,
+    total_participants INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    -- The meeting's sessions are session_pk first_session_pk..last_session_pk
+    first_session_pk INTEGER NOT NULL,
+    last_session_pk INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_pk INTEGER PRIMARY KEY,
+    meeting_pk INTEGER NOT NULL REFERENCES meetings(meeting_pk),
+    identity_id INTEGER NOT NULL REFERENCES identities(identity_id),
+    name TEXT NOT NULL,
+    email TEXT,
+    join_time INTEGER NOT NULL,
+    leave_time INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    is_guest INTEGER NOT NULL,
+    is_host INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS meetings_by_file ON meetings(file_id);
+CREATE INDEX IF NOT EXISTS meetings_by_instance ON meetings(meeting_id, start_time);
+CREATE INDEX IF NOT EXISTS meetings_by_start_time ON meetings(start_time);
+CREATE INDEX IF NOT EXISTS sessions_by_identity ON sessions(identity_id, meeting_pk);
+"""
+
+# A meeting instance (meeting ID + start time) also stored from an earlier-loaded
+# export, e.g. one with an overlapping date range; such copies are not counted again
+_DUPLICATE_SQL = """
+EXISTS (
+    SELECT 1 FROM meetings AS earlier
+    WHERE earlier.meeting_id = meetings.meeting_id AND earlier.start_time = meetings.start_time
+        AND earlier.file_id != meetings.file_id AND earlier.meeting_pk < meetings.meeting_pk
+)
+"""
+
+# Distinct real (non-bot) attendees of each selected meeting, and the meetings
+# that count (2+ real attendees). Parameters: start, end (epoch seconds, end exclusive).
+_REAL_MEETINGS_SQL = """
+WITH selected AS (
+    SELECT meeting_pk, start_time, first_session_pk, last_session_pk
+    FROM meetings WHERE start_time >= ? AND start_time < ? AND NOT """ + _DUPLICATE_SQL + """
+),
+pairs AS (
+    SELECT DISTINCT sessions.meeting_pk, sessions.identity_id
+    FROM selected JOIN sessions
+        ON sessions.session_pk BETWEEN selected.first_session_pk AND selected.last_session_pk
+    WHERE sessions.identity_id NOT IN (SELECT identity_id FROM temp.bot_identities)
+),
+real_meetings AS (
+    SELECT selected.*, COUNT(*) AS attendee_count
+    FROM pairs JOIN selected ON selected.meeting_pk = pairs.meeting_pk
+    GROUP BY pairs.meeting_pk HAVING COUNT(*) >= 2
+)
+"""
+
+DateBound = Union[date, datetime, str, None]
+
+_ONE_SECOND = timedelta(seconds=1)
+
+
+def _to_epoch_bound(value: DateBound, end: bool) -> int:
+    """
+    Converts an optional date range bound into epoch seconds.
+
+    Dates (or 'YYYY-MM-DD' strings) cover the whole day, so an end date is
+    inclusive; datetimes are used as-is. Missing bounds are unbounded.
+    """
+    if value is None:
+        return 2 ** 62 if end else -2 ** 62
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value) if 'T' in value or ' ' in value else date.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day) + (timedelta(days=1) if end else timedelta())
+    return to_epoch_seconds(value)
+
+
+class AttendanceStore:
+    """
+    SQLite store of meetings and participant sessions from Zoom exports.
+
+    Each loaded file is recorded with its content hash: loading the same file
+    again is a no-op, and loading a changed file replaces its meetings (or
+    just drops them, if another loaded file has the new contents). Meeting
+    IDs are stored normalized like MeetingIndex keys them.
+    Sessions are indexed by identity and meeting, and meetings by meeting ID
+    and start time, so statistics for any date range are computed by SQL
+    straight from the indexes instead of re-reading CSV files.
+
+    Query results follow load order (file order, then row order), so
+    attendance() for a range equals AttendanceCalculator over the same
+    meetings as returned by meetings(). A meeting instance (meeting ID and
+    start time) found in several exports with overlapping date ranges is
+    counted once, from the export loaded first.
+    """
+
+    def __init__(self, db_path: str, identity_resolver: IdentityResolver = None):
+        self.db_path = db_path
+        self.identity_resolver = identity_resolver or IdentityResolver()
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, 1, SCHEMA_VERSION):
+            raise ValueError(f"{db_path} uses attendance store schema {version}, expected {SCHEMA_VERSION}")
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            if version == 1:
+                # Version 1 stored meeting IDs as exported; --dedup compares them normalized
+                self.connection.create_function('normalize_meeting_id', 1, normalize_meeting_id, deterministic=True)
+                self.connection.execute('UPDATE meetings SET meeting_id = normalize_meeting_id(meeting_id)')
+            self.connection.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+        self._identity_ids = dict(self.connection.execute('SELECT identifier, identity_id FROM identities'))
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def load_file(self, file_path: str, cache=None, workers: int = 1) -> int:
+        """
+        Loads one export into the store, unless the same contents are already loaded.
+
+        Args:
+            file_path: Path to the Zoom export CSV file
+            cache: Optional MeetingCache passed on to ZoomCSVReader
+            workers: Parse processes passed on to ZoomCSVReader
+
+        Returns:
+            Number of participant sessions inserted (0 if the file was already loaded)
+        """
+        path = os.path.abspath(file_path)
+        content_hash = hash_file(file_path)
+        existing = self.connection.execute(
+            'SELECT file_id, path, content_hash FROM files WHERE path = ? OR content_hash = ?', (path, content_hash)
+        ).fetchall()
+        # This path's earlier, different contents are replaced in any case
+        stale_ids = [file_id for file_id, existing_path, existing_hash in existing
+                     if existing_path == path and existing_hash != content_hash]
+        # Same contents already loaded, from this path or another copy of the export
+        if any(existing_hash == content_hash for _, _, existing_hash in existing):
+            with self.connection:
+                for file_id in stale_ids:
+                    self._delete_file(file_id)
+            return 0
+
+        meetings = ZoomCSVReader(file_path, cache=cache, workers=workers).read_meetings()
+        with self.connection:
+            for file_id in stale_ids:
+                self._delete_file(file_id)
+            file_id = self.connection.execute(
+                'INSERT INTO files (path, content_hash, loaded_at) VALUES (?, ?, ?)',
+                (path, content_hash, to_epoch_seconds(datetime.now()))
+            ).lastrowid
+            return self._insert_meetings(file_id, meetings)
+
+    def _delete_file(self, file_id: int):
+        """Removes a file's meetings and sessions (within the caller's transaction)."""
+        self.connection.execute(
+            'DELETE FROM sessions WHERE session_pk BETWEEN '
+            '(SELECT MIN(first_session_pk) FROM meetings WHERE file_id = ?) AND '
+            '(SELECT MAX(last_session_pk) FROM meetings WHERE file_id = ?)',
+            (file_id, file_id)
+        )
+        self.connection.execute('DELETE FROM meetings WHERE file_id = ?', (file_id,))
+        self.connection.execute('DELETE FROM files WHERE file_id = ?', (file_id,))
+
+    def _insert_meetings(self, file_id: int, meetings: List[Meeting]) -> int:
+        """
+        Bulk-inserts meetings and their sessions with executemany (within the caller's transaction).
+
+        Sessions get consecutive keys in file order, and each meeting records its
+        range of session keys, so a meeting's sessions are found by a rowid range
+        scan and sessions need no meeting index (like MeetingTable's offsets).
+        """
+        cursor = self.connection.cursor()
+        next_meeting_pk = cursor.execute('SELECT COALESCE(MAX(meeting_pk), 0) + 1 FROM meetings').fetchone()[0]
+        first_session_pk = cursor.execute('SELECT COALESCE(MAX(session_pk), 0) + 1 FROM sessions').fetchone()[0]
+        identity_ids = self._identity_ids
+        # Zoom timestamps are whole seconds, so this equals to_epoch_seconds() without the call overhead
+        epoch, second = EPOCH, _ONE_SECOND
+        new_identities = []
+        meeting_rows = []
+        session_rows = []
+
+        for meeting_pk, meeting in enumerate(meetings, start=next_meeting_pk):
+            session_pk = first_session_pk + len(session_rows)
+            meeting_rows.append((
+                meeting_pk, file_id, normalize_meeting_id(meeting.meeting_id), meeting.topic, meeting.host_name,
+                meeting.host_email, to_epoch_seconds(meeting.start_time), to_epoch_seconds(meeting.end_time),
+                meeting.total_participants, meeting.duration_minutes,
+                session_pk, session_pk + len(meeting.participants) - 1
+            ))
+            for participant in meeting.participants:
+                identifier = participant.email if participant.email else participant.name
+                identity_id = identity_ids.get(identifier)
+                if identity_id is None:
+                    identity_id = identity_ids[identifier] = len(identity_ids) + 1
+                    new_identities.append((identity_id, identifier))
+                session_rows.append((
+                    len(session_rows) + first_session_pk, meeting_pk, identity_id, participant.name, participant.email,
+                    (participant.join_time - epoch) // second, (participant.leave_time - epoch) // second,
+                    participant.duration_minutes, participant.is_guest, participant.is_host
+                ))
+
+        try:
+            cursor.executemany('INSERT INTO identities (identity_id, identifier) VALUES (?, ?)', new_identities)
+            cursor.executemany('INSERT INTO meetings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', meeting_rows)
+            cursor.executemany('INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', session_rows)
+        except Exception:
+            # The transaction is rolled back, so forget the identities it would have added
+            for _, identifier in new_identities:
+                del identity_ids[identifier]
+            raise
+        return len(session_rows)
+
+    def meetings(self, start: DateBound = None, end: DateBound = None) -> List[Meeting]:
+        """
+        Returns the stored meetings starting within [start, end], in load order.
+        A meeting stored from several exports is returned once, from the first loaded.
+        """
+        bounds = (_to_epoch_bound(start, end=False), _to_epoch_bound(end, end=True))
+        meetings = []
+        by_pk = {}
+        for row in self.connection.execute(
+            'SELECT meeting_pk, topic, meeting_id, host_name, host_email, start_time, end_time, '
+            'total_participants, duration_minutes FROM meetings '
+            'WHERE start_time >= ? AND start_time < ? AND NOT ' + _DUPLICATE_SQL + 'ORDER BY meeting_pk', bounds
+        ):
+            meeting = Meeting(
+                topic=row[1], meeting_id=row[2], host_name=row[3], host_email=row[4],
+                start_time=from_epoch_seconds(row[5]), end_time=from_epoch_seconds(row[6]),
+                total_participants=row[7], duration_minutes=row[8], participants=[]
+            )
+            by_pk[row[0]] = meeting
+            meetings.append(meeting)
+        for row in self.connection.execute(
+            'SELECT sessions.meeting_pk, name, email, join_time, leave_time, sessions.duration_minutes, '
+            'is_guest, is_host FROM meetings JOIN sessions '
+            'ON sessions.session_pk BETWEEN meetings.first_session_pk AND meetings.last_session_pk '
+            'WHERE start_time >= ? AND start_time < ? AND NOT ' + _DUPLICATE_SQL + 'ORDER BY session_pk', bounds
+        ):
+            by_pk[row[0]].participants.append(Participant(
+                name=row[1], email=row[2], join_time=from_epoch_seconds(row[3]),
+                leave_time=from_epoch_seconds(row[4]), duration_minutes=row[5],
+                is_guest=bool(row[6]), is_host=bool(row[7])
+            ))
+        return meetings
+
+    def partial_aggregate(self, start: DateBound = None, end: DateBound = None) -> AttendancePartial:
+        """Builds the attendance partial aggregate for meetings starting within [start, end] in SQL."""
+        bounds = (_to_epoch_bound(start, end=False), _to_epoch_bound(end, end=True))
+        self._refresh_bot_identities()
+
+        total_meetings, total_participant_count, first_start, last_start = self.connection.execute(
+            _REAL_MEETINGS_SQL + 'SELECT COUNT(*), COALESCE(SUM(attendee_count), 0), '
+                                 'MIN(start_time), MAX(start_time) FROM real_meetings', bounds
+        ).fetchone()
+
+        # SQLite takes bare columns (name, email) from the row holding MIN(session_pk),
+        # i.e. each identity's first appearance in a counted meeting
+        participants = {}
+        for identifier, name, email, attended in self.connection.execute(
+            _REAL_MEETINGS_SQL + """
+            , attended AS (
+                SELECT pairs.identity_id, COUNT(*) AS meetings_attended
+                FROM pairs JOIN real_meetings ON real_meetings.meeting_pk = pairs.meeting_pk
+                GROUP BY pairs.identity_id
+            ),
+            first_sessions AS (
+                SELECT sessions.identity_id, MIN(sessions.session_pk) AS first_pk, sessions.name, sessions.email
+                FROM real_meetings JOIN sessions
+                    ON sessions.session_pk BETWEEN real_meetings.first_session_pk AND real_meetings.last_session_pk
+                WHERE sessions.identity_id NOT IN (SELECT identity_id FROM temp.bot_identities)
+                GROUP BY sessions.identity_id
+            )
+            SELECT identities.identifier, first_sessions.name, first_sessions.email, attended.meetings_attended
+            FROM first_sessions
+            JOIN attended ON attended.identity_id = first_sessions.identity_id
+            JOIN identities ON identities.identity_id = first_sessions.identity_id
+            ORDER BY first_sessions.first_pk
+            """, bounds
+        ):
+            participants[identifier] = {'name': name, 'email': email, 'meetings_attended': attended}
+
+        return AttendancePartial(
+            total_meetings=total_meetings,
+            total_participant_count=total_participant_count,
+            participants=participants,
+            period_start=from_epoch_seconds(first_start).date().isoformat() if first_start is not None else None,
+            period_end=from_epoch_seconds(last_start).date().isoformat() if last_start is not None else None,
+        )
+
+    def attendance(self, start: DateBound = None, end: DateBound = None) -> Tuple[dict, dict]:
+        """
+        Returns (individual_stats, team_stats) for meetings starting within [start, end],
+        in the same format as AttendanceCalculator.
+        """
+        partial = self.partial_aggregate(start, end)
+        individual_stats = partial.individual_stats()
+        return individual_stats, partial.team_stats(individual_stats)
+
+    def attendance_trend(self, identifier: str, start: DateBound = None, end: DateBound = None) -> List[dict]:
+        """
+        Returns one row per calendar month: the counted meetings and how many of
+        them the identity (email, or name when there is no email) attended.
+        """
+        bounds = (_to_epoch_bound(start, end=False), _to_epoch_bound(end, end=True))
+        self._refresh_bot_identities()
+        rows = self.connection.execute(
+            _REAL_MEETINGS_SQL + """
+            SELECT strftime('%Y-%m', real_meetings.start_time, 'unixepoch') AS month,
+                   COUNT(*),
+                   COUNT(pairs.identity_id)
+            FROM real_meetings
+            LEFT JOIN pairs ON pairs.meeting_pk = real_meetings.meeting_pk
+                AND pairs.identity_id = (SELECT identity_id FROM identities WHERE identifier = ?)
+            GROUP BY month ORDER BY month
+            """, bounds + (identifier,)
+        )
+        return [
+            {
+                'month': month,
+                'meetings_attended': attended,
+                'total_meetings': total,
+                'attendance_percentage': round(attended / total * 100, 2),
+            }
+            for month, total, attended in rows
+        ]
+
+    def missed_meetings(self, identifier: str, start: DateBound = None, end: DateBound = None) -> List[dict]:
+        """Returns the counted meetings within [start, end] that the identity did not attend."""
+        bounds = (_to_epoch_bound(start, end=False), _to_epoch_bound(end, end=True))
+        self._refresh_bot_identities()
+        rows = self.connection.execute(
+            _REAL_MEETINGS_SQL + """
+            SELECT meetings.meeting_id, meetings.topic, meetings.start_time
+            FROM real_meetings JOIN meetings ON meetings.meeting_pk = real_meetings.meeting_pk
+            WHERE NOT EXISTS (
+                SELECT 1 FROM pairs
+                WHERE pairs.meeting_pk = real_meetings.meeting_pk
+                  AND pairs.identity_id = (SELECT identity_id FROM identities WHERE identifier = ?)
+            )
+            ORDER BY meetings.start_time, meetings.meeting_pk
+            """, bounds + (identifier,)
+        )
+        return [
+            {'meeting_id': meeting_id, 'topic': topic, 'start_time': from_epoch_seconds(start_time)}
+            for meeting_id, topic, start_time in rows
+        ]
+
+    def _refresh_bot_identities(self):
+        """Fills temp.bot_identities with the stored identities the resolver classifies as bots."""
+        self.connection.execute('CREATE TEMP TABLE IF NOT EXISTS bot_identities (identity_id INTEGER PRIMARY KEY)')
+        self.connection.execute('DELETE FROM temp.bot_identities')
+        self.connection.executemany(
+            'INSERT INTO temp.bot_identities VALUES (?)',
+            ((identity_id,) for identifier, identity_id in self._identity_ids.items()
+             if self.identity_resolver.is_bot(identifier))
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Zoom attendance SQLite store')
+    parser.add_argument('database', help='Path of the SQLite database')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    load_parser = subparsers.add_parser('load', help='load Zoom export CSV files (idempotent)')
+    load_parser.add_argument('files', nargs='+')
+
+    for name, help_text in (('report', 'individual and team attendance for a date range'),
+                            ('trend', "one person's attendance per month"),
+                            ('missed', 'counted meetings one person did not attend')):
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name != 'report':
+            command_parser.add_argument('identifier', help='Email, or name when there is no email')
+        command_parser.add_argument('--start', help='First day (YYYY-MM-DD)')
+        command_parser.add_argument('--end', help='Last day, inclusive (YYYY-MM-DD)')
+
+    args = parser.parse_args()
+    with AttendanceStore(args.database) as store:
+        if args.command == 'load':
+            for file_path in args.files:
+                inserted = store.load_file(file_path)
+                print(f"{file_path}: {f'{inserted} sessions loaded' if inserted else 'already loaded'}")
+        elif args.command == 'report':
+            individual_stats, team_stats = store.attendance(args.start, args.end)
+            for stats in sorted(individual_stats.values(), key=lambda stats: stats['attendance_percentage'],
+                                reverse=True):
+                print(f"{stats['name']:<30} {stats['meetings_attended']:>5}/{stats['total_meetings']:<5} "
+                      f"{stats['attendance_percentage']:>6}%")
+            print(team_stats)
+        elif args.command == 'trend':
+            for row in store.attendance_trend(args.identifier, args.start, args.end):
+                print(f"{row['month']}  {row['meetings_attended']:>5}/{row['total_meetings']:<5} "
+                      f"{row['attendance_percentage']:>6}%")
+        else:
+            for meeting in store.missed_meetings(args.identifier, args.start, args.end):
+                print(f"{meeting['start_time']}  {meeting['meeting_id']}  {meeting['topic']}")
+
+
+if __name__ == "__main__":
+    main()
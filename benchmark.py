@@ -0,0 +1,697 @@
+"""
+Benchmarks for the Zoom attendance pipeline on large synthetic exports.
+
+Usage:
+    python benchmark.py reader --meetings 2000 --participants 50
+"""
+import argparse
+import contextlib
+import csv
+import io
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from csv_reader import ZoomCSVReader
+from attendance_calculator import AttendanceCalculator, AttendancePartial
+from timestamp_parser import ZOOM_DATETIME_FORMAT, parse_zoom_datetime, parse_zoom_datetimes
+from synthetic_export import generate_export
+
+
+def legacy_read_meetings(file_path: str) -> list:
+    """The original readlines()/per-line DictReader parser, kept for comparison."""
+    reader = ZoomCSVReader(file_path)
+    meetings = []
+    current_meeting_rows = []
+    with open(file_path, 'r', encoding='utf-8-sig') as file:
+        lines = file.readlines()
+    header = csv.DictReader(lines).fieldnames
+    for line in lines[1:]:
+        if line.strip() == '':
+            if current_meeting_rows:
+                meetings.append(reader._parse_meeting(current_meeting_rows))
+                current_meeting_rows = []
+        else:
+            current_meeting_rows.extend(csv.DictReader([','.join(header)] + [line]))
+    if current_meeting_rows:
+        meetings.append(reader._parse_meeting(current_meeting_rows))
+    return meetings
+
+
+def measure(label: str, func):
+    """
+    Runs func twice: once for wall time, once under tracemalloc for peak memory.
+    tracemalloc slows allocation-heavy code considerably, so the two are kept apart.
+    """
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} {elapsed:8.3f}s  peak {peak / 1024 / 1024:8.1f} MiB")
+    return result
+
+
+def bench_reader(args):
+    """Compares the legacy parser, read_meetings() and streaming iter_meetings()."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        print(f"Reader benchmark: {rows} rows, {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+
+        reader = ZoomCSVReader(path)
+        measure('legacy readlines()', lambda: len(legacy_read_meetings(path)))
+        measure('read_meetings()', lambda: len(reader.read_meetings()))
+        measure('iter_meetings() streaming', lambda: sum(1 for _ in reader.iter_meetings()))
+
+
+def bench_parallel_reader(args):
+    """Compares serial parsing with read_meetings_parallel and checks they match."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        print(f"Parallel reader benchmark: {rows} rows, "
+              f"{os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+
+        reader = ZoomCSVReader(path)
+        # Allow splitting the synthetic file even when it is small
+        reader.MIN_PARALLEL_CHUNK_BYTES = 256 * 1024
+        start = time.perf_counter()
+        serial = list(reader.iter_meetings())
+        baseline = time.perf_counter() - start
+        print(f"  serial       {baseline:8.3f}s")
+        for workers in args.workers:
+            start = time.perf_counter()
+            parallel = reader.read_meetings_parallel(workers)
+            elapsed = time.perf_counter() - start
+            assert parallel == serial, f'parallel output differs with {workers} workers'
+            print(f"  workers={workers:<3} {elapsed:8.3f}s  speedup {baseline / elapsed:4.2f}x")
+
+
+def bench_compressed(args):
+    """Compares reading a plain export with gzip/zip (and zstd, if installed) compressed copies."""
+    import gzip
+    import zipfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        generate_export(path, meetings=args.meetings, participants=args.participants, seed=0)
+        with open(path, 'rb') as file:
+            data = file.read()
+        print(f"Compressed input benchmark: {args.meetings} meetings, {len(data) / 1024 / 1024:.1f} MiB CSV")
+        variants = [('plain .csv', path)]
+        gzip_path = path + '.gz'
+        with open(gzip_path, 'wb') as file:
+            file.write(gzip.compress(data, compresslevel=6))
+        variants.append(('.csv.gz', gzip_path))
+        zip_path = os.path.join(tmp, 'meetinglistdetails_synthetic.zip')
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('meetinglistdetails_synthetic.csv', data)
+        variants.append(('.zip', zip_path))
+        try:
+            import zstandard
+            zstd_path = path + '.zst'
+            with open(zstd_path, 'wb') as file:
+                file.write(zstandard.ZstdCompressor(level=3).compress(data))
+            variants.append(('.csv.zst', zstd_path))
+        except ImportError:
+            print("  (zstandard not installed; skipping .csv.zst)")
+        expected = None
+        for label, variant_path in variants:
+            size = os.path.getsize(variant_path)
+            reader = ZoomCSVReader(variant_path)
+            meetings = measure(f"{label} ({size / 1024 / 1024:.1f} MiB, {len(data) / size:4.1f}x)",
+                               lambda: list(reader.iter_meetings()))
+            if expected is None:
+                expected = meetings
+            assert meetings == expected, f'{label} meetings differ from the plain CSV'
+        print("  parity: OK")
+
+
+def check_parity(expected_calculator, actual_calculator):
+    """Asserts that two calculators produce identical individual and team statistics."""
+    expected = expected_calculator.calculate_individual_attendance()
+    actual = actual_calculator.calculate_individual_attendance()
+    assert list(expected.items()) == list(actual.items()), 'individual statistics differ'
+    assert expected_calculator.calculate_team_attendance() == actual_calculator.calculate_team_attendance(), \
+        'team statistics differ'
+
+
+def bench_engine(args):
+    """Compares the Python AttendanceCalculator with the columnar engine and checks parity."""
+    from columnar_calculator import ColumnarAttendanceCalculator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        print(f"Engine benchmark: {rows} rows")
+
+        def python_engine():
+            calculator = AttendanceCalculator(ZoomCSVReader(path).read_meetings(),
+                                              presence_threshold=args.presence_threshold)
+            calculator.calculate_individual_attendance()
+            calculator.calculate_team_attendance()
+            return calculator
+
+        def columnar_engine():
+            calculator = ColumnarAttendanceCalculator.from_csv(path, presence_threshold=args.presence_threshold)
+            calculator.calculate_individual_attendance()
+            calculator.calculate_team_attendance()
+            return calculator
+
+        expected = measure('python (read + compute)', python_engine)
+        actual = measure('columnar (read + compute)', columnar_engine)
+        check_parity(expected, actual)
+        check_parity(expected, ColumnarAttendanceCalculator.from_meetings(
+            expected.meetings, presence_threshold=args.presence_threshold
+        ))
+        print("  parity: OK")
+
+
+def bench_cache(args):
+    """Compares parsing an export with loading it from the parsed-meeting cache."""
+    from meeting_cache import MeetingCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        cache = MeetingCache(os.path.join(tmp, 'cache'))
+        print(f"Cache benchmark: {rows} rows")
+
+        # Each miss run gets an empty cache directory so both measurements are misses
+        parsed = measure('parse (cache miss + store)', lambda: ZoomCSVReader(
+            path, cache=MeetingCache(tempfile.mkdtemp(dir=tmp))
+        ).read_meetings())
+        cache.put(path, parsed)
+        cached = measure('load from cache', lambda: ZoomCSVReader(path, cache=cache).read_meetings())
+        assert parsed == cached, 'cached meetings differ from parsed meetings'
+        cache_bytes = sum(entry.stat().st_size for entry in os.scandir(cache.cache_dir))
+        print(f"  cache size {cache_bytes / 1024 / 1024:.1f} MiB vs CSV {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+
+
+def bench_timestamps(args):
+    """
+    Micro-benchmark of strptime vs the fixed-width and vectorized timestamp parsers.
+    Their equivalence with strptime is covered by tests/test_timestamp_parser.py.
+    """
+    start = datetime(2025, 1, 6, 9, 0, 0)
+    values = [(start + timedelta(seconds=index * 37)).strftime(ZOOM_DATETIME_FORMAT) for index in range(args.count)]
+    print(f"Timestamp benchmark: {args.count} strings")
+
+    def timed(label, func):
+        begin = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - begin
+        print(f"  {label:<28} {elapsed:8.3f}s  {args.count / elapsed / 1e6:6.2f} M/s")
+
+    timed('datetime.strptime', lambda: [datetime.strptime(value, ZOOM_DATETIME_FORMAT) for value in values])
+    timed('parse_zoom_datetime', lambda: [parse_zoom_datetime(value) for value in values])
+    timed('parse_zoom_datetimes (batch)', lambda: parse_zoom_datetimes(values))
+
+
+def bench_memory(args):
+    """Reports retained bytes per participant for Meeting objects vs a MeetingTable."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        print(f"Memory benchmark: {rows} participant rows")
+
+        reader = ZoomCSVReader(path)
+        for label, load in (('list[Meeting] objects', reader.read_meetings),
+                            ('MeetingTable columns', reader.read_table)):
+            tracemalloc.start()
+            data = load()
+            retained, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {label:<28} {retained / 1024 / 1024:8.1f} MiB  {retained / rows:7.1f} bytes/participant")
+            del data
+
+
+def _synthetic_roster(people: int) -> dict:
+    """Builds individual attendance statistics for a roster of the given size."""
+    generator = random.Random(42)
+    total_meetings = 60
+    stats = {}
+    for index in range(people):
+        attended = generator.randint(0, total_meetings)
+        email = f'person{index}@example.com' if index % 4 else None
+        stats[email or f'Person {index}'] = {
+            'name': f'Person {index}',
+            'email': email,
+            'meetings_attended': attended,
+            'total_meetings': total_meetings,
+            'attendance_percentage': round(attended / total_meetings * 100, 2),
+        }
+    return stats
+
+
+def _write_xlsx_report(xlsx_writer: str, people: int, output_file: str):
+    """Runs in a fresh process so ru_maxrss reflects only this writer."""
+    from report_generator import ReportGenerator
+
+    individual_stats = _synthetic_roster(people)
+    team_stats = {
+        'total_meetings': 60, 'total_unique_participants': people,
+        'average_attendance_percentage': 50.0, 'average_participants_per_meeting': 12.5,
+    }
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ReportGenerator(output_file, xlsx_writer=xlsx_writer).generate_report(individual_stats, team_stats)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, baseline_rss, peak_rss
+
+
+def bench_xlsx(args):
+    """Compares write time and peak RSS of the pandas and streaming xlsx writers."""
+    print(f"XLSX benchmark: roster of {args.people} people")
+    with tempfile.TemporaryDirectory() as tmp:
+        for xlsx_writer in ('pandas', 'streaming'):
+            output_file = os.path.join(tmp, f'report_{xlsx_writer}.xlsx')
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                elapsed, baseline_rss, peak_rss = executor.submit(
+                    _write_xlsx_report, xlsx_writer, args.people, output_file
+                ).result()
+            # ru_maxrss is in KiB on Linux
+            print(f"  {xlsx_writer:<10} {elapsed:8.3f}s  peak RSS {peak_rss / 1024:7.1f} MiB "
+                  f"(+{(peak_rss - baseline_rss) / 1024:.1f} MiB while writing)")
+
+
+def bench_jobs(args):
+    """Measures multi-file throughput of main.process_csv_files for increasing worker counts."""
+    from main import process_csv_files
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_files = []
+        for index in range(args.files):
+            path = os.path.join(tmp, f'meetinglistdetails_synthetic_{index:03d}.csv')
+            rows = generate_export(path, meetings=args.meetings, participants=args.participants, seed=index)['rows']
+            csv_files.append(path)
+        print(f"Jobs benchmark: {args.files} files x ~{rows} rows")
+
+        baseline = None
+        for jobs in args.jobs:
+            output_dir = os.path.join(tmp, f'output_{jobs}')
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                success_count, failed_count, _ = process_csv_files(csv_files, jobs=jobs, output_base_dir=output_dir)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  jobs={jobs:<3} {elapsed:8.3f}s  {args.files / elapsed:6.2f} files/s  "
+                  f"speedup {baseline / elapsed:4.2f}x  ({success_count} ok, {failed_count} failed)")
+
+
+def bench_pipeline(args):
+    """Compares one-by-one processing of several files with the read/compute/write pipeline."""
+    from main import process_csv_files
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_files = []
+        for index in range(args.files):
+            path = os.path.join(tmp, f'meetinglistdetails_synthetic_{index:03d}.csv')
+            generate_export(path, meetings=args.meetings, participants=args.participants, seed=index,
+                            roster_size=args.roster_size)
+            csv_files.append(path)
+        print(f"Pipeline benchmark: {args.files} files x {args.meetings} meetings, formats {args.formats}")
+
+        formats = args.formats.split(',')
+        baseline = None
+        for depth in args.depth:
+            output_dir = os.path.join(tmp, f'output_{depth}')
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                success_count, failed_count, _ = process_csv_files(
+                    csv_files, output_base_dir=output_dir, pipeline_depth=depth, formats=formats
+                )
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            label = 'one by one' if depth == 0 else f'depth={depth}'
+            print(f"  {label:<12} {elapsed:8.3f}s  {args.files / elapsed:6.2f} files/s  "
+                  f"speedup {baseline / elapsed:4.2f}x  ({success_count} ok, {failed_count} failed)")
+
+
+def bench_rollup(args):
+    """Compares a from-scratch multi-month computation with merging stored per-file partials."""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_files = []
+        for month in range(args.months):
+            path = os.path.join(tmp, f'meetinglistdetails_synthetic_{month:02d}.csv')
+            # Later months gain people, so merges see both known and new identities
+            generate_export(path, meetings=args.meetings, participants=args.participants + month, seed=month,
+                            start=date(2025 + month // 12, month % 12 + 1, 1), days=28)
+            csv_files.append(path)
+        print(f"Rollup benchmark: {args.months} files x {args.meetings} meetings")
+
+        partial_files = []
+        for index, path in enumerate(csv_files):
+            partial_file = os.path.join(tmp, f'partial_{index:02d}.json')
+            AttendanceCalculator(ZoomCSVReader(path).read_meetings()).partial_aggregate(path).save(partial_file)
+            partial_files.append(partial_file)
+
+        def from_scratch():
+            meetings = []
+            for path in csv_files:
+                meetings.extend(ZoomCSVReader(path).read_meetings())
+            calculator = AttendanceCalculator(meetings)
+            return calculator.calculate_individual_attendance(), calculator.calculate_team_attendance()
+
+        def from_partials():
+            merged = AttendancePartial.merge_all(AttendancePartial.load(path) for path in partial_files)
+            individual_stats = merged.individual_stats()
+            return individual_stats, merged.team_stats(individual_stats)
+
+        expected_individual, expected_team = measure('re-parse all files', from_scratch)
+        actual_individual, actual_team = measure('merge stored partials', from_partials)
+        assert list(expected_individual.items()) == list(actual_individual.items()), 'individual statistics differ'
+        assert expected_team == actual_team, 'team statistics differ'
+        print("  parity: OK")
+
+
+def bench_store(args):
+    """Measures SQLite store ingest throughput and compares a date-range query with re-parsing."""
+    from attendance_store import AttendanceStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        meetings = ZoomCSVReader(path).read_meetings()
+        print(f"Store benchmark: {rows} rows")
+
+        with AttendanceStore(os.path.join(tmp, 'attendance.db')) as store:
+            start = time.perf_counter()
+            with store.connection:
+                file_id = store.connection.execute(
+                    "INSERT INTO files (path, content_hash, loaded_at) VALUES ('synthetic', '', 0)"
+                ).lastrowid
+                store._insert_meetings(file_id, meetings)
+            elapsed = time.perf_counter() - start
+            print(f"  {'bulk insert':<30} {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/s")
+
+            starts = sorted(meeting.start_time for meeting in meetings)
+            query_start, query_end = starts[len(starts) // 4], starts[3 * len(starts) // 4]
+
+            def from_store():
+                return store.attendance(query_start, query_end)
+
+            def from_csv():
+                selected = [meeting for meeting in ZoomCSVReader(path).read_meetings()
+                            if query_start <= meeting.start_time < query_end]
+                calculator = AttendanceCalculator(selected)
+                return calculator.calculate_individual_attendance(), calculator.calculate_team_attendance()
+
+            expected_individual, expected_team = measure('re-parse + compute range', from_csv)
+            actual_individual, actual_team = measure('store query for range', from_store)
+            assert list(expected_individual.items()) == list(actual_individual.items()), 'individual statistics differ'
+            assert expected_team == actual_team, 'team statistics differ'
+            print("  parity: OK")
+
+
+def bench_profile(args):
+    """Measures the overhead of per-stage instrumentation on process_csv_file."""
+    from main import process_csv_file
+    from instrumentation import Tracer, NULL_TRACER
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+        rows = generate_export(path, meetings=args.meetings, participants=args.participants)['rows']
+        print(f"Profile overhead benchmark: {rows} rows, best of {args.repeat}")
+
+        def best_time(tracer):
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    process_csv_file(path, os.path.join(tmp, 'output'), tracer=tracer)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            return best
+
+        untraced = best_time(NULL_TRACER)
+        tracer = Tracer(enabled=True)
+        traced = best_time(tracer)
+        print(f"  {'tracing off':<30} {untraced:8.3f}s")
+        print(f"  {'tracing on':<30} {traced:8.3f}s  ({(traced / untraced - 1) * 100:+.1f}%)")
+        print(tracer.summary_table())
+
+
+# Cold-start paths of main.py: (label, extra arguments, environment overrides)
+STARTUP_PATHS = [
+    ('csv only (stdlib)', ['--formats', 'csv'], {'ATTENDANCE_ENGINE': 'python'}),
+    ('csv + streaming xlsx', [], {'ATTENDANCE_ENGINE': 'python', 'XLSX_WRITER': 'streaming'}),
+    ('columnar + pandas xlsx', [], {'ATTENDANCE_ENGINE': 'columnar', 'XLSX_WRITER': 'pandas'}),
+]
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'dotenv', 'multiprocessing')
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Returns {module: (self_us, cumulative_us, depth)} from `python -X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def bench_startup(args):
+    """
+    Measures cold-start time of main.py for the stdlib CSV-only path and the
+    pandas paths, with `python -X importtime` for the per-module breakdown.
+    Exits with an error if the CSV-only path imports pandas or NumPy.
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    sample_input = os.path.join(os.path.dirname(script), 'sample-input')
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = os.path.join(tmp, 'input')
+        shutil.copytree(sample_input, input_dir)
+        print(f"Startup benchmark: main.py on {input_dir}, best of {args.repeat}")
+        for label, extra_args, overrides in STARTUP_PATHS:
+            env = dict(os.environ, INPUT_FOLDER_PATH=input_dir, **overrides)
+            command = [sys.executable, script, '--force'] + extra_args
+
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                subprocess.run(command, cwd=tmp, env=env, check=True, stdout=subprocess.DEVNULL)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+
+            profiled = subprocess.run([sys.executable, '-X', 'importtime'] + command[1:], cwd=tmp, env=env,
+                                      check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            modules = _parse_importtime(profiled.stderr)
+            import_ms = sum(self_us for self_us, _, _ in modules.values()) / 1000
+            heavy = [name for name in HEAVY_MODULES if name in modules]
+            print(f"  {label:<26} {best * 1000:8.1f} ms wall  {import_ms:7.1f} ms imports  "
+                  f"{len(modules):4d} modules  heavy: {', '.join(heavy) or '-'}")
+            top_level = sorted(((cumulative_us, name) for name, (_, cumulative_us, depth) in modules.items()
+                                if depth == 0), reverse=True)[:args.top]
+            for cumulative_us, name in top_level:
+                print(f"      {cumulative_us / 1000:7.1f} ms  {name}")
+            if extra_args == ['--formats', 'csv'] and {'pandas', 'numpy'} & set(modules):
+                failures.append(label)
+
+    if failures:
+        sys.exit(f"pandas/NumPy imported on the stdlib path: {', '.join(failures)}")
+
+
+def bench_scaling(args):
+    """
+    Times and memory-profiles the reader, calculator and report generator on
+    realistic synthetic exports of increasing size, and saves the results as
+    JSON so later runs can be compared against them.
+    """
+    import json
+    import platform
+    from report_generator import ReportGenerator
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for target_rows in args.rows:
+            target_rows = int(target_rows)
+            path = os.path.join(tmp, 'meetinglistdetails_synthetic.csv')
+            # About 0.9 rows per invited person once absences, bots and rejoins are mixed in
+            meetings = max(1, round(target_rows / (args.participants * 0.9)))
+            rows = generate_export(path, meetings=meetings, participants=args.participants, seed=args.seed)['rows']
+            profile_memory = rows <= args.memory_max_rows
+            print(f"\n{rows:,} rows ({meetings:,} meetings)")
+
+            meetings_list = None
+            calculator = None
+
+            def reader():
+                return ZoomCSVReader(path).read_meetings()
+
+            def compute():
+                result = AttendanceCalculator(meetings_list)
+                return result, result.calculate_individual_attendance(), result.calculate_team_attendance()
+
+            def report():
+                output_file = os.path.join(tmp, 'report', 'attendance_report.xlsx')
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    ReportGenerator(output_file).generate(calculator[1], calculator[2])
+
+            for stage, func in (('reader', reader), ('calculator', compute), ('report', report)):
+                start = time.perf_counter()
+                value = func()
+                elapsed = time.perf_counter() - start
+                peak_mib = None
+                if profile_memory:
+                    tracemalloc.start()
+                    func()
+                    peak_mib = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+                    tracemalloc.stop()
+                if stage == 'reader':
+                    meetings_list = value
+                elif stage == 'calculator':
+                    calculator = value
+                results.append({'rows': rows, 'stage': stage, 'seconds': round(elapsed, 6),
+                                'rows_per_second': round(rows / elapsed), 'peak_mib': peak_mib})
+                memory = f"peak {peak_mib:8.1f} MiB" if peak_mib is not None else 'peak   (skipped)'
+                print(f"  {stage:<12} {elapsed:9.3f}s  {rows / elapsed:12,.0f} rows/s  {memory}")
+            meetings_list = calculator = None
+
+    run = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'participants': args.participants,
+        'seed': args.seed,
+        'results': results,
+    }
+    output = args.output or os.path.join('benchmark-results', f"scaling_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(run, file, indent=2)
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = {(entry['stage'], entry['rows']): entry for entry in json.load(file)['results']}
+        print(f"\nCompared with {args.compare} (time ratio, > 1.00 is slower):")
+        for entry in results:
+            previous = baseline.get((entry['stage'], entry['rows']))
+            if previous is None:
+                continue
+            ratio = entry['seconds'] / previous['seconds']
+            flag = '  <-- regression' if ratio > 1 + args.tolerance else ''
+            print(f"  {entry['stage']:<12} {entry['rows']:>12,} rows  {ratio:6.2f}x{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Zoom attendance pipeline benchmarks')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    reader_parser = subparsers.add_parser('reader', help='CSV parsing throughput and memory')
+    reader_parser.add_argument('--meetings', type=int, default=2000)
+    reader_parser.add_argument('--participants', type=int, default=50)
+    reader_parser.set_defaults(func=bench_reader)
+
+    parallel_parser = subparsers.add_parser('parallel-reader', help='single-file parallel parsing')
+    parallel_parser.add_argument('--meetings', type=int, default=2000)
+    parallel_parser.add_argument('--participants', type=int, default=50)
+    parallel_parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8])
+    parallel_parser.set_defaults(func=bench_parallel_reader)
+
+    engine_parser = subparsers.add_parser('engine', help='Python vs columnar attendance engine')
+    engine_parser.add_argument('--meetings', type=int, default=2000)
+    engine_parser.add_argument('--participants', type=int, default=50)
+    engine_parser.add_argument('--presence-threshold', type=float,
+                               help='compare time-weighted attendance (interval union) instead')
+    engine_parser.set_defaults(func=bench_engine)
+
+    compressed_parser = subparsers.add_parser('compressed', help='plain vs gzip/zip/zstd compressed input')
+    compressed_parser.add_argument('--meetings', type=int, default=1000)
+    compressed_parser.add_argument('--participants', type=int, default=40)
+    compressed_parser.set_defaults(func=bench_compressed)
+
+    cache_parser = subparsers.add_parser('cache', help='parsing vs loading from the meeting cache')
+    cache_parser.add_argument('--meetings', type=int, default=2000)
+    cache_parser.add_argument('--participants', type=int, default=50)
+    cache_parser.set_defaults(func=bench_cache)
+
+    timestamps_parser = subparsers.add_parser('timestamps', help='timestamp parser speed')
+    timestamps_parser.add_argument('--count', type=int, default=500000)
+    timestamps_parser.set_defaults(func=bench_timestamps)
+
+    memory_parser = subparsers.add_parser('memory', help='bytes per participant by representation')
+    memory_parser.add_argument('--meetings', type=int, default=2000)
+    memory_parser.add_argument('--participants', type=int, default=50)
+    memory_parser.set_defaults(func=bench_memory)
+
+    xlsx_parser = subparsers.add_parser('xlsx', help='xlsx writer time and peak RSS')
+    xlsx_parser.add_argument('--people', type=int, default=50000)
+    xlsx_parser.set_defaults(func=bench_xlsx)
+
+    jobs_parser = subparsers.add_parser('jobs', help='multi-file throughput by worker count')
+    jobs_parser.add_argument('--files', type=int, default=8)
+    jobs_parser.add_argument('--meetings', type=int, default=200)
+    jobs_parser.add_argument('--participants', type=int, default=50)
+    jobs_parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, 8])
+    jobs_parser.set_defaults(func=bench_jobs)
+
+    pipeline_parser = subparsers.add_parser('pipeline', help='one-by-one vs pipelined processing of several files')
+    pipeline_parser.add_argument('--files', type=int, default=6)
+    pipeline_parser.add_argument('--meetings', type=int, default=300)
+    pipeline_parser.add_argument('--participants', type=int, default=30)
+    pipeline_parser.add_argument('--roster-size', type=int, default=5000,
+                                 help='distinct people per export (large rosters make the xlsx write heavier)')
+    pipeline_parser.add_argument('--formats', default='xlsx,csv')
+    pipeline_parser.add_argument('--depth', type=int, nargs='+', default=[0, 1, 2, 4])
+    pipeline_parser.set_defaults(func=bench_pipeline)
+
+    rollup_parser = subparsers.add_parser('rollup', help='multi-month rollup from partials vs re-parsing')
+    rollup_parser.add_argument('--months', type=int, default=12)
+    rollup_parser.add_argument('--meetings', type=int, default=200)
+    rollup_parser.add_argument('--participants', type=int, default=50)
+    rollup_parser.set_defaults(func=bench_rollup)
+
+    store_parser = subparsers.add_parser('store', help='SQLite store ingest rate and range queries')
+    store_parser.add_argument('--meetings', type=int, default=2000)
+    store_parser.add_argument('--participants', type=int, default=50)
+    store_parser.set_defaults(func=bench_store)
+
+    profile_parser = subparsers.add_parser('profile', help='overhead of per-stage instrumentation')
+    profile_parser.add_argument('--meetings', type=int, default=500)
+    profile_parser.add_argument('--participants', type=int, default=50)
+    profile_parser.add_argument('--repeat', type=int, default=3)
+    profile_parser.set_defaults(func=bench_profile)
+
+    scaling_parser = subparsers.add_parser('scaling', help='reader/calculator/report scaling on synthetic exports')
+    scaling_parser.add_argument('--rows', type=float, nargs='+', default=[1e3, 1e4, 1e5, 1e6],
+                                help='approximate participant rows per export (e.g. 1e3 1e4 ... 1e7)')
+    scaling_parser.add_argument('--participants', type=int, default=50, help='people invited per meeting')
+    scaling_parser.add_argument('--seed', type=int, default=0)
+    scaling_parser.add_argument('--memory-max-rows', type=float, default=1e6,
+                                help='skip the (slow) tracemalloc run above this many rows')
+    scaling_parser.add_argument('--output', help='results file (default: benchmark-results/scaling_<time>.json)')
+    scaling_parser.add_argument('--compare', help='earlier results file to compare against')
+    scaling_parser.add_argument('--tolerance', type=float, default=0.10,
+                                help='slowdown flagged as a regression when comparing (default: 0.10)')
+    scaling_parser.set_defaults(func=bench_scaling)
+
+    startup_parser = subparsers.add_parser('startup', help='cold-start time and imports of main.py per path')
+    startup_parser.add_argument('--repeat', type=int, default=5)
+    startup_parser.add_argument('--top', type=int, default=5, help='slowest top-level imports to list per path')
+    startup_parser.set_defaults(func=bench_startup)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
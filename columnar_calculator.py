@@ -0,0 +1,338 @@
+"""
+Columnar attendance calculator backed by pandas/NumPy.
+
+Computes the same statistics as AttendanceCalculator, but on typed columns
+using factorize/group-by/unique counts instead of per-participant Python loops.
+"""
+from typing import List, Dict
+import numpy as np
+import pandas as pd
+from models import Meeting
+from timestamp_parser import parse_zoom_datetimes
+from identity import IdentityResolver
+from attendance_calculator import AttendancePartial
+from presence import covered_seconds_by_group
+from meeting_index import MeetingIndex, normalize_meeting_id
+from compressed_input import open_export
+
+
+# Zoom exports repeat 'Duration (minutes)'; pandas renames the participant-level one
+PARTICIPANT_DURATION_COLUMN = 'Duration (minutes).1'
+EXPORT_COLUMNS = ['Topic', 'ID', 'Start time', 'End time', 'Name (original name)', 'Email', 'Join time',
+                  'Leave time', PARTICIPANT_DURATION_COLUMN, 'Guest']
+
+
+class ColumnarAttendanceCalculator:
+    """
+    Calculates attendance statistics from a columnar participant table.
+
+    The table has one row per participant session with the columns:
+    meeting (int meeting key), identifier, name, email, join_time, leave_time,
+    duration_minutes, is_guest and is_host. Rows are in file order.
+    `meeting_starts` and `meeting_ends` optionally map meeting keys to start
+    and end times; starts give the period covered by partial_aggregate(), and
+    both are required for time-weighted attendance (presence_threshold), which
+    works like AttendanceCalculator's but merges intervals with NumPy.
+    `meeting_ids` (with `meeting_starts`) identifies meeting instances for
+    deduplicate().
+    """
+
+    def __init__(self, participants: pd.DataFrame, meeting_count: int = None,
+                 identity_resolver: IdentityResolver = None, meeting_starts: pd.Series = None,
+                 meeting_ends: pd.Series = None, presence_threshold: float = None,
+                 meeting_ids: pd.Series = None):
+        if presence_threshold is not None:
+            if not 0 <= presence_threshold <= 1:
+                raise ValueError(f"presence_threshold must be between 0 and 1, got {presence_threshold}")
+            if meeting_starts is None or meeting_ends is None:
+                raise ValueError("Time-weighted attendance needs meeting start and end times")
+        self.participants = participants
+        self.identity_resolver = identity_resolver or IdentityResolver()
+        if meeting_count is None:
+            meeting_count = int(participants['meeting'].nunique())
+        self.meeting_count = meeting_count
+        self.meeting_starts = meeting_starts
+        self.meeting_ends = meeting_ends
+        self.meeting_ids = meeting_ids
+        self.presence_threshold = presence_threshold
+
+    @classmethod
+    def from_meetings(cls, meetings: List[Meeting], identity_resolver: IdentityResolver = None,
+                      presence_threshold: float = None) -> 'ColumnarAttendanceCalculator':
+        """Builds the columnar table from already parsed Meeting objects."""
+        meeting_keys, names, emails, joins, leaves, durations, guests, hosts = (
+            [], [], [], [], [], [], [], []
+        )
+        for key, meeting in enumerate(meetings):
+            for participant in meeting.participants:
+                meeting_keys.append(key)
+                names.append(participant.name)
+                emails.append(participant.email)
+                joins.append(participant.join_time)
+                leaves.append(participant.leave_time)
+                durations.append(participant.duration_minutes)
+                guests.append(participant.is_guest)
+                hosts.append(participant.is_host)
+
+        names = pd.Series(names, dtype=object)
+        emails = pd.Series(emails, dtype=object)
+        participants = pd.DataFrame({
+            'meeting': np.asarray(meeting_keys, dtype=np.int64),
+            'identifier': emails.where(emails.notna(), names),
+            'name': names,
+            'email': emails,
+            'join_time': pd.to_datetime(pd.Series(joins, dtype=object)),
+            'leave_time': pd.to_datetime(pd.Series(leaves, dtype=object)),
+            'duration_minutes': np.asarray(durations, dtype=np.int64),
+            'is_guest': np.asarray(guests, dtype=bool),
+            'is_host': np.asarray(hosts, dtype=bool),
+        })
+        meeting_starts = pd.Series(pd.to_datetime([meeting.start_time for meeting in meetings]))
+        meeting_ends = pd.Series(pd.to_datetime([meeting.end_time for meeting in meetings]))
+        meeting_ids = pd.Series([meeting.meeting_id for meeting in meetings], dtype=object)
+        return cls(participants, meeting_count=len(meetings), identity_resolver=identity_resolver,
+                   meeting_starts=meeting_starts, meeting_ends=meeting_ends,
+                   presence_threshold=presence_threshold, meeting_ids=meeting_ids)
+
+    @classmethod
+    def from_csv(cls, file_path: str, identity_resolver: IdentityResolver = None,
+                 presence_threshold: float = None) -> 'ColumnarAttendanceCalculator':
+        """
+        Loads a Zoom export straight into typed columns with pandas.read_csv.
+        Blank lines separate meetings; a running count of them becomes the meeting key.
+        Compressed exports are decompressed as a stream.
+        """
+        with open_export(file_path) as file:
+            raw = pd.read_csv(
+                file,
+                encoding='utf-8-sig',
+                usecols=EXPORT_COLUMNS,
+                # Durations are parsed by the CSV parser itself; blank ones (separator rows) become NaN
+                dtype=dict.fromkeys(EXPORT_COLUMNS, str) | {PARTICIPANT_DURATION_COLUMN: 'float64'},
+                na_values={PARTICIPANT_DURATION_COLUMN: ['']},
+                keep_default_na=False,
+                skip_blank_lines=False,
+            )
+
+        # A row is a meeting separator when every column we read is blank; only rows
+        # still blank in the columns checked so far are looked at in the next one
+        blank = raw['Topic'].str.strip().eq('').to_numpy(copy=True)
+        candidates = np.flatnonzero(blank)
+        for column in EXPORT_COLUMNS[1:]:
+            values = raw[column].iloc[candidates]
+            still_blank = (values.isna() if column == PARTICIPANT_DURATION_COLUMN
+                           else values.str.strip().eq('')).to_numpy()
+            blank[candidates[~still_blank]] = False
+            candidates = candidates[still_blank]
+        meeting_keys = blank.cumsum()
+
+        # Rows without a participant name are not participants (same as ZoomCSVReader)
+        keep = ~blank & raw['Name (original name)'].ne('').to_numpy()
+        rows = np.flatnonzero(~blank)
+        row_meetings = meeting_keys[rows]
+        meeting_count = int(pd.unique(row_meetings).size)
+        # Meeting start/end times repeat on every row; parse each meeting's first one
+        first_rows = rows[~pd.Index(row_meetings).duplicated()]
+        first_meetings = meeting_keys[first_rows]
+        meeting_starts = pd.Series(parse_zoom_datetimes(raw['Start time'].iloc[first_rows].to_numpy()),
+                                   index=first_meetings)
+        meeting_ends = pd.Series(parse_zoom_datetimes(raw['End time'].iloc[first_rows].to_numpy()),
+                                 index=first_meetings)
+        meeting_ids = pd.Series(raw['ID'].iloc[first_rows].to_numpy(), index=first_meetings)
+        raw = raw[keep]
+        meeting_keys = meeting_keys[keep]
+        names = raw['Name (original name)']
+
+        emails = raw['Email'].str.strip()
+        emails = emails.where(emails.ne(''), None)
+        participants = pd.DataFrame({
+            'meeting': meeting_keys.astype(np.int64),
+            'identifier': emails.where(emails.notna(), names),
+            'name': names,
+            'email': emails,
+            'join_time': parse_zoom_datetimes(raw['Join time']),
+            'leave_time': parse_zoom_datetimes(raw['Leave time']),
+            'duration_minutes': raw[PARTICIPANT_DURATION_COLUMN].fillna(0).astype(np.int64),
+            'is_guest': raw['Guest'].str.strip().str.lower().eq('yes'),
+            'is_host': names.str.lower().str.contains('(host)', regex=False),
+        }).reset_index(drop=True)
+        return cls(participants, meeting_count=meeting_count, identity_resolver=identity_resolver,
+                   meeting_starts=meeting_starts, meeting_ends=meeting_ends,
+                   presence_threshold=presence_threshold, meeting_ids=meeting_ids)
+
+    def deduplicate(self, meeting_index: MeetingIndex, source: str) -> int:
+        """
+        Drops the meetings another export has already counted, claiming the
+        rest for `source` in the meeting index.
+
+        Returns:
+            Number of meetings dropped
+        """
+        if self.meeting_ids is None or self.meeting_starts is None:
+            raise ValueError("Deduplication needs meeting IDs and start times")
+        starts = self.meeting_starts.to_numpy(dtype='datetime64[s]').astype(np.int64)
+        keys = zip((normalize_meeting_id(meeting_id) for meeting_id in self.meeting_ids), starts.tolist())
+        keep = np.asarray(meeting_index.claim_all(keys, source), dtype=bool)
+        if keep.all():
+            return 0
+        dropped = self.meeting_ids.index[~keep]
+        self.participants = self.participants[~self.participants['meeting'].isin(dropped)].reset_index(drop=True)
+        self.meeting_ids = self.meeting_ids[keep]
+        self.meeting_starts = self.meeting_starts[keep]
+        if self.meeting_ends is not None:
+            self.meeting_ends = self.meeting_ends[keep]
+        self.meeting_count -= len(dropped)
+        return len(dropped)
+
+    def calculate_individual_attendance(self) -> Dict[str, dict]:
+        """
+        Calculates attendance percentage for each participant.
+
+        Returns the same structure (and key order) as
+        AttendanceCalculator.calculate_individual_attendance.
+        """
+        return self.partial_aggregate().individual_stats()
+
+    def calculate_team_attendance(self) -> dict:
+        """
+        Calculates overall team attendance statistics.
+
+        Returns the same structure as AttendanceCalculator.calculate_team_attendance.
+        """
+        return self.partial_aggregate().team_stats()
+
+    def partial_aggregate(self, source: str = None) -> AttendancePartial:
+        """
+        Returns the mergeable partial aggregate for this table.
+
+        Equal to AttendanceCalculator.partial_aggregate() for the same meetings.
+        """
+        aggregates = self._aggregate()
+        names = self.participants['name'].to_numpy()
+        emails = self.participants['email'].to_numpy()
+
+        participants = {}
+        for identifier, first_row, attended in zip(
+            aggregates['identifiers'], aggregates['first_rows'], aggregates['attended']
+        ):
+            email = emails[first_row]
+            participants[identifier] = {
+                'name': names[first_row],
+                'email': email if isinstance(email, str) else None,
+                'meetings_attended': int(attended),
+            }
+        if self.presence_threshold is not None:
+            for identifier, covered in zip(aggregates['identifiers'], aggregates['covered_seconds']):
+                participants[identifier]['covered_seconds'] = int(covered)
+
+        period_start = period_end = None
+        if self.meeting_starts is not None and len(aggregates['real_meetings']):
+            starts = self.meeting_starts.loc[aggregates['real_meetings']]
+            period_start = starts.min().date().isoformat()
+            period_end = starts.max().date().isoformat()
+
+        return AttendancePartial(
+            total_meetings=aggregates['total_meetings'],
+            total_participant_count=aggregates['participant_count'],
+            participants=participants,
+            period_start=period_start,
+            period_end=period_end,
+            sources=[source] if source is not None else [],
+            presence_threshold=self.presence_threshold,
+            total_meeting_seconds=aggregates['total_meeting_seconds'],
+        )
+
+    def _aggregate(self) -> dict:
+        """
+        Computes meeting and participant aggregates with vectorized operations.
+
+        Identifiers are factorized to integer codes so bot detection runs once per
+        distinct identifier, and (meeting, code) pairs are de-duplicated to count
+        each person at most once per meeting.
+        """
+        meeting = self.participants['meeting'].to_numpy(dtype=np.int64)
+        codes, uniques = pd.factorize(self.participants['identifier'], sort=False)
+
+        # Bot check once per distinct identifier (cached by the resolver), then broadcast to rows
+        is_bot = np.fromiter((self.identity_resolver.is_bot(identifier) for identifier in uniques),
+                             dtype=bool, count=len(uniques))
+        real_rows = np.flatnonzero(~is_bot[codes])
+        row_meeting = meeting[real_rows]
+        row_codes = codes[real_rows]
+
+        # Unique participants per meeting
+        pair_keys = row_meeting * max(len(uniques), 1) + row_codes
+        _, pair_first = np.unique(pair_keys, return_index=True)
+        meeting_counts = pd.Series(row_meeting[pair_first]).value_counts()
+        real_meetings = meeting_counts[meeting_counts >= 2]
+
+        # Rows in meetings with at least 2 real participants, kept in file order
+        in_real = np.isin(row_meeting, real_meetings.index.to_numpy())
+        attended_rows = real_rows[in_real]
+        attended_codes = row_codes[in_real]
+        attended_pairs = np.isin(pair_first, np.flatnonzero(in_real))
+        attended = np.bincount(row_codes[pair_first[attended_pairs]], minlength=len(uniques))
+        covered = None
+        total_meeting_seconds = 0
+        if self.presence_threshold is not None:
+            attended, covered, total_meeting_seconds = self._time_weighted(
+                attended_rows, row_meeting[in_real], attended_codes, len(uniques),
+                real_meetings.index.to_numpy()
+            )
+
+        # Identity order and name/email follow each identifier's first appearance
+        ordered_codes, first_positions = np.unique(attended_codes, return_index=True)
+        order = np.argsort(first_positions, kind='stable')
+        ordered_codes = ordered_codes[order]
+        first_rows = attended_rows[first_positions[order]]
+
+        return {
+            'total_meetings': int(len(real_meetings)),
+            'participant_count': int(real_meetings.sum()),
+            'real_meetings': real_meetings.index.to_numpy(),
+            'identifiers': [uniques[code] for code in ordered_codes],
+            'first_rows': first_rows,
+            'attended': attended[ordered_codes],
+            'covered_seconds': covered[ordered_codes] if covered is not None else None,
+            'total_meeting_seconds': total_meeting_seconds,
+        }
+
+    def _time_weighted(self, rows, row_meeting, row_codes, identity_count: int, real_meetings):
+        """
+        Computes time-weighted attendance for the rows of counted meetings.
+
+        Each (meeting, person) pair's sessions are merged by covered_seconds_by_group
+        in one vectorized sweep over all pairs.
+
+        Returns:
+            Tuple of (attended meetings per code, covered seconds per code,
+            total length of the counted meetings in seconds)
+        """
+        def seconds(values):
+            return np.asarray(values, dtype='datetime64[ns]').astype('datetime64[s]').astype(np.int64)
+
+        window_starts = seconds(self.meeting_starts.reindex(row_meeting).to_numpy())
+        window_ends = seconds(self.meeting_ends.reindex(row_meeting).to_numpy())
+        pair_keys, covered = covered_seconds_by_group(
+            row_meeting * max(identity_count, 1) + row_codes,
+            seconds(self.participants['join_time'].to_numpy()[rows]),
+            seconds(self.participants['leave_time'].to_numpy()[rows]),
+            window_starts, window_ends
+        )
+        pair_meetings = pair_keys // max(identity_count, 1)
+        pair_codes = pair_keys % max(identity_count, 1)
+        meeting_seconds = np.maximum(
+            seconds(self.meeting_ends.reindex(pair_meetings).to_numpy())
+            - seconds(self.meeting_starts.reindex(pair_meetings).to_numpy()), 0
+        )
+
+        # A zero-length meeting is attended by anyone who shows up
+        attended_pairs = (meeting_seconds == 0) | (covered >= self.presence_threshold * meeting_seconds)
+        attended = np.bincount(pair_codes[attended_pairs], minlength=identity_count)
+        covered_by_code = np.zeros(identity_count, dtype=np.int64)
+        np.add.at(covered_by_code, pair_codes, covered)
+        total_meeting_seconds = int(np.maximum(
+            seconds(self.meeting_ends.reindex(real_meetings).to_numpy())
+            - seconds(self.meeting_starts.reindex(real_meetings).to_numpy()), 0
+        ).sum())
+        return attended, covered_by_code, total_meeting_seconds
@@ -0,0 +1,104 @@
+"""
+Streaming access to plain and compressed Zoom exports (.csv, .csv.gz, .csv.zst, .zip).
+"""
+import io
+import os
+from typing import BinaryIO, TextIO
+
+
+# Folder-scan patterns for every supported export format
+EXPORT_PATTERNS = ('*.csv', '*.csv.gz', '*.csv.zst', '*.zip')
+
+_COMPRESSED_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd', '.zip': 'zip'}
+
+
+def compression_of(file_path: str) -> str:
+    """Returns 'gzip', 'zstd' or 'zip' for a compressed export, or None for a plain CSV file."""
+    return _COMPRESSED_SUFFIXES.get(os.path.splitext(file_path)[1].lower())
+
+
+def export_csv_name(filename: str) -> str:
+    """
+    Returns the CSV filename an export stands for, e.g.
+    meetinglistdetails_2025_06_01_2025_06_30.csv.gz (or .zip) becomes
+    meetinglistdetails_2025_06_01_2025_06_30.csv.
+    """
+    base, suffix = os.path.splitext(filename)
+    if suffix.lower() not in _COMPRESSED_SUFFIXES:
+        return filename
+    return base if base.lower().endswith('.csv') else base + '.csv'
+
+
+class _ZipMemberReader(io.RawIOBase):
+    """Readable stream over a zip archive's CSV member that also closes the archive."""
+
+    def __init__(self, file_path: str):
+        import zipfile
+
+        self._archive = zipfile.ZipFile(file_path)
+        try:
+            members = [info for info in self._archive.infolist()
+                       if not info.is_dir() and not os.path.basename(info.filename).startswith('.')]
+            csv_members = [info for info in members if info.filename.lower().endswith('.csv')]
+            if len(csv_members) != 1 and len(members) != 1:
+                raise ValueError(f"{file_path} must contain exactly one CSV file, "
+                                 f"found {len(csv_members)}")
+            self._member = self._archive.open(csv_members[0] if len(csv_members) == 1 else members[0])
+        except Exception:
+            self._archive.close()
+            raise
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._member.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._member.close()
+            self._archive.close()
+        super().close()
+
+
+def open_export(file_path: str) -> BinaryIO:
+    """
+    Opens an export for reading as a binary stream, decompressing on the fly.
+
+    gzip and zip are supported by the standard library; .zst files need the
+    optional zstandard package. A zip archive must hold a single CSV file.
+    Nothing is decompressed to disk and only a small buffer is held in memory.
+    The decompressors are imported on first use, so plain CSV runs start
+    without them.
+    """
+    compression = compression_of(file_path)
+    if compression is None:
+        return open(file_path, 'rb')
+    if compression == 'gzip':
+        import gzip
+        return gzip.open(file_path, 'rb')
+    if compression == 'zip':
+        return io.BufferedReader(_ZipMemberReader(file_path), buffer_size=1024 * 1024)
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"Reading {os.path.basename(file_path)} requires the zstandard package "
+                          f"(pip install zstandard)") from None
+    file = open(file_path, 'rb')
+    try:
+        return zstandard.ZstdDecompressor().stream_reader(file, closefd=True)
+    except Exception:
+        file.close()
+        raise
+
+
+def open_export_text(file_path: str) -> TextIO:
+    """
+    Opens an export as text for csv.reader: UTF-8 with an optional byte order
+    mark (utf-8-sig) and newline='' so quoted line breaks survive.
+    """
+    if compression_of(file_path) is None:
+        return open(file_path, 'r', encoding='utf-8-sig', newline='')
+    return io.TextIOWrapper(open_export(file_path), encoding='utf-8-sig', newline='')
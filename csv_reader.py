@@ -1,60 +1,206 @@
 """
 CSV Reader for parsing Zoom meeting attendance data.
 """
+import io
+import re
 import csv
+import mmap
 from datetime import datetime
-from typing import List
-from models import Meeting, Participant
+from typing import Iterator, List
+from models import Meeting, MeetingTable, Participant
+from compressed_input import compression_of, open_export_text
+from timestamp_parser import parse_zoom_datetime, parse_zoom_datetime_cached
+
+
+# A blank (or whitespace-only) line between two rows - the meeting separator
+_BLANK_LINE = re.compile(rb'\n[ \t\r]*\n')
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def _count_quotes(data, start: int, end: int, block_size: int = 16 * 1024 * 1024) -> int:
+    """Counts double quotes in data[start:end] without copying it all at once."""
+    count = 0
+    for offset in range(start, end, block_size):
+        count += data[offset:min(end, offset + block_size)].count(b'"')
+    return count
+
+
+def _parse_byte_range(file_path: str, header: List[str], start: int, end: int) -> List[Meeting]:
+    """Parses the meetings in one byte range of an export (runs in a worker process)."""
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    reader = ZoomCSVReader(file_path)
+    return list(reader._iter_meetings_from_rows(header, csv.reader(io.StringIO(text, newline=''))))
 
 
 class ZoomCSVReader:
     """Reads and parses Zoom meeting attendance CSV files."""
     
-    def __init__(self, file_path: str):
+    # Files smaller than this are always parsed serially
+    MIN_PARALLEL_CHUNK_BYTES = 8 * 1024 * 1024
+    
+    def __init__(self, file_path: str, cache=None, workers: int = 1):
+        """
+        Args:
+            file_path: Path to the Zoom export: a CSV file, or one compressed
+                as .csv.gz, .csv.zst or .zip (decompressed as it is read)
+            cache: Optional MeetingCache; read_meetings() loads from it when the
+                file was parsed before and stores freshly parsed meetings in it
+            workers: Number of processes read_meetings() may use to parse one
+                large file in parallel (see read_meetings_parallel)
+        """
         self.file_path = file_path
+        self.cache = cache
+        self.workers = workers
     
     def read_meetings(self) -> List[Meeting]:
         """
         Reads the CSV file and returns a list of Meeting objects.
         Groups rows by empty lines to identify separate meetings.
         """
-        meetings = []
-        current_meeting_rows = []
+        if self.cache is not None:
+            # Hash the file once for both the lookup and the store
+            cache_key = self.cache.key(self.file_path)
+            meetings = self.cache.get(self.file_path, cache_key)
+            if meetings is not None:
+                return meetings
         
-        # First, read all lines to identify empty lines
-        with open(self.file_path, 'r', encoding='utf-8-sig') as file:
-            lines = file.readlines()
+        if self.workers > 1:
+            meetings = self.read_meetings_parallel(self.workers)
+        else:
+            meetings = list(self.iter_meetings())
         
-        # Parse CSV manually to handle empty lines
-        reader = csv.DictReader(lines)
-        header = reader.fieldnames
+        if self.cache is not None:
+            self.cache.put(self.file_path, meetings, cache_key)
+        return meetings
+    
+    def read_table(self) -> MeetingTable:
+        """
+        Reads the CSV file into a compact MeetingTable.
+        Meetings are streamed straight into the table's columns, so no
+        per-participant objects are kept once a meeting has been added.
+        """
+        return MeetingTable.from_meetings(self.iter_meetings())
+    
+    def iter_meetings(self) -> Iterator[Meeting]:
+        """
+        Streams Meeting objects from the CSV file one at a time.
         
-        for i, line in enumerate(lines[1:], start=1):  # Skip header
+        The file is read once with a single CSV parser; an empty line marks
+        the end of a meeting, which is yielded as soon as it is complete so
+        memory use stays flat regardless of file size. Compressed exports are
+        decompressed as a stream.
+        """
+        with open_export_text(self.file_path) as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            yield from self._iter_meetings_from_rows(header, reader)
+    
+    def read_meetings_parallel(self, workers: int) -> List[Meeting]:
+        """
+        Parses one large export using several worker processes.
+        
+        The file is memory-mapped and cut into byte ranges that end on blank
+        lines (meeting boundaries) outside quoted fields, so no meeting or
+        quoted value is ever split. Each range is parsed in a worker and the
+        meeting lists are concatenated in file order, giving exactly the same
+        result as iter_meetings().
+        """
+        if compression_of(self.file_path) is not None:
+            # A compressed stream cannot be split into byte ranges
+            return list(self.iter_meetings())
+        header, ranges = self._split_into_ranges(workers * 4)
+        if header is None:
+            return []
+        if len(ranges) <= 1:
+            return list(self.iter_meetings())
+        
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            chunks = executor.map(
+                _parse_byte_range,
+                [self.file_path] * len(ranges), [header] * len(ranges),
+                [start for start, _ in ranges], [end for _, end in ranges]
+            )
+            return [meeting for chunk in chunks for meeting in chunk]
+    
+    def _split_into_ranges(self, chunk_count: int):
+        """
+        Finds the header and byte ranges of roughly equal size that start and
+        end on meeting boundaries.
+        
+        Returns:
+            Tuple of (header fields or None for an empty file, list of (start, end))
+        """
+        with open(self.file_path, 'rb') as file:
+            header_line = file.readline()
+            if not header_line.strip():
+                return None, []
+            header = next(csv.reader([header_line.decode('utf-8-sig')]))
+            data_start = file.tell()
+            size = file.seek(0, 2)
+            
+            chunk_count = max(1, min(chunk_count, (size - data_start) // self.MIN_PARALLEL_CHUNK_BYTES))
+            if chunk_count == 1:
+                return header, [(data_start, size)]
+            
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                boundaries = [data_start]
+                # Running count of quotes before quoted_until; an odd count means we are inside a quoted field
+                quotes = _count_quotes(data, 0, data_start)
+                quoted_until = data_start
+                for index in range(1, chunk_count):
+                    position = max(data_start + (size - data_start) * index // chunk_count, boundaries[-1])
+                    while True:
+                        match = _BLANK_LINE.search(data, position)
+                        if match is None:
+                            break
+                        quotes += _count_quotes(data, quoted_until, match.start())
+                        quoted_until = match.start()
+                        if quotes % 2 == 0:
+                            if match.end() < size:
+                                boundaries.append(match.end())
+                            break
+                        position = match.start() + 1
+                    if match is None:
+                        break
+                boundaries.append(size)
+        
+        ranges = [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+        return header, ranges
+    
+    def _iter_meetings_from_rows(self, header: List[str], reader) -> Iterator[Meeting]:
+        """Groups parsed CSV rows into meetings at blank lines and yields each Meeting."""
+        current_meeting_rows = []
+        for values in reader:
             # Check if line is truly empty or just whitespace
-            if line.strip() == '':
+            if all(value.strip() == '' for value in values):
                 # Empty line found - process accumulated rows
                 if current_meeting_rows:
                     meeting = self._parse_meeting(current_meeting_rows)
                     if meeting:
-                        meetings.append(meeting)
+                        yield meeting
                     current_meeting_rows = []
             else:
-                # Parse the line as CSV
-                row_reader = csv.DictReader([','.join(header)] + [line])
-                for row in row_reader:
-                    current_meeting_rows.append(row)
+                current_meeting_rows.append(self._row_to_dict(header, values))
         
         # Don't forget the last meeting if file doesn't end with empty line
         if current_meeting_rows:
             meeting = self._parse_meeting(current_meeting_rows)
             if meeting:
-                meetings.append(meeting)
-        
-        return meetings
+                yield meeting
     
-    def _is_empty_row(self, row: dict) -> bool:
-        """Checks if a row is empty."""
-        return all(value.strip() == '' for value in row.values())
+    def _row_to_dict(self, header: List[str], values: List[str]) -> dict:
+        """
+        Maps a parsed CSV row onto the header like csv.DictReader does.
+        Duplicate column names keep the last value; missing values are None.
+        """
+        if len(values) < len(header):
+            values = values + [None] * (len(header) - len(values))
+        return dict(zip(header, values))
     
     def _parse_meeting(self, rows: List[dict]) -> Meeting:
         """Parses a group of rows into a Meeting object."""
@@ -77,8 +223,8 @@ class ZoomCSVReader:
             meeting_id=first_row['ID'].replace(' ', ''),
             host_name=first_row['Host name'],
             host_email=first_row['Host email'],
-            start_time=self._parse_datetime(first_row['Start time']),
-            end_time=self._parse_datetime(first_row['End time']),
+            start_time=parse_zoom_datetime_cached(first_row['Start time']),
+            end_time=parse_zoom_datetime_cached(first_row['End time']),
             total_participants=int(first_row['Participants']),
             duration_minutes=int(first_row['Duration (minutes)']),
             participants=participants
@@ -112,5 +258,5 @@ class ZoomCSVReader:
     
     def _parse_datetime(self, date_str: str) -> datetime:
         """Parses datetime string in format: MM/DD/YYYY HH:MM:SS AM/PM"""
-        return datetime.strptime(date_str, '%m/%d/%Y %I:%M:%S %p')
+        return parse_zoom_datetime(date_str)
 
@@ -0,0 +1,219 @@
+"""
+Watches a folder for new, modified and deleted export files.
+"""
+import os
+import sys
+import time
+import errno
+import struct
+import select
+import fnmatch
+from typing import Dict, List, Optional, Tuple
+
+
+# inotify event flags (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+               | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _Inotify:
+    """Minimal ctypes binding to Linux inotify for a single directory."""
+
+    def __init__(self, folder: str):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        if libc.inotify_add_watch(self.fd, os.fsencode(folder), _WATCH_MASK) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, f'inotify_add_watch failed for {folder}')
+
+    def read(self, timeout: float) -> Optional[List[str]]:
+        """
+        Waits up to timeout seconds for events and returns the file names they
+        concern, or None when events were lost and the folder must be rescanned.
+        """
+        readable, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if not readable:
+            return []
+        names = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return names
+                raise
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF):
+                    return None
+                if name:
+                    names.append(os.fsdecode(name))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FolderWatcher:
+    """
+    Reports files in a folder that were created, modified or deleted.
+
+    Usage:
+        watcher = FolderWatcher('input', patterns=('*.csv',))
+        for changed, deleted in watcher.changes():
+            ...
+
+    On Linux, inotify wakes the watcher as soon as anything in the folder
+    changes; elsewhere (or if inotify is unavailable) the folder is rescanned
+    every `interval` seconds. Either way a file is only reported once its size
+    and mtime have stayed the same for `debounce` seconds, so exports that are
+    still being copied into the folder are not picked up half-written.
+
+    Files present when the watcher is created are the baseline: only later
+    changes are reported. Hidden files (e.g. editors' and uploaders' temporary
+    files) are ignored.
+    """
+
+    def __init__(self, folder: str, patterns=('*.csv',), interval: float = 1.0, debounce: float = 2.0,
+                 use_inotify: bool = True):
+        self.folder = folder
+        self.patterns = tuple(patterns)
+        self.interval = interval
+        self.debounce = debounce
+        # Last reported signature (size, mtime_ns) of each file
+        self.known: Dict[str, Tuple[int, int]] = self._scan()
+        # Files whose signature changed: path -> (signature, time the signature was last seen to change)
+        self.pending: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}
+
+        self._inotify = None
+        if use_inotify and sys.platform.startswith('linux'):
+            try:
+                self._inotify = _Inotify(folder)
+            except (OSError, AttributeError):
+                # Out of watches, unsupported filesystem or no libc symbol: fall back to polling
+                self._inotify = None
+
+    @property
+    def backend(self) -> str:
+        return 'inotify' if self._inotify is not None else 'polling'
+
+    def _matches(self, name: str) -> bool:
+        return not name.startswith('.') and any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def _signature(self, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        signatures = {}
+        if not os.path.isdir(self.folder):
+            return signatures
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file() and self._matches(entry.name):
+                    stat = entry.stat()
+                    signatures[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def _observe(self, path: str, signature: Optional[Tuple[int, int]], now: float):
+        """Records the current signature of a file, restarting its debounce timer if it changed."""
+        previous = self.pending.get(path)
+        if previous is not None:
+            if previous[0] != signature:
+                self.pending[path] = (signature, now)
+        elif signature != self.known.get(path):
+            self.pending[path] = (signature, now)
+
+    def poll(self, timeout: float = None) -> Tuple[List[str], List[str]]:
+        """
+        Waits up to timeout seconds (default: the polling interval) for changes.
+
+        Returns:
+            Tuple of (changed or new file paths, deleted file paths) whose
+            changes have settled; both lists are empty if nothing settled
+        """
+        timeout = self.interval if timeout is None else timeout
+        if self.pending:
+            # Wake up in time to report the first file that settles
+            now = time.monotonic()
+            timeout = min(timeout, max(min(changed_at for _, changed_at in self.pending.values())
+                                       + self.debounce - now, 0))
+
+        if self._inotify is not None:
+            names = self._inotify.read(timeout)
+            now = time.monotonic()
+            if names is None:
+                self._observe_all(now)
+            else:
+                for name in set(names):
+                    if self._matches(name):
+                        path = os.path.join(self.folder, name)
+                        self._observe(path, self._signature(path), now)
+        else:
+            time.sleep(timeout)
+            now = time.monotonic()
+            self._observe_all(now)
+
+        changed, deleted = [], []
+        for path, (signature, changed_at) in list(self.pending.items()):
+            # Re-check before reporting: a writer may have appended without a new event yet
+            current = self._signature(path)
+            if current != signature:
+                self.pending[path] = (current, now)
+                continue
+            if now - changed_at < self.debounce:
+                continue
+            del self.pending[path]
+            if signature is None:
+                if self.known.pop(path, None) is not None:
+                    deleted.append(path)
+            elif signature != self.known.get(path):
+                self.known[path] = signature
+                changed.append(path)
+        return sorted(changed), sorted(deleted)
+
+    def _observe_all(self, now: float):
+        current = self._scan()
+        for path in set(current) | set(self.known) | set(self.pending):
+            self._observe(path, current.get(path), now)
+
+    def changes(self):
+        """Yields (changed, deleted) batches forever, skipping empty polls."""
+        while True:
+            changed, deleted = self.poll()
+            if changed or deleted:
+                yield changed, deleted
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
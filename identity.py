@@ -0,0 +1,59 @@
+"""
+Participant identity resolution and bot filtering.
+"""
+import re
+from typing import Iterable, List, Optional
+
+
+# Identifiers containing any of these (case-insensitive) belong to bots such as Textalize AI
+DEFAULT_BOT_PATTERNS = ('textalize', 'bot@')
+
+
+class IdentityResolver:
+    """
+    Interns participant identifiers to small integer IDs and classifies bots.
+
+    Bot patterns are combined into one precompiled case-insensitive regex, and
+    each distinct identifier is classified only once, when it is first interned.
+    Keeping one resolver for a whole run means every person is classified once
+    per run, and aggregation can work on ints instead of strings.
+    """
+
+    def __init__(self, bot_patterns: Iterable[str] = DEFAULT_BOT_PATTERNS):
+        self.bot_patterns = tuple(pattern for pattern in bot_patterns if pattern)
+        if self.bot_patterns:
+            self._bot_regex = re.compile('|'.join(re.escape(pattern) for pattern in self.bot_patterns),
+                                         re.IGNORECASE)
+        else:
+            self._bot_regex = None
+        self._ids = {}
+        self.identifiers: List[str] = []
+        self.bot_flags = bytearray()
+
+    def intern(self, identifier: str) -> int:
+        """Returns the integer ID for an identifier, assigning one if it is new."""
+        identity_id = self._ids.get(identifier)
+        if identity_id is None:
+            identity_id = self._ids[identifier] = len(self.identifiers)
+            self.identifiers.append(identifier)
+            self.bot_flags.append(self._bot_regex is not None and
+                                  self._bot_regex.search(identifier) is not None)
+        return identity_id
+
+    def resolve(self, participant) -> Optional[int]:
+        """Returns the participant's identity ID, or None if the participant is a bot."""
+        identity_id = self.intern(participant.email if participant.email else participant.name)
+        return None if self.bot_flags[identity_id] else identity_id
+
+    def is_bot(self, identifier: str) -> bool:
+        """Checks if an identifier belongs to a bot."""
+        return bool(self.bot_flags[self.intern(identifier)])
+
+    def identifier(self, identity_id: int) -> str:
+        """Returns the identifier string for an identity ID."""
+        return self.identifiers[identity_id]
+
+
+# Used when no resolver is passed (e.g. Meeting.get_unique_participants()), so repeated
+# calls share its interning; it only has the default bot patterns, and runs pass their own
+default_identity_resolver = IdentityResolver()
@@ -0,0 +1,206 @@
+"""
+Per-stage instrumentation: wall/CPU time, process peak RSS, counts and optional cProfile.
+"""
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Returns the process's peak resident set size so far, in MiB, or None where it is unavailable."""
+    try:
+        # Unix only; imported here so the instrumented modules also import on Windows
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def children_cpu_seconds() -> float:
+    """Returns the CPU time of the finished child processes (e.g. parse workers) so far."""
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+def _max_rss(records) -> Optional[float]:
+    peaks = [record.process_peak_rss_mb for record in records if record.process_peak_rss_mb is not None]
+    return max(peaks) if peaks else None
+
+
+def _round(megabytes: Optional[float]) -> Optional[float]:
+    return None if megabytes is None else round(megabytes, 1)
+
+
+class StageRecord:
+    """
+    Measurements of one stage run (for one file, or for the whole run).
+
+    cpu_seconds is the CPU time of the thread running the stage, so stages
+    running concurrently in other threads are not counted, plus that of child
+    processes that finished during it (the --parse-workers pool). With --jobs,
+    stages are recorded in the worker processes themselves.
+    process_peak_rss_mb is the peak RSS of the whole process when the stage
+    ended, not the memory used by the stage itself.
+    """
+    __slots__ = ('stage', 'file', 'wall_seconds', 'cpu_seconds', 'process_peak_rss_mb', 'counts', 'profile_file')
+
+    def __init__(self, stage: str, file: Optional[str]):
+        self.stage = stage
+        self.file = file
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.process_peak_rss_mb = None
+        self.counts = {}
+        self.profile_file = None
+
+    def count(self, **counts):
+        """Records counts such as rows, meetings or participants for this stage."""
+        self.counts.update(counts)
+
+    def to_dict(self) -> dict:
+        return {
+            'stage': self.stage,
+            'file': self.file,
+            'wall_seconds': round(self.wall_seconds, 6),
+            'cpu_seconds': round(self.cpu_seconds, 6),
+            'process_peak_rss_mb': _round(self.process_peak_rss_mb),
+            'counts': self.counts,
+            'profile_file': self.profile_file,
+        }
+
+
+class _NullRecord:
+    """Stand-in record used when tracing is off; all methods are no-ops."""
+    __slots__ = ()
+
+    def count(self, **counts):
+        pass
+
+
+_NULL_RECORD = _NullRecord()
+
+
+class Tracer:
+    """
+    Records per-stage, per-file measurements for a run.
+
+    Usage:
+        tracer = Tracer(enabled=True, profile_stage='read', profile_dir='output/profiles')
+        with tracer.stage('read', file='june.csv') as stage:
+            meetings = reader.read_meetings()
+            if tracer.enabled:
+                stage.count(meetings=len(meetings))
+
+    When disabled, stage() yields a shared no-op record without taking any
+    measurements, so instrumented code costs one attribute check per stage.
+    With profile_stage set, that stage also runs under cProfile and its stats
+    are saved to profile_dir (one .prof file per file processed).
+
+    A tracer is picklable: worker processes record into spawn() copies and
+    the parent collects their records with extend().
+    """
+
+    def __init__(self, enabled: bool = False, profile_stage: str = None, profile_dir: str = None):
+        self.enabled = enabled
+        self.profile_stage = profile_stage
+        self.profile_dir = profile_dir
+        self.records: List[StageRecord] = []
+
+    def spawn(self) -> 'Tracer':
+        """Returns an empty tracer with the same settings (e.g. for a worker process)."""
+        return Tracer(self.enabled, self.profile_stage, self.profile_dir)
+
+    def extend(self, records: List[StageRecord]):
+        """Adds records collected by a spawned tracer."""
+        self.records.extend(records)
+
+    @contextmanager
+    def stage(self, name: str, file: str = None):
+        if not self.enabled:
+            yield _NULL_RECORD
+            return
+
+        record = StageRecord(name, file)
+        profiler = None
+        if name == self.profile_stage:
+            import cProfile
+            profiler = cProfile.Profile()
+        wall_start = time.perf_counter()
+        # Per-thread CPU time: pipelined stages of different files run concurrently in threads
+        cpu_start = time.thread_time()
+        children_cpu_start = children_cpu_seconds()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = (time.thread_time() - cpu_start
+                                  + children_cpu_seconds() - children_cpu_start)
+            record.process_peak_rss_mb = peak_rss_mb()
+            if profiler is not None:
+                record.profile_file = self._save_profile(profiler, name, file)
+            self.records.append(record)
+
+    def _save_profile(self, profiler, name: str, file: Optional[str]) -> str:
+        profile_dir = self.profile_dir or '.'
+        os.makedirs(profile_dir, exist_ok=True)
+        label = os.path.basename(file) if file else 'run'
+        path = os.path.join(profile_dir, f"{name}_{label}.prof")
+        profiler.dump_stats(path)
+        return path
+
+    def to_dict(self) -> dict:
+        return {
+            'stages': [record.to_dict() for record in self.records],
+            'totals': {
+                stage: {
+                    'wall_seconds': round(sum(record.wall_seconds for record in records), 6),
+                    'cpu_seconds': round(sum(record.cpu_seconds for record in records), 6),
+                    'process_peak_rss_mb': _round(_max_rss(records)),
+                    'runs': len(records),
+                }
+                for stage, records in self._by_stage().items()
+            },
+        }
+
+    def save(self, path: str):
+        """Writes the trace as JSON."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def summary_table(self) -> str:
+        """Returns a per-stage summary (totals over all files) as a text table."""
+        lines = [f"{'Stage':<12} {'Runs':>5} {'Wall (s)':>10} {'CPU (s)':>10} {'Process peak RSS (MiB)':>23}  Counts"]
+        for stage, records in self._by_stage().items():
+            counts = {}
+            for record in records:
+                for key, value in record.counts.items():
+                    counts[key] = counts.get(key, 0) + value
+            peak = _max_rss(records)
+            lines.append(
+                f"{stage:<12} {len(records):>5} "
+                f"{sum(record.wall_seconds for record in records):>10.3f} "
+                f"{sum(record.cpu_seconds for record in records):>10.3f} "
+                + (f"{peak:>23.1f}  " if peak is not None else f"{'n/a':>23}  ")
+                + ', '.join(f"{key}={value}" for key, value in counts.items())
+            )
+        return '\n'.join(lines)
+
+    def _by_stage(self) -> dict:
+        stages = {}
+        for record in self.records:
+            stages.setdefault(record.stage, []).append(record)
+        return stages
+
+
+# Shared disabled tracer for callers that do not trace
+NULL_TRACER = Tracer()
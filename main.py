@@ -3,107 +3,815 @@ Main script to process Zoom attendance data and generate reports.
 """
 import sys
 import os
+import io
 import glob
 import shutil
+import argparse
+import calendar
+import contextlib
+from collections import OrderedDict
+from datetime import date
 from csv_reader import ZoomCSVReader
-from attendance_calculator import AttendanceCalculator
-from report_generator import ReportGenerator
+from attendance_calculator import AttendanceCalculator, AttendancePartial
+from report_generator import ReportGenerator, REPORT_SINKS, DEFAULT_FORMATS
+from manifest import RunManifest
+from meeting_cache import MeetingCache
+from identity import IdentityResolver, DEFAULT_BOT_PATTERNS
+from instrumentation import Tracer, NULL_TRACER
+from meeting_index import MeetingIndex
+from compressed_input import EXPORT_PATTERNS, export_csv_name
 
 
-def process_csv_file(input_file: str, output_base_dir: str = 'output'):
+# Recorded in the output manifest; bump when report contents change so reports are rebuilt
+TOOL_VERSION = '2.0.0'
+
+
+MONTH_NAMES = {
+    '01': 'january', '02': 'february', '03': 'march',
+    '04': 'april', '05': 'may', '06': 'june',
+    '07': 'july', '08': 'august', '09': 'september',
+    '10': 'october', '11': 'november', '12': 'december'
+}
+
+
+def get_report_name(filename: str, other_exports=()) -> str:
+    """
+    Derives the report name from an export's filename.
+    
+    meetinglistdetails_2025_06_01_2025_06_30.csv becomes 'june_2025', named
+    after the month the range starts in. Only if one of other_exports (the
+    other exports in the same folder) would get the same name, exports that do
+    not cover exactly that calendar month also name their days, e.g.
+    meetinglistdetails_2025_06_10_2025_06_24.csv becomes 'june_2025_10_to_24',
+    so an ad-hoc export never overwrites the monthly report of the same month.
+    Any other filename is used as-is without its .csv extension. Compressed
+    exports (.csv.gz, .csv.zst, .zip) get the name of the CSV file they contain.
+    """
+    return _report_name(export_csv_name(filename), _exports_by_month(other_exports))
+
+
+def get_export_report_name(csv_file: str) -> str:
+    """Returns the report name of an export file, given the other exports in its folder."""
+    return get_export_report_names([csv_file])[csv_file]
+
+
+def get_export_report_names(csv_files) -> dict:
+    """
+    Returns the report name of each export file by path, given the other
+    exports in its folder. Each folder is scanned once, however many of its
+    exports are named.
+    """
+    report_names = {}
+    folders = {}
+    for csv_file in csv_files:
+        folder = os.path.dirname(csv_file) or '.'
+        if folder not in folders:
+            folders[folder] = _exports_by_month(_export_paths(folder))
+        report_names[csv_file] = _report_name(export_csv_name(os.path.basename(csv_file)), folders[folder])
+    return report_names
+
+
+def _exports_by_month(exports) -> dict:
+    """Maps month-level report names to the CSV names of the exports that would get them."""
+    exports_by_month = {}
+    for export in exports:
+        csv_name = export_csv_name(os.path.basename(export))
+        exports_by_month.setdefault(_month_report_name(csv_name), set()).add(csv_name)
+    return exports_by_month
+
+
+def _report_name(filename: str, exports_by_month: dict) -> str:
+    """Returns the report name of a CSV filename, given the exports by month-level report name."""
+    report_name = _month_report_name(filename)
+    parts = _export_date_parts(filename)
+    if parts is None or _is_whole_month(*parts):
+        return report_name
+    if not exports_by_month.get(report_name, set()) - {filename}:
+        return report_name
+    if parts[3:5] == parts[0:2]:
+        return f"{report_name}_{parts[2]}_to_{parts[5]}"
+    return f"{report_name}_{parts[2]}_to_{MONTH_NAMES.get(parts[4], parts[4])}_{parts[3]}_{parts[5]}"
+
+
+def _export_date_parts(filename: str):
+    """Returns [YYYY, MM, DD, YYYY, MM, DD] from a meetinglistdetails_*.csv filename, or None."""
+    if not filename.startswith('meetinglistdetails_'):
+        return None
+    parts = filename.replace('meetinglistdetails_', '').replace('.csv', '').split('_')
+    return parts if len(parts) == 6 else None
+
+
+def _month_report_name(filename: str) -> str:
+    """Returns an export's month-level report name, e.g. 'june_2025'."""
+    parts = _export_date_parts(filename)
+    if parts is None:
+        return filename.replace('.csv', '')
+    # Format: YYYY_MM_DD_YYYY_MM_DD
+    year, month = parts[0], parts[1]
+    return f"{MONTH_NAMES.get(month, month)}_{year}"
+
+
+def _is_whole_month(start_year: str, start_month: str, start_day: str,
+                    end_year: str, end_month: str, end_day: str) -> bool:
+    """Checks whether an export's date range is exactly one calendar month."""
+    if (start_year, start_month, start_day) != (end_year, end_month, '01'):
+        return False
+    try:
+        return int(end_day) == calendar.monthrange(int(end_year), int(end_month))[1]
+    except ValueError:
+        return False
+
+
+def find_exports(input_folder: str) -> list:
+    """
+    Returns the Zoom exports in a folder - plain CSV files and .csv.gz, .csv.zst
+    and .zip compressed ones - sorted by name. If the same export is present
+    both plain and compressed, only the first in name order is used.
+    """
+    return select_exports(_export_paths(input_folder), announce=True)
+
+
+def select_exports(paths, announce: bool = False) -> list:
+    """
+    Returns the paths that are processed, in name order: of several copies of
+    the same export (e.g. x.csv and x.csv.gz) only the first in name order is
+    kept. With announce, each ignored copy is reported.
+    """
+    export_files = []
+    seen = {}
+    for path in sorted(paths):
+        csv_name = export_csv_name(os.path.basename(path))
+        if csv_name in seen:
+            if announce:
+                print(f"⚠  Ignoring {os.path.basename(path)}: same export as {os.path.basename(seen[csv_name])}")
+            continue
+        seen[csv_name] = path
+        export_files.append(path)
+    return export_files
+
+
+def _export_paths(input_folder: str) -> list:
+    """Returns the paths of all plain and compressed exports in a folder, sorted by name."""
+    paths = set()
+    for pattern in EXPORT_PATTERNS:
+        paths.update(glob.glob(os.path.join(input_folder, pattern)))
+    return sorted(paths)
+
+
+def get_report_file(output_base_dir: str, report_name: str) -> str:
+    """Returns the path of a report's Excel file; other formats' names are derived from it."""
+    return os.path.join(output_base_dir, f"{report_name}_report", f"attendance_report_{report_name}.xlsx")
+
+
+def get_partial_file(output_base_dir: str, report_name: str) -> str:
+    """Returns the path of a report's stored partial aggregate (used for rollups)."""
+    return os.path.join(output_base_dir, 'partials', f"{report_name}.json")
+
+
+def get_report_outputs(output_base_dir: str, report_name: str, formats=DEFAULT_FORMATS) -> list:
+    """Returns every file generated for a report in the given output formats."""
+    outputs = ReportGenerator(get_report_file(output_base_dir, report_name)).output_paths(formats)
+    return outputs + [get_partial_file(output_base_dir, report_name)]
+
+
+def get_rollup_periods(partial: AttendancePartial, rollups, rolling_start: str = None) -> list:
+    """
+    Returns the names of the rollup reports a partial belongs to.
+    
+    A partial is placed by the date of its first counted meeting, e.g. a June 2025
+    export belongs to '2025_q2', '2025' and 'all'.
+    """
+    year, month = int(partial.period_start[:4]), int(partial.period_start[5:7])
+    periods = []
+    for rollup in rollups:
+        if rollup == 'quarter':
+            periods.append(f"{year}_q{(month - 1) // 3 + 1}")
+        elif rollup == 'year':
+            periods.append(str(year))
+        elif rollup == 'all':
+            periods.append('all')
+    if rolling_start is not None and partial.period_start >= rolling_start:
+        periods.append('rolling')
+    return periods
+
+
+def load_partials(output_base_dir: str = 'output') -> dict:
+    """
+    Loads the stored per-file partial aggregates, keyed by report name.
+    
+    If several partials come from the same export (e.g. one stored under the
+    report name of an older version), only the newest is used.
+    """
+    partials = {}
+    newest = {}
+    partial_files = glob.glob(os.path.join(output_base_dir, 'partials', '*.json'))
+    for partial_file in sorted(partial_files, key=os.path.getmtime, reverse=True):
+        partial = AttendancePartial.load(partial_file)
+        sources = tuple(partial.sources)
+        if sources and sources in newest:
+            continue
+        newest[sources] = partial_file
+        partials[os.path.splitext(os.path.basename(partial_file))[0]] = partial
+    return partials
+
+
+def generate_rollups(output_base_dir: str = 'output', rollups=('all',), rolling_months: int = None,
+                     xlsx_writer: str = 'streaming', formats=DEFAULT_FORMATS, partials: dict = None,
+                     periods=None) -> int:
+    """
+    Builds multi-month rollup reports from the stored per-file partial aggregates.
+    
+    Partials are merged in date order without re-reading any CSV file, so the
+    rollup statistics equal a from-scratch computation over all the meetings.
+    
+    Args:
+        output_base_dir: Base directory holding partials/ and receiving rollups/
+        rollups: Calendar rollups to build ('quarter', 'year', 'all')
+        rolling_months: If set, also builds a rollup of the last N calendar months
+            up to the most recent partial
+        xlsx_writer: Excel writer to use ('streaming' or 'pandas')
+        formats: Output formats to generate
+        partials: Partials by report name already in memory (default: loaded from partials/)
+        periods: If given, only the rollups for these periods (e.g. '2025_q2',
+            'rolling') are rebuilt
+    
+    Returns:
+        Number of rollup reports generated
+    """
+    if partials is None:
+        partials = load_partials(output_base_dir)
+    # Exports without any real meeting contribute nothing
+    partials = [partial for partial in partials.values() if partial.period_start is not None]
+    partials.sort(key=lambda partial: (partial.period_start, partial.sources))
+    if not partials:
+        print("⚠  No stored partial aggregates found; process some CSV files first")
+        return 0
+    
+    rolling_start = get_rolling_start(partials, rolling_months)
+    
+    groups = OrderedDict()
+    for partial in partials:
+        for period in get_rollup_periods(partial, rollups, rolling_start):
+            if periods is None or period in periods:
+                groups.setdefault(period, []).append(partial)
+    
+    for period, group in groups.items():
+        name = f"last_{rolling_months}_months" if period == 'rolling' else period
+        merged = AttendancePartial.merge_all(group)
+        individual_stats = merged.individual_stats()
+        team_stats = merged.team_stats(individual_stats)
+        
+        print(f"\n📅 Rollup {name}: {merged.period_start} to {merged.period_end} "
+              f"({len(group)} file(s), {team_stats['total_meetings']} meetings)")
+        output_file = os.path.join(output_base_dir, 'rollups', f"{name}_rollup", f"attendance_rollup_{name}.xlsx")
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        ReportGenerator(output_file, xlsx_writer=xlsx_writer).generate(individual_stats, team_stats, formats=formats)
+    return len(groups)
+
+
+def get_rolling_start(partials, rolling_months: int = None) -> str:
+    """Returns the first day (ISO date) of the last N months up to the latest partial, or None."""
+    if not rolling_months:
+        return None
+    ends = [partial.period_end for partial in partials if partial.period_end is not None]
+    if not ends:
+        return None
+    last = date.fromisoformat(max(ends))
+    # First day of the month N - 1 months before the latest one
+    month_index = last.year * 12 + (last.month - 1) - (rolling_months - 1)
+    return date(month_index // 12, month_index % 12 + 1, 1).isoformat()
+
+
+def process_csv_file(input_file: str, output_base_dir: str = 'output', engine: str = 'python',
+                     cache: MeetingCache = None, identity_resolver: IdentityResolver = None,
+                     xlsx_writer: str = 'streaming', formats=DEFAULT_FORMATS, parse_workers: int = 1,
+                     presence_threshold: float = None, tracer: Tracer = NULL_TRACER,
+                     meeting_index: MeetingIndex = None, report_name: str = None):
     """
     Process a single CSV file and generate reports.
     
     Args:
         input_file: Path to the input CSV file
         output_base_dir: Base directory for output files
+        engine: Attendance engine to use ('python' or 'columnar')
+        cache: Optional MeetingCache of previously parsed meetings
+        identity_resolver: Optional IdentityResolver shared across files (bot filtering)
+        xlsx_writer: Excel writer to use ('streaming' or 'pandas')
+        formats: Output formats to generate (xlsx, csv, parquet, jsonl)
+        parse_workers: Processes used to parse a single large CSV file
+        presence_threshold: If set (0-1), attendance is time-weighted: a meeting counts
+            as attended only when the person was present for at least this fraction of it
+        tracer: Optional Tracer recording the read/calculate/write stages of this file
+        meeting_index: Optional MeetingIndex; meetings already counted from another
+            export are skipped (and reported) instead of being counted again
+        report_name: The file's report name, if already known (see get_export_report_names)
     """
     try:
-        # Extract date range from filename (e.g., meetinglistdetails_2025_06_01_2025_06_30.csv)
-        filename = os.path.basename(input_file)
-        if filename.startswith('meetinglistdetails_'):
-            # Extract date components from filename
-            parts = filename.replace('meetinglistdetails_', '').replace('.csv', '').split('_')
-            if len(parts) == 6:
-                # Format: YYYY_MM_DD_YYYY_MM_DD
-                year = parts[0]
-                month = parts[1]
-                month_names = {
-                    '01': 'january', '02': 'february', '03': 'march',
-                    '04': 'april', '05': 'may', '06': 'june',
-                    '07': 'july', '08': 'august', '09': 'september',
-                    '10': 'october', '11': 'november', '12': 'december'
-                }
-                month_name = month_names.get(month, month)
-                report_name = f"{month_name}_{year}"
-            else:
-                report_name = filename.replace('.csv', '')
-        else:
-            report_name = filename.replace('.csv', '')
-        
-        # Create output directory for this report
-        output_dir = os.path.join(output_base_dir, f"{report_name}_report")
-        os.makedirs(output_dir, exist_ok=True)
+        job = read_stage(input_file, output_base_dir, engine=engine, cache=cache,
+                         identity_resolver=identity_resolver, parse_workers=parse_workers,
+                         presence_threshold=presence_threshold, tracer=tracer, meeting_index=meeting_index,
+                         report_name=report_name)
+        compute_stage(job, tracer=tracer)
+        write_stage(job, xlsx_writer=xlsx_writer, formats=formats, tracer=tracer)
+        return True
         
-        # Create input_file subfolder and copy the input CSV file
-        input_file_dir = os.path.join(output_dir, "input_file")
-        os.makedirs(input_file_dir, exist_ok=True)
-        input_file_copy = os.path.join(input_file_dir, filename)
+    except Exception as e:
+        report_file_error(input_file, e)
+        return False
+
+
+def report_file_error(input_file: str, error: Exception):
+    """Prints a file's processing error with its traceback."""
+    print(f"❌ Error processing {input_file}: {str(error)}")
+    import traceback
+    traceback.print_exception(type(error), error, error.__traceback__)
+
+
+def read_stage(input_file: str, output_base_dir: str = 'output', engine: str = 'python',
+               cache: MeetingCache = None, identity_resolver: IdentityResolver = None, parse_workers: int = 1,
+               presence_threshold: float = None, tracer: Tracer = NULL_TRACER,
+               meeting_index: MeetingIndex = None, report_name: str = None, **options) -> dict:
+    """
+    First stage of process_csv_file: archives the input and parses it into a calculator.
+    
+    Returns:
+        The file's job state, passed on to compute_stage() and write_stage()
+    """
+    filename = os.path.basename(input_file)
+    if report_name is None:
+        report_name = get_export_report_name(input_file)
+    
+    # Create output directory for this report
+    output_dir = os.path.join(output_base_dir, f"{report_name}_report")
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Create input_file subfolder and copy the input CSV file
+    input_file_dir = os.path.join(output_dir, "input_file")
+    os.makedirs(input_file_dir, exist_ok=True)
+    input_file_copy = os.path.join(input_file_dir, filename)
+    # Compressed exports are archived as they are, not expanded
+    with tracer.stage('copy', filename) as stage:
         shutil.copy2(input_file, input_file_copy)
+        if tracer.enabled:
+            stage.count(bytes=os.path.getsize(input_file))
+    
+    print(f"\n{'=' * 60}")
+    print(f"Processing: {filename}")
+    print(f"{'=' * 60}")
+    
+    # Step 1: Read CSV file
+    print(f"📖 Reading data from: {input_file}")
+    with tracer.stage('read', filename) as stage:
+        if engine == 'columnar':
+            from columnar_calculator import ColumnarAttendanceCalculator
+            calculator = ColumnarAttendanceCalculator.from_csv(input_file, identity_resolver=identity_resolver,
+                                                               presence_threshold=presence_threshold)
+            meeting_count = calculator.meeting_count
+            if meeting_index is not None:
+                calculator.deduplicate(meeting_index, filename)
+            row_count = len(calculator.participants) if tracer.enabled else 0
+        else:
+            reader = ZoomCSVReader(input_file, cache=cache, workers=parse_workers)
+            meetings = reader.read_meetings()
+            meeting_count = len(meetings)
+            if meeting_index is not None:
+                meetings = meeting_index.filter_meetings(meetings, filename)
+            calculator = AttendanceCalculator(meetings, identity_resolver=identity_resolver,
+                                              presence_threshold=presence_threshold)
+            row_count = sum(len(meeting.participants) for meeting in meetings) if tracer.enabled else 0
+        stage.count(rows=row_count, meetings=meeting_count)
+    print(f"✓ Successfully parsed {meeting_count} meetings")
+    if meeting_index is not None and meeting_index.skipped_summary(filename):
+        print(f"⏭  Skipped overlapping meetings: {meeting_index.skipped_summary(filename)}")
+    
+    return {
+        'filename': filename,
+        'report_name': report_name,
+        'output_base_dir': output_base_dir,
+        'presence_threshold': presence_threshold,
+        'calculator': calculator,
+    }
+
+
+def compute_stage(job: dict, tracer: Tracer = NULL_TRACER, **options) -> dict:
+    """Second stage of process_csv_file: computes the statistics and stores the partial aggregate."""
+    filename = job['filename']
+    calculator = job.pop('calculator')
+    
+    # Step 2: Calculate attendance statistics
+    print("📊 Calculating attendance statistics...")
+    with tracer.stage('calculate', filename) as stage:
+        individual_stats = calculator.calculate_individual_attendance()
+        team_stats = calculator.calculate_team_attendance()
         
-        # Output report file (Excel format)
-        output_file = os.path.join(output_dir, f"attendance_report_{report_name}.xlsx")
+        # Keep a compact partial aggregate so rollups never need to re-read this file
+        partial_file = get_partial_file(job['output_base_dir'], job['report_name'])
+        os.makedirs(os.path.dirname(partial_file), exist_ok=True)
+        calculator.partial_aggregate(filename).save(partial_file)
+        stage.count(participants=len(individual_stats), meetings=team_stats['total_meetings'])
+    print(f"✓ Calculated statistics for {len(individual_stats)} participants")
+    
+    # Step 3: Display summary
+    print("📈 Team Summary:")
+    print(f"  - Total Meetings: {team_stats['total_meetings']}")
+    print(f"  - Total Unique Participants: {team_stats['total_unique_participants']}")
+    print(f"  - Average Attendance: {team_stats['average_attendance_percentage']}%")
+    print(f"  - Avg Participants per Meeting: {team_stats['average_participants_per_meeting']}")
+    if job['presence_threshold'] is not None:
+        print(f"  - Average Presence: {team_stats['average_presence_percentage']}%")
+    
+    job['individual_stats'] = individual_stats
+    job['team_stats'] = team_stats
+    return job
+
+
+def write_stage(job: dict, xlsx_writer: str = 'streaming', formats=DEFAULT_FORMATS,
+                tracer: Tracer = NULL_TRACER, **options) -> dict:
+    """Last stage of process_csv_file: writes the reports in every requested format."""
+    output_file = get_report_file(job['output_base_dir'], job['report_name'])
+    individual_stats = job['individual_stats']
+    
+    # Step 4: Generate reports - tables are built once and written in every format
+    print(f"📝 Generating reports ({', '.join(formats)}): {output_file}")
+    with tracer.stage('write', job['filename']) as stage:
+        report_generator = ReportGenerator(output_file, xlsx_writer=xlsx_writer)
+        written = report_generator.generate(individual_stats, job['team_stats'], formats=formats)
+        stage.count(files=len(written), rows=len(individual_stats))
+    
+    print(f"✅ Report generated successfully: {job['report_name']}")
+    return job
+
+
+def _process_csv_file_captured(input_file: str, output_base_dir: str, options: dict):
+    """
+    Runs process_csv_file in a worker process, capturing everything it prints.
+    
+    Returns:
+        Tuple of (success flag, captured stdout/stderr output, stage records)
+    """
+    # Record into a fresh tracer and hand the records back to the parent
+    tracer = options.get('tracer', NULL_TRACER).spawn()
+    options = dict(options, tracer=tracer)
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        success = process_csv_file(input_file, output_base_dir, **options)
+    return success, buffer.getvalue(), tracer.records
+
+
+def process_csv_files(csv_files: list, jobs: int = 1, output_base_dir: str = 'output',
+                      manifest: RunManifest = None, pipeline_depth: int = 0, **options):
+    """
+    Process several CSV files, optionally in parallel.
+    
+    With jobs > 1 the files are processed in a process pool. Each file's
+    progress output is captured in its worker and printed as one block, in
+    input order, so output from different files never interleaves.
+    
+    With one job the files are processed one by one, unless pipeline_depth
+    is set: then the read, compute and write stages of consecutive files
+    overlap in a thread pipeline (see pipeline.run_pipeline) with at most
+    pipeline_depth files queued between stages, so file N + 1 is parsed
+    while file N's reports are written; output is printed per file in the
+    same way.
+    
+    When a manifest is given, files whose reports are already up to date are
+    skipped, and the manifest is updated and saved once all files are done.
+    With an in-memory meeting_index (no path) no file is skipped, and the
+    reports are recorded as not reusable, so a later run rebuilds them.
+    
+    With a meeting_index option, files are processed serially in the given
+    order, so the first file containing a meeting is the one that counts it;
+    a persistent index is saved once all files are done.
+    
+    Args:
+        csv_files: Paths of the CSV files to process
+        jobs: Number of worker processes (1 processes files serially, 0 uses all CPUs)
+        output_base_dir: Base directory for output files
+        manifest: Optional RunManifest used to skip unchanged files
+        pipeline_depth: Files queued between pipeline stages when jobs is 1 (0 disables the pipeline)
+        **options: Passed on to process_csv_file (engine, cache, ...)
+    
+    Returns:
+        Tuple of (success count, failed count, skipped count)
+    """
+    success_count = 0
+    failed_count = 0
+    skipped_count = 0
+    meeting_index = options.get('meeting_index')
+    # A file skipped as unchanged would claim none of its meetings in an index that starts empty,
+    # and the reports built now depend on the run's other files, so they are not reused later
+    reusable = meeting_index is None or meeting_index.path is not None
+    # Named once for the whole batch: naming depends on every export in the folder
+    report_names = get_export_report_names(csv_files)
+    
+    if manifest is not None and reusable:
+        pending_files = []
+        for csv_file in csv_files:
+            if manifest.is_unchanged(csv_file, report_names[csv_file]):
+                print(f"⏭  Skipping unchanged: {os.path.basename(csv_file)}")
+                skipped_count += 1
+            else:
+                pending_files.append(csv_file)
+        csv_files = pending_files
+    
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if meeting_index is not None:
+        # Claims must be made in file order in one process
+        jobs = 1
+    
+    if len(csv_files) > 1 and jobs <= 1 and pipeline_depth > 0:
+        results = _run_pipelined(csv_files, output_base_dir, pipeline_depth, options, report_names)
+    elif jobs <= 1 or len(csv_files) <= 1:
+        results = (process_csv_file(csv_file, output_base_dir, report_name=report_names[csv_file], **options)
+                   for csv_file in csv_files)
+    else:
+        # Imported here: multiprocessing adds noticeably to startup and most runs are serial
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(csv_files)))
+        futures = [
+            (executor.submit(_process_csv_file_captured, csv_file, output_base_dir,
+                             dict(options, report_name=report_names[csv_file])), csv_file)
+            for csv_file in csv_files
+        ]
+        results = _print_captured_results(futures, executor, options.get('tracer', NULL_TRACER))
+    
+    for csv_file, success in zip(csv_files, results):
+        report_name = report_names[csv_file]
+        if success:
+            success_count += 1
+            if manifest is not None:
+                outputs = get_report_outputs(output_base_dir, report_name, options.get('formats', DEFAULT_FORMATS))
+                manifest.record(csv_file, report_name, outputs, reusable=reusable)
+        else:
+            failed_count += 1
+            if manifest is not None:
+                manifest.forget(report_name)
+    
+    if manifest is not None:
+        manifest.save()
+    if meeting_index is not None:
+        meeting_index.save()
+    
+    return success_count, failed_count, skipped_count
+
+
+def release_removed_exports(meeting_index: MeetingIndex, csv_files: list, manifest: RunManifest = None) -> list:
+    """
+    Releases the index claims of exports that are no longer among csv_files
+    (deleted or renamed since the last run), so their meetings are counted
+    from the remaining exports again.
+    
+    Returns:
+        The paths of the exports that skipped meetings of a removed export; they
+        are forgotten in the manifest, so their reports are rebuilt
+    """
+    paths = {os.path.basename(csv_file): csv_file for csv_file in csv_files}
+    rebuilt = [paths[source] for source in meeting_index.retain(paths)]
+    if manifest is not None:
+        for csv_file, report_name in get_export_report_names(rebuilt).items():
+            manifest.forget(report_name)
+    return rebuilt
+
+
+def update_store(attendance_db: str, csv_files: list, identity_resolver: IdentityResolver = None,
+                 cache: MeetingCache = None, parse_workers: int = 1, tracer: Tracer = NULL_TRACER):
+    """Loads CSV files into the historical SQLite store; files already stored are skipped."""
+    from attendance_store import AttendanceStore
+    print(f"\n🗄  Updating attendance store: {attendance_db}")
+    with AttendanceStore(attendance_db, identity_resolver=identity_resolver) as store:
+        for csv_file in csv_files:
+            try:
+                with tracer.stage('store', os.path.basename(csv_file)) as stage:
+                    inserted = store.load_file(csv_file, cache=cache, workers=parse_workers)
+                    stage.count(rows=inserted)
+            except Exception as e:
+                print(f"❌ Error storing {csv_file}: {str(e)}")
+                continue
+            if inserted:
+                print(f"✓ Stored {inserted} participant sessions from {os.path.basename(csv_file)}")
+
+
+def watch_input_folder(watcher, output_base_dir: str, manifest: RunManifest, partials: dict,
+                       rollups=(), rolling_months: int = None, attendance_db: str = None,
+                       jobs: int = 1, pipeline_depth: int = 0, **options):
+    """
+    Reprocesses exports as they are added to or changed in the watched
+    folder, until interrupted.
+    
+    Only the reports of files that changed are rebuilt (a touched file whose
+    content is unchanged is skipped via the manifest), and only the rollups
+    those files belong to. The per-file partial aggregates, the manifest and
+    the identity resolver with its bot classifications stay in memory between
+    updates; the meeting cache, if any, is kept on disk as usual.
+    
+    Args:
+        watcher: FolderWatcher for the input folder
+        output_base_dir: Base directory for output files
+        manifest: RunManifest of the reports already built
+        partials: Partial aggregates by report name, updated in place
+        rollups: Calendar rollups to keep up to date ('quarter', 'year', 'all')
+        rolling_months: If set, also keeps the last-N-months rollup up to date
+        attendance_db: Optional SQLite store that changed files are loaded into
+        jobs: Number of worker processes for a batch of changed files
+        pipeline_depth: Files queued between pipeline stages (see process_csv_files)
+        **options: Passed on to process_csv_file (engine, cache, ...)
+    """
+    tracer = options.get('tracer', NULL_TRACER)
+    formats = options.get('formats', DEFAULT_FORMATS)
+    for changed, deleted in watcher.changes():
+        print(f"\n🔄 {len(changed)} new or modified, {len(deleted)} removed "
+              f"({', '.join(os.path.basename(path) for path in changed + deleted)})")
+        rolling_start = get_rolling_start(partials.values(), rolling_months)
+        affected_periods = set()
         
-        print(f"\n{'=' * 60}")
-        print(f"Processing: {filename}")
-        print(f"{'=' * 60}")
+        # Same rule as a regular run: of several copies of one export, only the first in name order counts
+        selected = {export_csv_name(os.path.basename(path)): path
+                    for path in select_exports(_export_paths(watcher.folder))}
+        for csv_file in changed:
+            first = selected.get(export_csv_name(os.path.basename(csv_file)), csv_file)
+            if first != csv_file:
+                print(f"⚠  Ignoring {os.path.basename(csv_file)}: same export as {os.path.basename(first)}")
+        changed = [path for path in changed if path in selected.values()]
+        report_names = get_export_report_names(changed + deleted)
         
-        # Step 1: Read CSV file
-        print(f"📖 Reading data from: {input_file}")
-        reader = ZoomCSVReader(input_file)
-        meetings = reader.read_meetings()
-        print(f"✓ Successfully parsed {len(meetings)} meetings")
+        for csv_file in deleted:
+            if export_csv_name(os.path.basename(csv_file)) in selected:
+                # Another copy of the export is still there and keeps its report
+                print(f"🗑  Removed: {os.path.basename(csv_file)} (another copy of the export remains)")
+                continue
+            # Like a regular run, a removed export's report and partial are kept (see generate_rollups)
+            manifest.forget(report_names[csv_file])
+            print(f"🗑  Removed: {os.path.basename(csv_file)} (its report and rollup contribution are kept)")
         
-        # Step 2: Calculate attendance statistics
-        print("📊 Calculating attendance statistics...")
-        calculator = AttendanceCalculator(meetings)
-        individual_stats = calculator.calculate_individual_attendance()
-        team_stats = calculator.calculate_team_attendance()
-        print(f"✓ Calculated statistics for {len(individual_stats)} participants")
+        meeting_index = options.get('meeting_index')
+        if meeting_index is not None and deleted:
+            # Meetings of a removed export are counted from the exports that skipped them
+            for csv_file in release_removed_exports(meeting_index, selected.values(), manifest):
+                if csv_file not in changed:
+                    print(f"🔁 Rebuilding: {os.path.basename(csv_file)} (it skipped meetings of a removed export)")
+                    changed.append(csv_file)
+            changed.sort()
+            report_names = get_export_report_names(changed + deleted)
         
-        # Step 3: Display summary
-        print("📈 Team Summary:")
-        print(f"  - Total Meetings: {team_stats['total_meetings']}")
-        print(f"  - Total Unique Participants: {team_stats['total_unique_participants']}")
-        print(f"  - Average Attendance: {team_stats['average_attendance_percentage']}%")
-        print(f"  - Avg Participants per Meeting: {team_stats['average_participants_per_meeting']}")
+        success_count, failed_count, skipped_count = process_csv_files(
+            changed, jobs=jobs, output_base_dir=output_base_dir, manifest=manifest,
+            pipeline_depth=pipeline_depth, **options
+        )
         
-        # Step 4: Generate report
-        print(f"📝 Generating report: {output_file}")
-        report_generator = ReportGenerator(output_file)
-        report_generator.generate_report(individual_stats, team_stats)
+        for csv_file in changed:
+            report_name = report_names[csv_file]
+            partial_file = get_partial_file(output_base_dir, report_name)
+            if report_name not in manifest.reports or not os.path.exists(partial_file):
+                continue
+            partial = AttendancePartial.load(partial_file)
+            previous = partials.get(report_name)
+            if previous is not None and previous.to_dict() == partial.to_dict():
+                continue
+            partials[report_name] = partial
+            for changed_partial in (previous, partial):
+                if changed_partial is not None and changed_partial.period_start is not None:
+                    affected_periods.update(get_rollup_periods(changed_partial, rollups, rolling_start))
         
-        # Step 5: Also generate CSV reports
-        print("📝 Generating CSV reports...")
-        report_generator.generate_csv_report(individual_stats, team_stats)
+        if attendance_db and changed:
+            update_store(attendance_db, changed, identity_resolver=options.get('identity_resolver'),
+                         cache=options.get('cache'), parse_workers=options.get('parse_workers', 1),
+                         tracer=tracer)
         
-        print(f"✅ Report generated successfully: {report_name}")
-        return True
+        if rolling_months and get_rolling_start(partials.values(), rolling_months) != rolling_start:
+            # A newer month moved the rolling window
+            affected_periods.add('rolling')
+        rollup_count = 0
+        if affected_periods:
+            with tracer.stage('rollup') as stage:
+                rollup_count = generate_rollups(output_base_dir, rollups, rolling_months,
+                                                xlsx_writer=options.get('xlsx_writer', 'streaming'),
+                                                formats=formats, partials=partials, periods=affected_periods)
+                stage.count(reports=rollup_count)
         
-    except Exception as e:
-        print(f"❌ Error processing {input_file}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+        print(f"✅ Updated: {success_count} report(s), {rollup_count} rollup(s)"
+              + (f", {skipped_count} unchanged" if skipped_count else "")
+              + (f", ❌ {failed_count} failed" if failed_count else ""))
+        sys.stdout.flush()
+
+
+def find_env_file(start_dir: str = None) -> str:
+    """
+    Returns the nearest .env file in start_dir (default: this script's
+    directory) or one of its parents, or None; the same search load_dotenv()
+    does, without importing python-dotenv when there is nothing to load.
+    """
+    directory = os.path.abspath(start_dir or os.path.dirname(os.path.abspath(__file__)))
+    while True:
+        candidate = os.path.join(directory, '.env')
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _run_pipelined(csv_files: list, output_base_dir: str, depth: int, options: dict, report_names: dict):
+    """Runs the files through the read/compute/write pipeline and yields each file's success flag."""
+    from pipeline import run_pipeline
+    
+    results = run_pipeline(
+        csv_files,
+        read=lambda csv_file: read_stage(csv_file, output_base_dir, report_name=report_names[csv_file], **options),
+        compute=lambda job: compute_stage(job, **options),
+        write=lambda job: write_stage(job, **options),
+        on_error=report_file_error,
+        depth=depth,
+    )
+    for _, success, output in results:
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        yield success
+
+
+def _print_captured_results(futures: list, executor: 'ProcessPoolExecutor', tracer: Tracer = NULL_TRACER):
+    """
+    Prints each worker's captured output in input order and yields its success flag.
+    Stage records from the workers are added to the tracer.
+    """
+    with executor:
+        for future, csv_file in futures:
+            try:
+                success, output, records = future.result()
+                tracer.extend(records)
+            except Exception as e:
+                # The worker itself failed (e.g. it was killed); report it like any other failure
+                success, output = False, f"❌ Error processing {csv_file}: {str(e)}\n"
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            yield success
 
 
 def main():
     """
     Main function to process all Zoom attendance CSV files from a folder.
     """
-    # Load environment variables
-    from dotenv import load_dotenv
-    load_dotenv()
+    parser = argparse.ArgumentParser(description='Zoom Attendance Report Generator')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of CSV files to process in parallel; 0 uses all CPUs (default: 1)')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                        help='Processes used to parse each large CSV file in parallel (default: 1)')
+    parser.add_argument('--pipeline-depth', type=int, default=0, metavar='N',
+                        help='With one job, overlap reading, computing and writing of consecutive files '
+                             'in threads, queueing at most N files between stages (default: 0, files are '
+                             'processed one by one)')
+    parser.add_argument('--formats', default=','.join(DEFAULT_FORMATS),
+                        help=f"Comma-separated report formats: {', '.join(REPORT_SINKS)} "
+                             f"(default: {','.join(DEFAULT_FORMATS)})")
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild all reports, even if their inputs are unchanged')
+    parser.add_argument('--presence-threshold', type=float, metavar='FRACTION',
+                        help='Time-weighted attendance: count a meeting as attended only when the person '
+                             'was present for at least this fraction of it, e.g. 0.5')
+    parser.add_argument('--profile', nargs='?', const=os.path.join('output', 'profile_trace.json'),
+                        metavar='TRACE_FILE',
+                        help='Record wall/CPU time, process peak RSS and counts per stage and file, write them '
+                             'as JSON (default: output/profile_trace.json) and print a summary table')
+    parser.add_argument('--profile-stage', choices=['copy', 'read', 'calculate', 'write', 'store', 'rollup'],
+                        help='Also run this stage under cProfile (implies --profile); stats are saved '
+                             'to output/profiles/')
+    parser.add_argument('--rollup', action='append', choices=['quarter', 'year', 'all'], default=[],
+                        help='Also build rollup reports per quarter, per year or over all months '
+                             'from the stored partial aggregates (repeatable)')
+    parser.add_argument('--rolling-months', type=int, metavar='N',
+                        help='Also build a rollup report of the last N months')
+    parser.add_argument('--dedup', action='store_true',
+                        help='Count each meeting (meeting ID + start time) once across all exports: '
+                             'meetings already counted from an earlier file are skipped and reported')
+    parser.add_argument('--dedup-index', metavar='INDEX_FILE',
+                        help='Like --dedup, but keep the index in this file so meetings counted in '
+                             'earlier runs are also skipped')
+    parser.add_argument('--watch', action='store_true',
+                        help='After processing, keep running and reprocess exports as they are added to '
+                             'or changed in the input folder (stop with Ctrl+C)')
+    parser.add_argument('--watch-interval', type=float, default=1.0, metavar='SECONDS',
+                        help='Polling interval when inotify is unavailable (default: 1)')
+    parser.add_argument('--watch-debounce', type=float, default=2.0, metavar='SECONDS',
+                        help='Wait until a file has not changed for this long before processing it, '
+                             'so partially written exports are skipped (default: 2)')
+    args = parser.parse_args()
+    if args.rolling_months is not None and args.rolling_months < 1:
+        parser.error('--rolling-months must be at least 1')
+    if args.pipeline_depth < 0:
+        parser.error('--pipeline-depth must be 0 or more')
+    if args.presence_threshold is not None and not 0 <= args.presence_threshold <= 1:
+        parser.error('--presence-threshold must be between 0 and 1')
+    formats = [format_name.strip() for format_name in args.formats.split(',') if format_name.strip()]
+    unknown_formats = [format_name for format_name in formats if format_name not in REPORT_SINKS]
+    if not formats or unknown_formats:
+        parser.error(f"unknown report format(s): {', '.join(unknown_formats) or '(none given)'}")
+    
+    # Load environment variables (python-dotenv is only imported when there is a .env file)
+    env_file = find_env_file()
+    if env_file:
+        from dotenv import load_dotenv
+        load_dotenv(env_file)
     
     # Input folder - use environment variable if available, otherwise use sample-input
     input_folder = os.getenv('INPUT_FOLDER_PATH', 'sample-input')
@@ -111,38 +819,152 @@ def main():
     # Ensure folder path doesn't have trailing slash for consistency
     input_folder = input_folder.rstrip('/')
     
+    # Attendance engine - 'python' (default) or 'columnar' (pandas/NumPy, for large exports)
+    engine = os.getenv('ATTENDANCE_ENGINE', 'python')
+    if engine not in ('python', 'columnar'):
+        print(f"❌ Error: Unknown ATTENDANCE_ENGINE '{engine}' (expected 'python' or 'columnar')")
+        sys.exit(1)
+    
     print("=" * 60)
     print("Zoom Attendance Report Generator")
     print("=" * 60)
     print(f"\nScanning folder: {input_folder}")
     
-    # Get all CSV files from the input folder
-    csv_files = glob.glob(os.path.join(input_folder, '*.csv'))
+    # Start watching before the first scan so files written during it are not missed
+    watcher = None
+    if args.watch:
+        from folder_watcher import FolderWatcher
+        watcher = FolderWatcher(input_folder, patterns=EXPORT_PATTERNS, interval=args.watch_interval,
+                                debounce=args.watch_debounce)
+    
+    # Get all exports (plain or compressed CSV files) from the input folder
+    csv_files = find_exports(input_folder)
     
-    if not csv_files:
-        print(f"❌ Error: No CSV files found in '{input_folder}'")
+    if not csv_files and watcher is None:
+        print(f"❌ Error: No CSV files (.csv, .csv.gz, .csv.zst or .zip) found in '{input_folder}'")
         sys.exit(1)
     
     print(f"Found {len(csv_files)} CSV file(s) to process\n")
     
-    # Process each CSV file
-    success_count = 0
-    failed_count = 0
+    # Excel writer - 'streaming' (default, constant memory) or 'pandas' (pandas + openpyxl)
+    xlsx_writer = os.getenv('XLSX_WRITER', 'streaming')
+    if xlsx_writer not in ('streaming', 'pandas'):
+        print(f"❌ Error: Unknown XLSX_WRITER '{xlsx_writer}' (expected 'streaming' or 'pandas')")
+        sys.exit(1)
     
-    for csv_file in sorted(csv_files):
-        if process_csv_file(csv_file):
-            success_count += 1
+    # Bot filtering - comma-separated, case-insensitive substrings of email/name
+    bot_patterns = os.getenv('BOT_PATTERNS')
+    bot_patterns = [pattern.strip() for pattern in bot_patterns.split(',')] if bot_patterns else DEFAULT_BOT_PATTERNS
+    identity_resolver = IdentityResolver(bot_patterns)
+    
+    # Parsed meeting cache - optional, enabled by setting MEETING_CACHE_DIR
+    cache = None
+    cache_dir = os.getenv('MEETING_CACHE_DIR')
+    if cache_dir:
+        cache = MeetingCache(
+            cache_dir,
+            max_bytes=int(float(os.getenv('MEETING_CACHE_MAX_MB', '1024')) * 1024 * 1024),
+            max_age_days=float(os.getenv('MEETING_CACHE_MAX_AGE_DAYS', '30'))
+        )
+    
+    # Reports whose input and settings are unchanged since the last run are skipped
+    output_base_dir = 'output'
+    
+    # Per-stage instrumentation - off unless --profile or --profile-stage is given
+    trace_file = args.profile
+    if args.profile_stage and not trace_file:
+        trace_file = os.path.join(output_base_dir, 'profile_trace.json')
+    tracer = NULL_TRACER
+    if trace_file:
+        tracer = Tracer(enabled=True, profile_stage=args.profile_stage,
+                        profile_dir=os.path.join(output_base_dir, 'profiles'))
+    settings = {
+        'engine': engine,
+        'bot_patterns': list(identity_resolver.bot_patterns),
+        'xlsx_writer': xlsx_writer,
+        'formats': formats,
+        'presence_threshold': args.presence_threshold,
+        # Reports deduplicated against a persistent index; in-memory --dedup runs are not reused
+        'dedup': bool(args.dedup_index),
+    }
+    manifest = RunManifest(output_base_dir, TOOL_VERSION, settings)
+    if args.force:
+        manifest.clear()
+    
+    # Cross-file meeting deduplication - optional, in memory or persisted with --dedup-index
+    meeting_index = None
+    if args.dedup_index:
+        meeting_index = MeetingIndex(args.dedup_index)
+        if args.force:
+            meeting_index.clear()
         else:
-            failed_count += 1
+            release_removed_exports(meeting_index, csv_files, manifest)
+    elif args.dedup:
+        # Every file is processed (see process_csv_files); the stored manifest is kept
+        meeting_index = MeetingIndex()
+    
+    # Process each CSV file
+    success_count, failed_count, skipped_count = process_csv_files(
+        sorted(csv_files), jobs=args.jobs, output_base_dir=output_base_dir, manifest=manifest,
+        pipeline_depth=args.pipeline_depth,
+        engine=engine, cache=cache, identity_resolver=identity_resolver,
+        xlsx_writer=xlsx_writer, formats=formats, parse_workers=args.parse_workers,
+        presence_threshold=args.presence_threshold, tracer=tracer,
+        meeting_index=meeting_index
+    )
+    
+    # Historical SQLite store - optional, enabled by setting ATTENDANCE_DB
+    attendance_db = os.getenv('ATTENDANCE_DB')
+    if attendance_db:
+        update_store(attendance_db, sorted(csv_files), identity_resolver=identity_resolver, cache=cache,
+                     parse_workers=args.parse_workers, tracer=tracer)
+    
+    # Multi-month rollups from the stored partials (kept in memory in watch mode)
+    partials = load_partials(output_base_dir) if args.rollup or args.rolling_months or watcher else None
+    rollup_count = 0
+    if args.rollup or args.rolling_months:
+        with tracer.stage('rollup') as stage:
+            rollup_count = generate_rollups(output_base_dir, args.rollup, args.rolling_months,
+                                            xlsx_writer=xlsx_writer, formats=formats, partials=partials)
+            stage.count(reports=rollup_count)
     
     # Final summary
     print(f"\n{'=' * 60}")
     print("Processing Complete")
     print(f"{'=' * 60}")
     print(f"✅ Successfully processed: {success_count} file(s)")
+    if skipped_count > 0:
+        print(f"⏭  Skipped (unchanged): {skipped_count} file(s)")
     if failed_count > 0:
         print(f"❌ Failed: {failed_count} file(s)")
+    if meeting_index is not None and meeting_index.skipped_count() > 0:
+        print(f"⏭  Skipped overlapping meetings: {meeting_index.skipped_count()} (already counted from another file)")
+    if rollup_count > 0:
+        print(f"📅 Rollup reports: {rollup_count}")
     print(f"{'=' * 60}\n")
+    
+    if watcher is not None:
+        print(f"👀 Watching {input_folder} for new or modified exports ({watcher.backend}); press Ctrl+C to stop")
+        sys.stdout.flush()
+        try:
+            watch_input_folder(
+                watcher, output_base_dir, manifest, partials, rollups=args.rollup,
+                rolling_months=args.rolling_months, attendance_db=attendance_db, jobs=args.jobs,
+                pipeline_depth=args.pipeline_depth,
+                engine=engine, cache=cache, identity_resolver=identity_resolver,
+                xlsx_writer=xlsx_writer, formats=formats, parse_workers=args.parse_workers,
+                presence_threshold=args.presence_threshold, tracer=tracer,
+                meeting_index=meeting_index
+            )
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+        finally:
+            watcher.close()
+    
+    if tracer.enabled:
+        tracer.save(trace_file)
+        print(tracer.summary_table())
+        print(f"\n⏱  Profile trace written to: {trace_file}\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""
+Run manifest for skipping reports whose inputs and configuration are unchanged.
+"""
+import os
+import json
+import hashlib
+from typing import List
+
+
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RunManifest:
+    """
+    Records, per report, the input file's content hash, size, mtime and ctime
+    together with the tool version and settings used to build it.
+
+    A report is unchanged when its input, the tool version, the settings and all
+    of its output files match what was recorded, and it was recorded as
+    reusable. Size, mtime and ctime are checked first; the content is only
+    hashed when the times differ from the recorded values. The ctime catches
+    files rewritten with their mtime restored (e.g. by a sync tool), since it
+    cannot be set back.
+    """
+
+    def __init__(self, output_base_dir: str, tool_version: str, settings: dict):
+        self.path = os.path.join(output_base_dir, MANIFEST_FILENAME)
+        self.tool_version = tool_version
+        self.settings = settings
+        self.reports = {}
+        self._load()
+
+    def _load(self):
+        """Loads recorded reports, discarding them if the version or settings differ."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            # A corrupt manifest just means everything is rebuilt
+            return
+        if data.get('tool_version') == self.tool_version and data.get('settings') == self.settings:
+            self.reports = data.get('reports', {})
+
+    def is_unchanged(self, input_file: str, report_name: str) -> bool:
+        """Checks whether a report is up to date with its input file."""
+        entry = self.reports.get(report_name)
+        if entry is None or not entry.get('reusable', True) or entry['input'] != os.path.abspath(input_file):
+            return False
+        if not all(os.path.exists(output) for output in entry['outputs']):
+            return False
+
+        stat = os.stat(input_file)
+        if stat.st_size != entry['size']:
+            return False
+        if stat.st_mtime == entry['mtime'] and stat.st_ctime == entry.get('ctime'):
+            return True
+
+        # Touched or rewritten, but possibly not modified - fall back to the content hash
+        if hash_file(input_file) != entry['sha256']:
+            return False
+        entry['mtime'] = stat.st_mtime
+        entry['ctime'] = stat.st_ctime
+        return True
+
+    def record(self, input_file: str, report_name: str, outputs: List[str], reusable: bool = True):
+        """
+        Records a successfully built report. A report recorded as not reusable
+        (its contents depended on more than its input and settings) is
+        rebuilt by the next run.
+        """
+        stat = os.stat(input_file)
+        entry = self.reports[report_name] = {
+            'input': os.path.abspath(input_file),
+            'sha256': hash_file(input_file),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'ctime': stat.st_ctime,
+            'outputs': [os.path.abspath(output) for output in outputs],
+        }
+        if not reusable:
+            entry['reusable'] = False
+
+    def forget(self, report_name: str):
+        """Removes a report so it is rebuilt on the next run."""
+        self.reports.pop(report_name, None)
+
+    def clear(self):
+        """Forgets all reports so every report is rebuilt."""
+        self.reports = {}
+
+    def save(self):
+        """Writes the manifest atomically."""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {
+            'tool_version': self.tool_version,
+            'settings': self.settings,
+            'reports': self.reports,
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,183 @@
+"""
+On-disk cache of parsed meetings, so unchanged exports are not re-parsed.
+"""
+import os
+import time
+import pickle
+from datetime import datetime
+from typing import List, Optional
+from models import Meeting, Participant, to_epoch_seconds, from_epoch_seconds
+from manifest import hash_file
+
+
+# Bump when the cached layout or the parser's output changes
+CACHE_FORMAT_VERSION = 1
+CACHE_SUFFIX = '.meetings.pkl'
+
+
+def meetings_to_columns(meetings: List[Meeting]) -> dict:
+    """
+    Converts meetings into a compact columnar layout.
+
+    Meeting and participant fields are stored as parallel lists, timestamps as
+    integer seconds since the epoch, and each meeting records how many of the
+    participant rows belong to it.
+    """
+    meeting_columns = {field: [] for field in (
+        'topic', 'meeting_id', 'host_name', 'host_email', 'start_time', 'end_time',
+        'total_participants', 'duration_minutes', 'participant_count'
+    )}
+    participant_columns = {field: [] for field in (
+        'name', 'email', 'join_time', 'leave_time', 'duration_minutes', 'is_guest', 'is_host'
+    )}
+    for meeting in meetings:
+        meeting_columns['topic'].append(meeting.topic)
+        meeting_columns['meeting_id'].append(meeting.meeting_id)
+        meeting_columns['host_name'].append(meeting.host_name)
+        meeting_columns['host_email'].append(meeting.host_email)
+        meeting_columns['start_time'].append(to_epoch_seconds(meeting.start_time))
+        meeting_columns['end_time'].append(to_epoch_seconds(meeting.end_time))
+        meeting_columns['total_participants'].append(meeting.total_participants)
+        meeting_columns['duration_minutes'].append(meeting.duration_minutes)
+        meeting_columns['participant_count'].append(len(meeting.participants))
+        for participant in meeting.participants:
+            participant_columns['name'].append(participant.name)
+            participant_columns['email'].append(participant.email)
+            participant_columns['join_time'].append(to_epoch_seconds(participant.join_time))
+            participant_columns['leave_time'].append(to_epoch_seconds(participant.leave_time))
+            participant_columns['duration_minutes'].append(participant.duration_minutes)
+            participant_columns['is_guest'].append(participant.is_guest)
+            participant_columns['is_host'].append(participant.is_host)
+    return {'meetings': meeting_columns, 'participants': participant_columns}
+
+
+def meetings_from_columns(columns: dict) -> List[Meeting]:
+    """Rebuilds Meeting and Participant objects from meetings_to_columns output."""
+    meeting_columns = columns['meetings']
+    participant_rows = zip(*(columns['participants'][field] for field in (
+        'name', 'email', 'join_time', 'leave_time', 'duration_minutes', 'is_guest', 'is_host'
+    )))
+
+    # Timestamps repeat a lot (meeting start/end, shared leave times), so convert each once
+    datetimes = {}
+
+    def to_datetime(seconds: int) -> datetime:
+        value = datetimes.get(seconds)
+        if value is None:
+            value = datetimes[seconds] = from_epoch_seconds(seconds)
+        return value
+
+    meetings = []
+    for index, participant_count in enumerate(meeting_columns['participant_count']):
+        participants = []
+        for _ in range(participant_count):
+            name, email, join_time, leave_time, duration, is_guest, is_host = next(participant_rows)
+            participants.append(Participant(
+                name=name,
+                email=email,
+                join_time=to_datetime(join_time),
+                leave_time=to_datetime(leave_time),
+                duration_minutes=duration,
+                is_guest=is_guest,
+                is_host=is_host
+            ))
+        meetings.append(Meeting(
+            topic=meeting_columns['topic'][index],
+            meeting_id=meeting_columns['meeting_id'][index],
+            host_name=meeting_columns['host_name'][index],
+            host_email=meeting_columns['host_email'][index],
+            start_time=to_datetime(meeting_columns['start_time'][index]),
+            end_time=to_datetime(meeting_columns['end_time'][index]),
+            total_participants=meeting_columns['total_participants'][index],
+            duration_minutes=meeting_columns['duration_minutes'][index],
+            participants=participants
+        ))
+    return meetings
+
+
+class MeetingCache:
+    """
+    Stores parsed meetings per input file in a compact binary columnar file.
+
+    Entries are keyed on the input's content hash, so any change to the source
+    file invalidates its entry. Entries unused for longer than max_age_days are
+    evicted, and the least recently used entries are evicted once the cache
+    grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024, max_age_days: float = 30):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+
+    def key(self, file_path: str) -> str:
+        """
+        Returns the cache key of a file (its content hash). Reading the whole
+        file is the expensive part of a lookup, so callers that both get and
+        put should compute it once and pass it to both.
+        """
+        return hash_file(file_path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"v{CACHE_FORMAT_VERSION}_{key}{CACHE_SUFFIX}")
+
+    def get(self, file_path: str, key: str = None) -> Optional[List[Meeting]]:
+        """Returns the cached meetings for a file, or None on a miss."""
+        entry_path = self._entry_path(key or self.key(file_path))
+        try:
+            with open(entry_path, 'rb') as file:
+                meetings = meetings_from_columns(pickle.load(file))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated, corrupt or from an incompatible version - drop it and re-parse
+            self._remove(entry_path)
+            return None
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return meetings
+
+    def put(self, file_path: str, meetings: List[Meeting], key: str = None):
+        """Stores parsed meetings for a file and evicts old entries."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_path = self._entry_path(key or self.key(file_path))
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            pickle.dump(meetings_to_columns(meetings), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, entry_path)
+        self.evict()
+
+    def evict(self):
+        """Removes expired entries, then the least recently used ones until under max_bytes."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age_days * 86400:
+                self._remove(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
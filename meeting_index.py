@@ -0,0 +1,177 @@
+"""
+Cross-file index of meeting instances, for skipping meetings already counted from another export.
+"""
+import os
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from models import to_epoch_seconds
+
+
+INDEX_VERSION = 1
+
+MeetingKey = Tuple[str, int]
+
+
+def normalize_meeting_id(meeting_id: str) -> str:
+    """Normalizes a Zoom meeting ID ('812 3456 7890', '812-3456-7890') to its digits."""
+    return ''.join(meeting_id.split()).replace('-', '')
+
+
+def meeting_key(meeting_id: str, start_time: datetime) -> MeetingKey:
+    """Returns the key of one meeting instance: normalized meeting ID and start time in epoch seconds."""
+    return normalize_meeting_id(meeting_id), to_epoch_seconds(start_time)
+
+
+class MeetingIndex:
+    """
+    Records which export each meeting instance was counted from.
+
+    Exports with overlapping date ranges (e.g. a monthly export and an ad-hoc
+    two-week pull) contain the same meetings. The first export to claim a
+    meeting instance, keyed on (normalized meeting ID, start time), owns it;
+    the same meeting in any other export is skipped, so it is aggregated once.
+    Membership is a dict lookup. Reprocessing an export first releases its
+    own claims, so a changed export can be processed again.
+
+    With a path, claims are saved as JSON and loaded again on the next run,
+    so exports processed in earlier runs keep their meetings. Which exports
+    each export skipped meetings of is saved too: when an export is removed,
+    its claims are released and the exports that skipped its meetings must be
+    processed again to count them.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.owners: Dict[MeetingKey, str] = {}
+        self.claims: Dict[str, Set[MeetingKey]] = {}
+        # Per export processed in this run: {owning export: meetings skipped}
+        self.overlaps: Dict[str, Dict[str, int]] = {}
+        # Per export, in this or an earlier run: the exports owning meetings it skipped
+        self.skipped_from: Dict[str, Set[str]] = {}
+        if path:
+            self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            # A corrupt index just means ownership is claimed afresh
+            return
+        if data.get('version') != INDEX_VERSION:
+            return
+        for source, keys in data.get('sources', {}).items():
+            claimed = self.claims.setdefault(source, set())
+            for meeting_id, start in keys:
+                key = (meeting_id, start)
+                self.owners[key] = source
+                claimed.add(key)
+        for source, owners in data.get('skipped_from', {}).items():
+            self.skipped_from[source] = set(owners)
+
+    def __contains__(self, key: MeetingKey) -> bool:
+        return key in self.owners
+
+    def __len__(self) -> int:
+        return len(self.owners)
+
+    def owner(self, key: MeetingKey) -> Optional[str]:
+        """Returns the export that owns a meeting instance, or None."""
+        return self.owners.get(key)
+
+    def release(self, source: str):
+        """Drops all claims of an export (before it is processed again, or once it is removed)."""
+        for key in self.claims.pop(source, ()):
+            if self.owners.get(key) == source:
+                del self.owners[key]
+        self.overlaps.pop(source, None)
+        self.skipped_from.pop(source, None)
+
+    def dependents(self, source: str) -> List[str]:
+        """Returns the exports that skipped meetings because this export owned them."""
+        return sorted(other for other, owners in self.skipped_from.items() if source in owners)
+
+    def retain(self, sources) -> List[str]:
+        """
+        Releases the claims of every export not in sources (e.g. exports
+        deleted or renamed since the last run).
+
+        Returns:
+            The exports in sources that skipped meetings of a released export,
+            which must be processed again to count them
+        """
+        sources = set(sources)
+        removed = (set(self.claims) | set(self.skipped_from)) - sources
+        dependents = set()
+        for source in removed:
+            dependents.update(self.dependents(source))
+            self.release(source)
+        return sorted(dependents & sources)
+
+    def clear(self):
+        """Drops all claims, so every export claims its meetings afresh."""
+        self.owners = {}
+        self.claims = {}
+        self.overlaps = {}
+        self.skipped_from = {}
+
+    def claim(self, key: MeetingKey, source: str) -> Optional[str]:
+        """
+        Claims a meeting instance for an export.
+
+        Returns:
+            None if the export may count the meeting, otherwise the other
+            export that already counted it
+        """
+        owner = self.owners.setdefault(key, source)
+        if owner == source:
+            self.claims.setdefault(source, set()).add(key)
+            return None
+        overlaps = self.overlaps.setdefault(source, {})
+        overlaps[owner] = overlaps.get(owner, 0) + 1
+        self.skipped_from.setdefault(source, set()).add(owner)
+        return owner
+
+    def claim_all(self, keys, source: str) -> List[bool]:
+        """
+        Releases an export's earlier claims and claims its meetings again.
+
+        Returns:
+            Per key, whether the export counts that meeting
+        """
+        self.release(source)
+        return [self.claim(key, source) is None for key in keys]
+
+    def filter_meetings(self, meetings: list, source: str) -> list:
+        """Returns the meetings of an export that no other export has counted."""
+        keep = self.claim_all((meeting_key(meeting.meeting_id, meeting.start_time) for meeting in meetings), source)
+        return [meeting for meeting, kept in zip(meetings, keep) if kept]
+
+    def skipped_summary(self, source: str) -> str:
+        """Describes the meetings of an export that were skipped, or returns '' if none were."""
+        overlaps = self.overlaps.get(source)
+        if not overlaps:
+            return ''
+        return ', '.join(f"{count} already counted from {owner}" for owner, count in sorted(overlaps.items()))
+
+    def skipped_count(self) -> int:
+        """Returns the number of meetings skipped as duplicates in this run."""
+        return sum(sum(overlaps.values()) for overlaps in self.overlaps.values())
+
+    def save(self):
+        """Writes the claims to the index file (no-op without a path)."""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'sources': {source: sorted(keys) for source, keys in sorted(self.claims.items()) if keys},
+            'skipped_from': {source: sorted(owners) for source, owners in sorted(self.skipped_from.items())},
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.path)
@@ -1,14 +1,31 @@
 """
 Data models for representing meeting and participant information.
 """
+import sys
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+from identity import IdentityResolver, default_identity_resolver
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(value: datetime) -> int:
+    """Converts a naive datetime into whole seconds since 1970-01-01."""
+    return int((value - EPOCH).total_seconds())
+
+
+def from_epoch_seconds(seconds: int) -> datetime:
+    """Converts seconds since 1970-01-01 back into a naive datetime."""
+    return EPOCH + timedelta(seconds=seconds)
 
 
 @dataclass
 class Participant:
     """Represents a participant in a meeting."""
+    __slots__ = ('name', 'email', 'join_time', 'leave_time', 'duration_minutes', 'is_guest', 'is_host')
     name: str
     email: Optional[str]
     join_time: datetime
@@ -21,6 +38,8 @@ class Participant:
 @dataclass
 class Meeting:
     """Represents a Zoom meeting with its participants."""
+    __slots__ = ('topic', 'meeting_id', 'host_name', 'host_email', 'start_time', 'end_time',
+                 'total_participants', 'duration_minutes', 'participants')
     topic: str
     meeting_id: str
     host_name: str
@@ -30,17 +49,184 @@ class Meeting:
     total_participants: int
     duration_minutes: int
     participants: list[Participant]
-    
-    def get_unique_participants(self) -> set[str]:
+
+    def get_unique_participants(self, resolver: IdentityResolver = None) -> set[str]:
         """
         Returns a set of unique participant identifiers.
         Uses email if available, otherwise uses name.
+
+        Args:
+            resolver: The run's IdentityResolver, so bots are filtered with its
+                patterns; the shared default_identity_resolver (default
+                patterns) if omitted
         """
+        resolver = resolver or default_identity_resolver
         unique = set()
         for participant in self.participants:
-            identifier = participant.email if participant.email else participant.name
-            # Skip bot participants
-            if 'textalize' not in identifier.lower() and 'bot@' not in identifier.lower():
-                unique.add(identifier)
-        return unique
+            # Bot participants resolve to None
+            identity_id = resolver.resolve(participant)
+            if identity_id is not None:
+                unique.add(identity_id)
+        return {resolver.identifier(identity_id) for identity_id in unique}
+
+
+_GUEST_FLAG = 1
+_HOST_FLAG = 2
+
+
+class MeetingTable:
+    """
+    Compact struct-of-arrays storage for many meetings.
+
+    Instead of one object per participant, each field is kept in its own
+    column: timestamps as epoch-second ints in typed arrays, guest/host flags
+    packed into a bytearray, and names/emails/topics as interned strings so
+    repeated values share one object. Meetings and participants are exposed
+    through lightweight MeetingView/ParticipantView objects with the same
+    attributes as Meeting and Participant, so a table can be passed anywhere
+    a list of meetings is iterated.
+    """
+
+    def __init__(self):
+        # Meeting-level columns
+        self.topics = []
+        self.meeting_ids = []
+        self.host_names = []
+        self.host_emails = []
+        self.start_times = array('q')
+        self.end_times = array('q')
+        self.total_participants = array('q')
+        self.meeting_durations = array('q')
+        # participant_offsets[i]:participant_offsets[i + 1] are meeting i's participants
+        self.participant_offsets = array('q', [0])
+
+        # Participant-level columns
+        self.names = []
+        self.emails = []
+        self.join_times = array('q')
+        self.leave_times = array('q')
+        self.participant_durations = array('q')
+        self.flags = bytearray()
+
+    @classmethod
+    def from_meetings(cls, meetings) -> 'MeetingTable':
+        """Builds a table from an iterable of Meeting objects."""
+        table = cls()
+        for meeting in meetings:
+            table.append(meeting)
+        return table
+
+    def append(self, meeting: Meeting):
+        """Appends a meeting and its participants to the table."""
+        intern = sys.intern
+        self.topics.append(intern(meeting.topic))
+        self.meeting_ids.append(intern(meeting.meeting_id))
+        self.host_names.append(intern(meeting.host_name))
+        self.host_emails.append(intern(meeting.host_email))
+        self.start_times.append(to_epoch_seconds(meeting.start_time))
+        self.end_times.append(to_epoch_seconds(meeting.end_time))
+        self.total_participants.append(meeting.total_participants)
+        self.meeting_durations.append(meeting.duration_minutes)
+        for participant in meeting.participants:
+            self.names.append(intern(participant.name))
+            self.emails.append(intern(participant.email) if participant.email else None)
+            self.join_times.append(to_epoch_seconds(participant.join_time))
+            self.leave_times.append(to_epoch_seconds(participant.leave_time))
+            self.participant_durations.append(participant.duration_minutes)
+            self.flags.append((_GUEST_FLAG if participant.is_guest else 0) |
+                              (_HOST_FLAG if participant.is_host else 0))
+        self.participant_offsets.append(len(self.names))
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def __getitem__(self, index: int) -> 'MeetingView':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('meeting index out of range')
+        return MeetingView(self, index)
+
+    def __iter__(self) -> Iterator['MeetingView']:
+        for index in range(len(self)):
+            yield MeetingView(self, index)
+
+    @property
+    def participant_count(self) -> int:
+        """Total number of participant rows across all meetings."""
+        return len(self.names)
+
+    def to_meetings(self) -> List[Meeting]:
+        """Materializes the table back into Meeting and Participant objects."""
+        return [view.to_meeting() for view in self]
+
+
+class MeetingView:
+    """Read-only view of one meeting in a MeetingTable, with Meeting's attributes."""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: MeetingTable, index: int):
+        self._table = table
+        self._index = index
+
+    topic = property(lambda self: self._table.topics[self._index])
+    meeting_id = property(lambda self: self._table.meeting_ids[self._index])
+    host_name = property(lambda self: self._table.host_names[self._index])
+    host_email = property(lambda self: self._table.host_emails[self._index])
+    start_time = property(lambda self: from_epoch_seconds(self._table.start_times[self._index]))
+    end_time = property(lambda self: from_epoch_seconds(self._table.end_times[self._index]))
+    total_participants = property(lambda self: self._table.total_participants[self._index])
+    duration_minutes = property(lambda self: self._table.meeting_durations[self._index])
+
+    @property
+    def participants(self) -> List['ParticipantView']:
+        offsets = self._table.participant_offsets
+        return [
+            ParticipantView(self._table, row)
+            for row in range(offsets[self._index], offsets[self._index + 1])
+        ]
+
+    get_unique_participants = Meeting.get_unique_participants
+
+    def to_meeting(self) -> Meeting:
+        """Materializes this view into a Meeting object."""
+        return Meeting(
+            topic=self.topic,
+            meeting_id=self.meeting_id,
+            host_name=self.host_name,
+            host_email=self.host_email,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            total_participants=self.total_participants,
+            duration_minutes=self.duration_minutes,
+            participants=[participant.to_participant() for participant in self.participants]
+        )
+
+
+class ParticipantView:
+    """Read-only view of one participant row in a MeetingTable, with Participant's attributes."""
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: MeetingTable, row: int):
+        self._table = table
+        self._row = row
+
+    name = property(lambda self: self._table.names[self._row])
+    email = property(lambda self: self._table.emails[self._row])
+    join_time = property(lambda self: from_epoch_seconds(self._table.join_times[self._row]))
+    leave_time = property(lambda self: from_epoch_seconds(self._table.leave_times[self._row]))
+    duration_minutes = property(lambda self: self._table.participant_durations[self._row])
+    is_guest = property(lambda self: bool(self._table.flags[self._row] & _GUEST_FLAG))
+    is_host = property(lambda self: bool(self._table.flags[self._row] & _HOST_FLAG))
 
+    def to_participant(self) -> Participant:
+        """Materializes this view into a Participant object."""
+        return Participant(
+            name=self.name,
+            email=self.email,
+            join_time=self.join_time,
+            leave_time=self.leave_time,
+            duration_minutes=self.duration_minutes,
+            is_guest=self.is_guest,
+            is_host=self.is_host
+        )
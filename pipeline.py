@@ -0,0 +1,176 @@
+"""
+Three-stage (read -> compute -> write) pipeline over many files, with bounded queues.
+"""
+import io
+import sys
+import queue
+import threading
+import traceback
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Tuple
+
+
+_DONE = object()
+
+
+class ThreadOutput(io.TextIOBase):
+    """
+    Stand-in for sys.stdout/sys.stderr that sends each thread's output to the
+    buffer it is capturing into, or to the original stream otherwise.
+
+    contextlib.redirect_stdout swaps the stream for the whole process, so it
+    cannot keep the output of files processed concurrently in threads apart.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, 'buffer', None) or self.stream
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def writable(self) -> bool:
+        return True
+
+    @contextmanager
+    def capture(self, buffer: io.StringIO):
+        """Sends this thread's output to buffer for the duration of the block."""
+        previous = getattr(self._local, 'buffer', None)
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = previous
+
+
+@contextmanager
+def _captured_output():
+    """Installs ThreadOutput proxies for stdout and stderr; yields their capture function."""
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = ThreadOutput(stdout), ThreadOutput(stderr)
+
+    @contextmanager
+    def capture(buffer):
+        with sys.stdout.capture(buffer), sys.stderr.capture(buffer):
+            yield
+
+    try:
+        yield capture
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+def run_pipeline(items: Iterable, read: Callable, compute: Callable, write: Callable,
+                 on_error: Callable, depth: int = 2) -> Iterator[Tuple[object, bool, str]]:
+    """
+    Runs read(item) -> compute(state) -> write(state) for every item, with
+    the stages overlapping across items.
+
+    A reader thread and a compute thread hand items on through queues that
+    hold at most `depth` items, and writes run on a pool of `depth` threads.
+    A stage that gets ahead blocks on its full queue (backpressure), so at
+    most 2 * depth + 4 items are in flight at once, whatever the number of
+    items. While item N's reports are written, item N + 1 is computed and
+    item N + 2 is read.
+
+    Everything a stage prints is captured per item. A stage that raises an
+    Exception calls on_error(item, exception) (also captured; if on_error
+    itself fails, its traceback is captured instead) and the item's
+    remaining stages are skipped; the other items are not affected. Anything
+    else that goes wrong (iterating items, or a stage raising a
+    BaseException such as SystemExit) stops the pipeline and is re-raised to
+    the caller once the items before it have been yielded. Closing the
+    generator early stops the reader and compute threads.
+
+    Yields:
+        (item, success, captured output) for each item, in input order
+    """
+    depth = max(depth, 1)
+    to_compute = queue.Queue(maxsize=depth)
+    to_collect = queue.Queue(maxsize=depth)
+    cancelled = threading.Event()
+    failures = []
+
+    def put(target: queue.Queue, entry) -> bool:
+        """Puts entry on a queue, giving up (returning False) once the pipeline is cancelled."""
+        while not cancelled.is_set():
+            try:
+                target.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    with _captured_output() as capture, ThreadPoolExecutor(max_workers=depth,
+                                                           thread_name_prefix='pipeline-write') as writers:
+
+        def run_stage(stage, item, buffer, argument):
+            with capture(buffer):
+                try:
+                    return True, stage(argument)
+                except Exception as e:
+                    try:
+                        on_error(item, e)
+                    except BaseException:
+                        traceback.print_exc()
+                    return False, None
+
+        def reader():
+            try:
+                for item in items:
+                    buffer = io.StringIO()
+                    ok, state = run_stage(read, item, buffer, item)
+                    if not put(to_compute, (item, buffer, ok, state)):
+                        return
+            except BaseException as e:
+                failures.append(e)
+            finally:
+                put(to_compute, _DONE)
+
+        def computer():
+            try:
+                while True:
+                    entry = to_compute.get()
+                    if entry is _DONE:
+                        return
+                    item, buffer, ok, state = entry
+                    if ok:
+                        ok, state = run_stage(compute, item, buffer, state)
+                    future = writers.submit(run_stage, write, item, buffer, state) if ok else None
+                    if not put(to_collect, (item, buffer, future)):
+                        return
+            except BaseException as e:
+                failures.append(e)
+            finally:
+                put(to_collect, _DONE)
+
+        threads = [threading.Thread(target=reader, name='pipeline-read', daemon=True),
+                   threading.Thread(target=computer, name='pipeline-compute', daemon=True)]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                entry = to_collect.get()
+                if entry is _DONE:
+                    break
+                item, buffer, future = entry
+                success = future is not None and future.result()[0]
+                yield item, success, buffer.getvalue()
+        finally:
+            cancelled.set()
+            # Unblock a compute thread still waiting for the reader
+            try:
+                to_compute.put_nowait(_DONE)
+            except queue.Full:
+                pass
+            for thread in threads:
+                thread.join()
+        if failures:
+            raise failures[0]
@@ -1,129 +1,290 @@
 """
-Report generator for creating attendance reports in Excel format.
+Report generator for creating attendance reports in Excel, CSV and other formats.
+
+The individual and team tables are built and sorted once, then handed to each
+requested output sink (xlsx, csv, parquet, jsonl). Adding a format means
+registering another sink; it adds no aggregation or sorting work.
 """
-import pandas as pd
-from typing import Dict
+import os
+import csv
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
 from datetime import datetime
+from xlsx_writer import StreamingXlsxWriter
+
+
+INDIVIDUAL_COLUMNS = ['Name', 'Email', 'Meetings Attended', 'Total Meetings', 'Attendance %']
+# Extra individual columns for time-weighted attendance
+PRESENCE_COLUMNS = ['Covered Minutes', 'Presence %']
+TEAM_COLUMNS = ['Metric', 'Value']
+INDIVIDUAL_SHEET = 'Individual Attendance'
+TEAM_SHEET = 'Team Summary'
+DEFAULT_FORMATS = ('xlsx', 'csv')
+
+
+@dataclass
+class ReportTables:
+    """The materialized report: sorted individual rows and team summary rows."""
+    individual_columns: List[str]
+    individual_rows: List[tuple]
+    team_columns: List[str]
+    team_rows: List[tuple]
+
+
+def build_report_tables(individual_stats: Dict[str, dict], team_stats: dict) -> ReportTables:
+    """
+    Builds the individual table (sorted by attendance, descending) and the team table.
+    Time-weighted statistics add covered minutes and presence columns.
+    """
+    time_weighted = 'average_presence_percentage' in team_stats
+    individual_rows = [
+        (
+            stats['name'],
+            stats['email'] if stats['email'] else 'N/A',
+            stats['meetings_attended'],
+            stats['total_meetings'],
+            stats['attendance_percentage']
+        ) + ((stats['covered_minutes'], stats['presence_percentage']) if time_weighted else ())
+        for stats in individual_stats.values()
+    ]
+    # Sort by attendance percentage (descending)
+    individual_rows.sort(key=lambda row: row[4], reverse=True)
+
+    team_rows = [
+        ('Total Meetings', team_stats['total_meetings']),
+        ('Total Unique Participants', team_stats['total_unique_participants']),
+        ('Average Attendance %', f"{team_stats['average_attendance_percentage']}%"),
+        ('Average Participants per Meeting', team_stats['average_participants_per_meeting'])
+    ]
+    individual_columns = INDIVIDUAL_COLUMNS
+    if time_weighted:
+        individual_columns = INDIVIDUAL_COLUMNS + PRESENCE_COLUMNS
+        team_rows += [
+            ('Presence Threshold', f"{team_stats['presence_threshold'] * 100:g}%"),
+            ('Average Presence %', f"{team_stats['average_presence_percentage']}%"),
+        ]
+    return ReportTables(individual_columns, individual_rows, TEAM_COLUMNS, team_rows)
+
+
+# Output format name -> sink class
+REPORT_SINKS = {}
+
+
+def register_sink(name: str):
+    """Class decorator registering a report sink under an output format name."""
+    def decorator(sink_class):
+        sink_class.format_name = name
+        REPORT_SINKS[name] = sink_class
+        return sink_class
+    return decorator
+
+
+class ReportSink(ABC):
+    """Writes materialized ReportTables in one output format."""
+    format_name = None
+    label = None
+
+    @abstractmethod
+    def output_paths(self, base_filename: str) -> List[str]:
+        """Returns the files this sink writes for a report base filename (no extension)."""
+
+    @abstractmethod
+    def write(self, tables: ReportTables, base_filename: str) -> List[str]:
+        """Writes the tables and returns the paths written."""
+
+
+@register_sink('xlsx')
+class XlsxSink(ReportSink):
+    """Excel workbook with 'Individual Attendance' and 'Team Summary' sheets."""
+    label = 'Excel'
+
+    def __init__(self, xlsx_writer: str = 'streaming'):
+        """
+        Args:
+            xlsx_writer: 'streaming' writes the workbook row by row in constant memory;
+                'pandas' uses pandas.ExcelWriter with openpyxl
+        """
+        if xlsx_writer not in ('streaming', 'pandas'):
+            raise ValueError(f"Unknown xlsx writer '{xlsx_writer}' (expected 'streaming' or 'pandas')")
+        self.xlsx_writer = xlsx_writer
+
+    def output_paths(self, base_filename: str) -> List[str]:
+        return [f"{base_filename}.xlsx"]
+
+    def write(self, tables: ReportTables, base_filename: str) -> List[str]:
+        output_filename = self.output_paths(base_filename)[0]
+        sheets = [
+            (INDIVIDUAL_SHEET, tables.individual_columns, tables.individual_rows),
+            (TEAM_SHEET, tables.team_columns, tables.team_rows),
+        ]
+        if self.xlsx_writer == 'streaming':
+            # Rows go straight to disk and column widths are tracked as they are written
+            with StreamingXlsxWriter(output_filename) as writer:
+                for title, columns, rows in sheets:
+                    sheet = writer.add_sheet(title)
+                    sheet.append(columns)
+                    for row in rows:
+                        sheet.append(row)
+        else:
+            import pandas as pd
+            from openpyxl.utils import get_column_letter
+
+            with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+                for title, columns, rows in sheets:
+                    df = pd.DataFrame(rows, columns=columns)
+                    df.to_excel(writer, sheet_name=title, index=False)
+
+                    # Auto-adjust column widths
+                    worksheet = writer.sheets[title]
+                    for idx, col in enumerate(df.columns):
+                        max_length = max(
+                            df[col].astype(str).map(len).max(),
+                            len(col)
+                        ) + 2
+                        worksheet.column_dimensions[get_column_letter(idx + 1)].width = max_length
+        return [output_filename]
+
+
+@register_sink('csv')
+class CsvSink(ReportSink):
+    """Separate CSV files for individual and team data."""
+    label = 'CSV'
+
+    def output_paths(self, base_filename: str) -> List[str]:
+        return [f"{base_filename}_individual.csv", f"{base_filename}_team.csv"]
+
+    def write(self, tables: ReportTables, base_filename: str) -> List[str]:
+        individual_csv, team_csv = self.output_paths(base_filename)
+        for path, columns, rows in (
+            (individual_csv, tables.individual_columns, tables.individual_rows),
+            (team_csv, tables.team_columns, tables.team_rows),
+        ):
+            # Same layout as pandas.DataFrame.to_csv(index=False)
+            with open(path, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file, lineterminator=os.linesep)
+                writer.writerow(columns)
+                writer.writerows(rows)
+        return [individual_csv, team_csv]
+
+
+@register_sink('parquet')
+class ParquetSink(ReportSink):
+    """Parquet files for individual and team data (requires pyarrow)."""
+    label = 'Parquet'
+
+    def output_paths(self, base_filename: str) -> List[str]:
+        return [f"{base_filename}_individual.parquet", f"{base_filename}_team.parquet"]
+
+    def write(self, tables: ReportTables, base_filename: str) -> List[str]:
+        import pandas as pd
+
+        individual_path, team_path = self.output_paths(base_filename)
+        pd.DataFrame(tables.individual_rows, columns=tables.individual_columns).to_parquet(
+            individual_path, index=False
+        )
+        # The team 'Value' column mixes numbers and text, which Parquet cannot store in one column
+        team_rows = [(metric, str(value)) for metric, value in tables.team_rows]
+        pd.DataFrame(team_rows, columns=tables.team_columns).to_parquet(team_path, index=False)
+        return [individual_path, team_path]
+
+
+@register_sink('jsonl')
+class JsonLinesSink(ReportSink):
+    """JSON Lines files (one object per row) for individual and team data."""
+    label = 'JSON Lines'
+
+    def output_paths(self, base_filename: str) -> List[str]:
+        return [f"{base_filename}_individual.jsonl", f"{base_filename}_team.jsonl"]
+
+    def write(self, tables: ReportTables, base_filename: str) -> List[str]:
+        individual_path, team_path = self.output_paths(base_filename)
+        for path, columns, rows in (
+            (individual_path, tables.individual_columns, tables.individual_rows),
+            (team_path, tables.team_columns, tables.team_rows),
+        ):
+            with open(path, 'w', encoding='utf-8') as file:
+                for row in rows:
+                    file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                    file.write('\n')
+        return [individual_path, team_path]
 
 
 class ReportGenerator:
-    """Generates attendance reports in Excel format."""
-    
-    def __init__(self, output_filename: str = None):
+    """Generates attendance reports in Excel, CSV and other registered formats."""
+
+    def __init__(self, output_filename: str = None, xlsx_writer: str = 'streaming'):
+        """
+        Args:
+            output_filename: Path of the Excel report; other formats' names are derived from it
+            xlsx_writer: 'streaming' writes the workbook row by row in constant memory;
+                'pandas' uses pandas.ExcelWriter with openpyxl
+        """
         if output_filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_filename = f'attendance_report_{timestamp}.xlsx'
         self.output_filename = output_filename
-    
+        self.sink_options = {'xlsx': {'xlsx_writer': xlsx_writer}}
+        # Validate the writer choice up front
+        self.create_sink('xlsx')
+
+    @property
+    def base_filename(self) -> str:
+        return self.output_filename[:-len('.xlsx')] if self.output_filename.endswith('.xlsx') else self.output_filename
+
+    def create_sink(self, format_name: str) -> ReportSink:
+        """Creates the registered sink for an output format."""
+        if format_name not in REPORT_SINKS:
+            raise ValueError(f"Unknown report format '{format_name}' (expected one of: {', '.join(REPORT_SINKS)})")
+        return REPORT_SINKS[format_name](**self.sink_options.get(format_name, {}))
+
+    def output_paths(self, formats: Sequence[str] = DEFAULT_FORMATS) -> List[str]:
+        """Returns every file generate() writes for the given formats."""
+        paths = []
+        for format_name in formats:
+            paths.extend(self.create_sink(format_name).output_paths(self.base_filename))
+        return paths
+
+    def generate(self, individual_stats: Dict[str, dict], team_stats: dict,
+                 formats: Sequence[str] = DEFAULT_FORMATS) -> List[str]:
+        """
+        Materializes the report tables once and writes them in every requested format.
+
+        Args:
+            individual_stats: Dictionary of individual attendance statistics
+            team_stats: Dictionary of team-level statistics
+            formats: Output format names (see REPORT_SINKS)
+
+        Returns:
+            Paths of all files written
+        """
+        sinks = [self.create_sink(format_name) for format_name in formats]
+        tables = build_report_tables(individual_stats, team_stats)
+
+        written = []
+        for sink in sinks:
+            paths = sink.write(tables, self.base_filename)
+            print(f"{sink.label} report generated: {', '.join(paths)}")
+            written.extend(paths)
+        return written
+
     def generate_report(self, individual_stats: Dict[str, dict], team_stats: dict):
         """
         Generates an Excel report with individual and team attendance data.
-        
+
         Args:
             individual_stats: Dictionary of individual attendance statistics
             team_stats: Dictionary of team-level statistics
         """
-        # Create Excel writer
-        with pd.ExcelWriter(self.output_filename, engine='openpyxl') as writer:
-            # Generate individual attendance sheet
-            self._create_individual_sheet(writer, individual_stats)
-            
-            # Generate team summary sheet
-            self._create_team_sheet(writer, team_stats)
-        
-        print(f"Report generated successfully: {self.output_filename}")
-    
-    def _create_individual_sheet(self, writer, individual_stats: Dict[str, dict]):
-        """Creates a sheet with individual attendance data."""
-        # Prepare data for DataFrame
-        data = []
-        for identifier, stats in individual_stats.items():
-            data.append({
-                'Name': stats['name'],
-                'Email': stats['email'] if stats['email'] else 'N/A',
-                'Meetings Attended': stats['meetings_attended'],
-                'Total Meetings': stats['total_meetings'],
-                'Attendance %': stats['attendance_percentage']
-            })
-        
-        # Sort by attendance percentage (descending)
-        data.sort(key=lambda x: x['Attendance %'], reverse=True)
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        
-        # Write to Excel
-        df.to_excel(writer, sheet_name='Individual Attendance', index=False)
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets['Individual Attendance']
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).map(len).max(),
-                len(col)
-            ) + 2
-            worksheet.column_dimensions[chr(65 + idx)].width = max_length
-    
-    def _create_team_sheet(self, writer, team_stats: dict):
-        """Creates a sheet with team-level statistics."""
-        # Prepare data for DataFrame
-        data = [
-            {'Metric': 'Total Meetings', 'Value': team_stats['total_meetings']},
-            {'Metric': 'Total Unique Participants', 'Value': team_stats['total_unique_participants']},
-            {'Metric': 'Average Attendance %', 'Value': f"{team_stats['average_attendance_percentage']}%"},
-            {'Metric': 'Average Participants per Meeting', 'Value': team_stats['average_participants_per_meeting']}
-        ]
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        
-        # Write to Excel
-        df.to_excel(writer, sheet_name='Team Summary', index=False)
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets['Team Summary']
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).map(len).max(),
-                len(col)
-            ) + 2
-            worksheet.column_dimensions[chr(65 + idx)].width = max_length
-    
+        self.generate(individual_stats, team_stats, formats=['xlsx'])
+
     def generate_csv_report(self, individual_stats: Dict[str, dict], team_stats: dict):
         """
         Generates CSV reports (separate files for individual and team data).
-        
+
         Args:
             individual_stats: Dictionary of individual attendance statistics
             team_stats: Dictionary of team-level statistics
         """
-        # Generate individual attendance CSV
-        individual_data = []
-        for identifier, stats in individual_stats.items():
-            individual_data.append({
-                'Name': stats['name'],
-                'Email': stats['email'] if stats['email'] else 'N/A',
-                'Meetings Attended': stats['meetings_attended'],
-                'Total Meetings': stats['total_meetings'],
-                'Attendance %': stats['attendance_percentage']
-            })
-        
-        individual_data.sort(key=lambda x: x['Attendance %'], reverse=True)
-        df_individual = pd.DataFrame(individual_data)
-        individual_csv = self.output_filename.replace('.xlsx', '_individual.csv')
-        df_individual.to_csv(individual_csv, index=False)
-        
-        # Generate team summary CSV
-        team_data = [
-            {'Metric': 'Total Meetings', 'Value': team_stats['total_meetings']},
-            {'Metric': 'Total Unique Participants', 'Value': team_stats['total_unique_participants']},
-            {'Metric': 'Average Attendance %', 'Value': f"{team_stats['average_attendance_percentage']}%"},
-            {'Metric': 'Average Participants per Meeting', 'Value': team_stats['average_participants_per_meeting']}
-        ]
-        
-        df_team = pd.DataFrame(team_data)
-        team_csv = self.output_filename.replace('.xlsx', '_team.csv')
-        df_team.to_csv(team_csv, index=False)
-        
-        print(f"CSV reports generated: {individual_csv}, {team_csv}")
-
+        self.generate(individual_stats, team_stats, formats=['csv'])
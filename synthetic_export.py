@@ -0,0 +1,157 @@
+"""
+Deterministic generator of realistic synthetic Zoom meeting exports.
+
+Usage:
+    python synthetic_export.py --meetings 500 --participants 40 --output-dir synthetic-input
+"""
+import os
+import random
+import argparse
+from datetime import date, datetime, timedelta
+from timestamp_parser import ZOOM_DATETIME_FORMAT
+
+
+# The exact Zoom "meeting list details" layout, including the repeated 'Duration (minutes)'
+HEADER = [
+    'Topic', 'Type', 'ID', 'Host name', 'Host email', 'Start time', 'End time',
+    'Participants', 'Duration (minutes)', 'Total participant minutes', 'Department',
+    'Group', 'Source', 'Unique viewers', 'Max concurrent views', 'Creation time',
+    'Name (original name)', 'Email', 'Join time', 'Leave time', 'Duration (minutes)',
+    'Guest', 'Recording disclaimer response', 'In waiting room'
+]
+
+TOPICS = ['Team Sync', 'Sprint Planning', 'Design Review', 'Retro, weekly', '1:1 "catch-up"']
+BOTS = [('Textalize AI', 'bot@textalize.ai'), ('Notetaker', 'notes-bot@example.com')]
+FIRST_NAMES = ['Sara', 'Clark', 'Paul', 'Maria', 'Chen', 'Aisha', 'Lukas', 'Priya', 'Diego', 'Yuki',
+               'Omar', 'Ingrid', 'Kwame', 'Sofia', 'Ravi', 'Elena', 'Tomas', 'Nora', 'Jin', 'Amara']
+
+
+def _quote(value: str) -> str:
+    """Quotes a CSV field when needed (Zoom quotes all timestamps regardless)."""
+    if any(character in value for character in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _timestamp(value: datetime) -> str:
+    return f'"{value.strftime(ZOOM_DATETIME_FORMAT)}"'
+
+
+def export_filename(start: date, end: date) -> str:
+    """Returns the Zoom export filename for a date range, e.g. meetinglistdetails_2025_06_01_2025_06_30.csv."""
+    return f"meetinglistdetails_{start:%Y_%m_%d}_{end:%Y_%m_%d}.csv"
+
+
+def generate_export(path: str, meetings: int = 100, participants: int = 20, seed: int = 0,
+                    start: date = date(2025, 6, 1), days: int = 30, roster_size: int = None,
+                    absence_rate: float = 0.15, bot_rate: float = 0.7, guest_rate: float = 0.3,
+                    no_email_rate: float = 0.2, rejoin_rate: float = 0.1) -> dict:
+    """
+    Writes a synthetic Zoom export. The same arguments always produce the same file.
+
+    Meetings are spread over `days` days from `start` and written newest first,
+    each followed by a blank line, like real exports. Every meeting invites
+    `participants` people from a fixed roster (roster_size, default
+    participants * 3 // 2), some of whom are absent; the host row carries the
+    '(Host)' suffix. Bots, guests, people without an email (identified by
+    name), rejoins (a second session after a gap, or an overlapping one from a
+    second device) and topics that need CSV quoting are mixed in at the given
+    rates.
+
+    Returns:
+        Dictionary with the number of meetings and participant rows written
+    """
+    rng = random.Random(seed)
+    roster_size = max(roster_size or participants * 3 // 2, 2)
+    roster = []
+    for index in range(roster_size):
+        name = f"{FIRST_NAMES[index % len(FIRST_NAMES)]} {index // len(FIRST_NAMES) + 1}"
+        email = None if rng.random() < no_email_rate else f"user{index + 1}@example.com"
+        roster.append((name, email, rng.random() < guest_rate))
+    # The host always has an email
+    host_name = roster[0][0]
+    host_email = "user1@example.com"
+    roster[0] = (host_name, host_email, False)
+    meeting_ids = [f"8{rng.randrange(10, 100)} {rng.randrange(1000, 10000)} {rng.randrange(1000, 10000)}"
+                   for _ in TOPICS]
+    creation_time = _timestamp(datetime(2023, 9, 11, 11, 42, 10))
+
+    starts = sorted(
+        (datetime(start.year, start.month, start.day, rng.choice((9, 10, 14, 16)), rng.randrange(60))
+         + timedelta(days=rng.randrange(max(days, 1)), seconds=rng.randrange(60))
+         for _ in range(meetings)),
+        reverse=True
+    )
+
+    rows = 0
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        file.write(','.join(HEADER) + '\n')
+        for meeting_start in starts:
+            topic_index = rng.randrange(len(TOPICS))
+            length = rng.randint(15, 60)
+            meeting_end = meeting_start + timedelta(minutes=length, seconds=rng.randrange(60))
+
+            invited = rng.sample(roster[1:], min(participants, len(roster)) - 1)
+            attendees = [roster[0]] + [person for person in invited if rng.random() >= absence_rate]
+            sessions = []
+            for name, email, guest in attendees:
+                is_host = name == host_name
+                join = meeting_start + timedelta(seconds=0 if is_host else rng.randrange(300))
+                leave = meeting_end - timedelta(seconds=rng.randrange(240))
+                display = f"{name} (Host)" if is_host else name
+                if rng.random() < rejoin_rate and leave - join > timedelta(minutes=10):
+                    split = join + (leave - join) * rng.uniform(0.3, 0.7)
+                    if rng.random() < 0.5:
+                        # Dropped and rejoined after a gap
+                        sessions.append((display, email, guest, join, split))
+                        sessions.append((display, email, guest, split + timedelta(seconds=rng.randrange(30, 300)),
+                                         leave))
+                    else:
+                        # Joined again from a second device while still connected
+                        sessions.append((display, email, guest, join, leave))
+                        sessions.append((display, email, guest, split, leave))
+                else:
+                    sessions.append((display, email, guest, join, leave))
+            if rng.random() < bot_rate:
+                bot_name, bot_email = BOTS[rng.randrange(len(BOTS))]
+                sessions.insert(0, (bot_name, bot_email, False, meeting_start, meeting_end))
+
+            durations = [max(round((leave - join).total_seconds() / 60), 1) for *_, join, leave in sessions]
+            meeting_fields = ','.join([
+                _quote(TOPICS[topic_index]), 'Meeting', meeting_ids[topic_index], host_name.split()[0], host_email,
+                _timestamp(meeting_start), _timestamp(meeting_end),
+                str(len({email or name for name, email, *_ in sessions})),
+                str(round((meeting_end - meeting_start).total_seconds() / 60)), str(sum(durations)),
+                'Engineering', 'Licensed', 'Google Workspace', '-', '-', creation_time,
+            ])
+            for (name, email, guest, join, leave), duration in zip(sessions, durations):
+                file.write(','.join([
+                    meeting_fields, _quote(name), email or '', _timestamp(join), _timestamp(leave),
+                    str(duration), 'Yes' if guest else 'No', '', 'No',
+                ]) + '\n')
+            rows += len(sessions)
+            file.write('\n')
+    return {'meetings': meetings, 'rows': rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a deterministic synthetic Zoom export')
+    parser.add_argument('--meetings', type=int, default=100)
+    parser.add_argument('--participants', type=int, default=20, help='People invited to each meeting')
+    parser.add_argument('--roster-size', type=int, help='Distinct people (default: 1.5x participants)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--start', type=date.fromisoformat, default=date(2025, 6, 1), help='First day (YYYY-MM-DD)')
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--output-dir', default='synthetic-input')
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    path = os.path.join(args.output_dir,
+                        export_filename(args.start, args.start + timedelta(days=max(args.days, 1) - 1)))
+    stats = generate_export(path, meetings=args.meetings, participants=args.participants, seed=args.seed,
+                            start=args.start, days=args.days, roster_size=args.roster_size)
+    print(f"Wrote {path}: {stats['meetings']} meetings, {stats['rows']} participant rows")
+
+
+if __name__ == "__main__":
+    main()
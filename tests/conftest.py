@@ -0,0 +1,16 @@
+"""
+Shared pytest setup: makes the application modules in the repository root importable.
+"""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def sample_input() -> str:
+    """Path of the bundled sample-input/ folder (May and June 2025 exports)."""
+    return os.path.join(REPO_ROOT, 'sample-input')
@@ -0,0 +1,100 @@
+"""
+Tests for AttendanceCalculator's single-pass aggregate cache.
+"""
+import copy
+import os
+
+import pytest
+
+from attendance_calculator import AttendanceCalculator
+from csv_reader import ZoomCSVReader
+
+
+@pytest.fixture
+def meetings(sample_input):
+    return ZoomCSVReader(os.path.join(sample_input, 'meetinglistdetails_2025_06_01_2025_06_30.csv')).read_meetings()
+
+
+def test_statistics_share_one_pass(meetings):
+    calculator = AttendanceCalculator(meetings)
+
+    calculator.calculate_individual_attendance()
+    calculator.calculate_team_attendance()
+    calculator._count_real_meetings()
+    calculator.partial_aggregate()
+
+    assert calculator.pass_count == 1
+
+
+def test_invalidate_cache_forces_a_new_pass(meetings):
+    calculator = AttendanceCalculator(meetings)
+    calculator.calculate_team_attendance()
+
+    calculator.invalidate_cache()
+    calculator.calculate_individual_attendance()
+    calculator.calculate_team_attendance()
+
+    assert calculator.pass_count == 2
+
+
+def test_reassigning_meetings_forces_a_new_pass(meetings):
+    calculator = AttendanceCalculator(meetings)
+    first = calculator.calculate_team_attendance()
+
+    calculator.meetings = meetings[:1]
+    second = calculator.calculate_team_attendance()
+
+    assert calculator.pass_count == 2
+    assert second['total_meetings'] <= 1 < first['total_meetings']
+
+
+def test_adding_a_meeting_forces_a_new_pass(meetings):
+    calculator = AttendanceCalculator(list(meetings[1:]))
+    calculator.calculate_team_attendance()
+
+    calculator.meetings.append(meetings[0])
+    calculator.calculate_team_attendance()
+
+    assert calculator.pass_count == 2
+
+
+def test_same_length_edit_forces_a_new_pass(meetings):
+    calculator = AttendanceCalculator(list(meetings))
+    first = calculator.calculate_team_attendance()
+
+    # Replacing a meeting keeps the length, but not the meeting objects
+    calculator.meetings[0] = calculator.meetings[-1]
+    second = calculator.calculate_team_attendance()
+
+    assert calculator.pass_count == 2
+    assert second == AttendanceCalculator(calculator.meetings).calculate_team_attendance()
+    assert second != first
+
+
+def test_editing_a_meeting_forces_a_new_pass(meetings):
+    meetings = copy.deepcopy(meetings)
+    calculator = AttendanceCalculator(meetings)
+    calculator.calculate_individual_attendance()
+
+    removed = meetings[0].participants.pop()
+    calculator.calculate_individual_attendance()
+    meetings[0].participants.append(removed)
+    calculator.calculate_individual_attendance()
+    meetings[1].participants = meetings[1].participants[:1]
+    calculator.calculate_individual_attendance()
+    meetings[2].start_time = meetings[2].end_time
+    individual = calculator.calculate_individual_attendance()
+
+    assert calculator.pass_count == 5
+    assert individual == AttendanceCalculator(meetings).calculate_individual_attendance()
+
+
+def test_unchanged_meetings_reuse_the_cache(meetings):
+    calculator = AttendanceCalculator(list(meetings))
+    calculator.calculate_team_attendance()
+
+    calculator.meetings = calculator.meetings
+    calculator.calculate_team_attendance()
+    calculator.calculate_team_attendance()
+
+    assert calculator.pass_count == 2
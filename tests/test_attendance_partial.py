@@ -0,0 +1,88 @@
+"""
+Tests for mergeable partial aggregates: merged partials must match a from-scratch computation.
+"""
+import os
+
+import pytest
+
+from attendance_calculator import AttendanceCalculator, AttendancePartial
+from csv_reader import ZoomCSVReader
+
+
+@pytest.fixture
+def meetings(sample_input):
+    return ZoomCSVReader(os.path.join(sample_input, 'meetinglistdetails_2025_06_01_2025_06_30.csv')).read_meetings()
+
+
+def split_partials(meetings, presence_threshold=None):
+    """Partials of three consecutive slices of the meetings, like three exports of one period."""
+    bounds = [0, len(meetings) // 4, len(meetings) // 2, len(meetings)]
+    return [
+        AttendanceCalculator(meetings[start:end], presence_threshold=presence_threshold).partial_aggregate(f"part{index}")
+        for index, (start, end) in enumerate(zip(bounds, bounds[1:]))
+    ]
+
+
+@pytest.mark.parametrize('presence_threshold', [None, 0.5])
+@pytest.mark.parametrize('order', [(0, 1, 2), (2, 1, 0), (1, 2, 0)])
+def test_merged_partials_match_a_full_computation(meetings, presence_threshold, order):
+    full = AttendanceCalculator(meetings, presence_threshold=presence_threshold)
+    partials = split_partials(meetings, presence_threshold)
+
+    merged = AttendancePartial.merge_all(partials[index] for index in order)
+
+    individual_stats = merged.individual_stats()
+    assert individual_stats == full.calculate_individual_attendance()
+    assert merged.team_stats(individual_stats) == full.calculate_team_attendance()
+    assert merged.sources == [f"part{index}" for index in order]
+    assert (merged.period_start, merged.period_end) == (full.partial_aggregate().period_start,
+                                                        full.partial_aggregate().period_end)
+
+
+def test_merge_is_associative_in_file_order(meetings):
+    first, second, third = split_partials(meetings)
+    full = AttendanceCalculator(meetings).partial_aggregate()
+
+    for merged in (first.merge(second).merge(third), first.merge(second.merge(third))):
+        # Identical down to the first-appearance order of the participants
+        assert list(merged.participants.items()) == list(full.participants.items())
+        assert merged.to_dict() == dict(full.to_dict(), sources=['part0', 'part1', 'part2'])
+
+
+def test_merging_does_not_modify_the_partials(meetings):
+    partials = split_partials(meetings)
+    before = [partial.to_dict() for partial in partials]
+
+    AttendancePartial.merge_all(partials)
+    partials[0].merge(partials[1])
+
+    assert [partial.to_dict() for partial in partials] == before
+
+
+@pytest.mark.parametrize('presence_threshold', [None, 0.5])
+def test_partial_round_trips_through_dict_and_file(meetings, tmp_path, presence_threshold):
+    partial = AttendanceCalculator(meetings, presence_threshold=presence_threshold).partial_aggregate('june.csv')
+
+    assert AttendancePartial.from_dict(partial.to_dict()) == partial
+    path = str(tmp_path / 'june.json')
+    partial.save(path)
+    loaded = AttendancePartial.load(path)
+    assert loaded == partial
+    assert list(loaded.participants) == list(partial.participants)
+
+
+def test_partials_with_different_thresholds_do_not_merge(meetings):
+    plain = AttendanceCalculator(meetings).partial_aggregate()
+    weighted = AttendanceCalculator(meetings, presence_threshold=0.5).partial_aggregate()
+
+    with pytest.raises(ValueError, match='different presence thresholds'):
+        plain.merge(weighted)
+    with pytest.raises(ValueError, match='different presence thresholds'):
+        AttendancePartial.merge_all([weighted, plain])
+
+
+def test_merging_nothing_gives_an_empty_partial():
+    merged = AttendancePartial.merge_all([])
+
+    assert merged.individual_stats() == {}
+    assert merged.team_stats()['total_meetings'] == 0
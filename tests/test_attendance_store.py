@@ -0,0 +1,85 @@
+"""
+Tests for the SQLite attendance store.
+"""
+import os
+import re
+import shutil
+import sqlite3
+
+import pytest
+
+from attendance_calculator import AttendanceCalculator
+from attendance_store import AttendanceStore
+from csv_reader import ZoomCSVReader
+from synthetic_export import generate_export
+
+JUNE = 'meetinglistdetails_2025_06_01_2025_06_30.csv'
+
+
+@pytest.fixture
+def june(tmp_path, sample_input):
+    return shutil.copy(os.path.join(sample_input, JUNE), tmp_path / JUNE)
+
+
+def write_with_dashed_ids(source: str, path: str):
+    """Copies an export, writing its meeting IDs as 822-3106-6070 instead of 822 3106 6070."""
+    with open(source, encoding='utf-8') as file:
+        text = file.read()
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(re.sub(r',(\d{3}) (\d{4}) (\d{4}),', r',\1-\2-\3,', text))
+
+
+def meeting_ids(path):
+    return {meeting.meeting_id for meeting in ZoomCSVReader(path).read_meetings()}
+
+
+def expected_attendance(path):
+    calculator = AttendanceCalculator(ZoomCSVReader(path).read_meetings())
+    return calculator.calculate_individual_attendance(), calculator.calculate_team_attendance()
+
+
+def test_meeting_ids_are_normalized(tmp_path, june):
+    dashed = str(tmp_path / 'meetinglistdetails_2025_06_10_2025_06_24.csv')
+    write_with_dashed_ids(june, dashed)
+
+    with AttendanceStore(str(tmp_path / 'attendance.db')) as store:
+        store.load_file(june)
+        store.load_file(dashed)
+        assert {meeting.meeting_id for meeting in store.meetings()} == meeting_ids(june)
+        # The same meetings under a differently formatted ID are counted once
+        assert store.attendance() == expected_attendance(june)
+
+
+def test_version_1_database_is_upgraded(tmp_path, june):
+    db_path = str(tmp_path / 'attendance.db')
+    dashed = str(tmp_path / 'meetinglistdetails_2025_06_10_2025_06_24.csv')
+    write_with_dashed_ids(june, dashed)
+    with AttendanceStore(db_path) as store:
+        store.load_file(dashed)
+    connection = sqlite3.connect(db_path)
+    with connection:
+        connection.execute("UPDATE meetings SET meeting_id = "
+                           "substr(meeting_id, 1, 3) || '-' || substr(meeting_id, 4, 4) || '-' || substr(meeting_id, 8)")
+        connection.execute('PRAGMA user_version=1')
+    connection.close()
+
+    with AttendanceStore(db_path) as store:
+        assert {meeting.meeting_id for meeting in store.meetings()} == meeting_ids(june)
+        store.load_file(june)
+        assert store.attendance() == expected_attendance(june)
+
+
+def test_path_changed_to_contents_of_another_file_drops_its_old_meetings(tmp_path, june):
+    copy = str(tmp_path / 'export_copy.csv')
+    generate_export(copy, meetings=20, participants=5)
+
+    with AttendanceStore(str(tmp_path / 'attendance.db')) as store:
+        store.load_file(june)
+        assert store.load_file(copy) > 0
+        # The copy is overwritten with June's export, which is already loaded from another path
+        shutil.copy(june, copy)
+        assert store.load_file(copy) == 0
+
+        assert store.attendance() == expected_attendance(june)
+        paths = [row[0] for row in store.connection.execute('SELECT path FROM files')]
+        assert paths == [os.path.abspath(june)]
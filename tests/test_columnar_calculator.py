@@ -0,0 +1,88 @@
+"""
+Parity tests: the columnar engine must match AttendanceCalculator exactly.
+"""
+import os
+from datetime import date
+
+import pytest
+
+from attendance_calculator import AttendanceCalculator
+from columnar_calculator import ColumnarAttendanceCalculator
+from csv_reader import ZoomCSVReader
+from identity import IdentityResolver
+from meeting_index import MeetingIndex
+from synthetic_export import generate_export
+
+THRESHOLDS = [None, 0.5, 0.9]
+
+
+def assert_parity(expected, actual):
+    expected_individual = expected.calculate_individual_attendance()
+    # Same identities, values and first-appearance order
+    assert list(actual.calculate_individual_attendance().items()) == list(expected_individual.items())
+    assert actual.calculate_team_attendance() == expected.calculate_team_attendance()
+    assert actual.partial_aggregate('x').to_dict() == expected.partial_aggregate('x').to_dict()
+
+
+@pytest.fixture(scope='module')
+def synthetic_exports(tmp_path_factory):
+    """
+    Realistic exports with bots, guests, missing emails and rejoins: a month,
+    a later month, and a pull that repeats every other meeting of the first
+    next to meetings of its own.
+    """
+    folder = tmp_path_factory.mktemp('exports')
+    paths = [str(folder / f'meetinglistdetails_synthetic_{name}.csv') for name in ('june', 'july', 'pull', 'other')]
+    for seed, path, start in [(1, paths[0], date(2025, 6, 1)), (2, paths[1], date(2025, 7, 1)),
+                              (3, paths[3], date(2025, 6, 1))]:
+        generate_export(path, meetings=60, participants=12, seed=seed, start=start, rejoin_rate=0.3)
+    blocks = []
+    for path in (paths[0], paths[3]):
+        with open(path, encoding='utf-8', newline='') as file:
+            header, body = file.read().split('\n', 1)
+        blocks.append(body.split('\n\n'))
+    with open(paths[2], 'w', encoding='utf-8', newline='') as file:
+        file.write(header + '\n' + '\n\n'.join(blocks[0][::2] + blocks[1][:10]))
+    return paths[:3]
+
+
+def export_paths(sample_input, synthetic_exports):
+    return [os.path.join(sample_input, name) for name in sorted(os.listdir(sample_input))] + synthetic_exports
+
+
+@pytest.mark.parametrize('threshold', THRESHOLDS)
+def test_engines_match(sample_input, synthetic_exports, threshold):
+    for path in export_paths(sample_input, synthetic_exports):
+        expected = AttendanceCalculator(ZoomCSVReader(path).read_meetings(), presence_threshold=threshold)
+
+        assert_parity(expected, ColumnarAttendanceCalculator.from_csv(path, presence_threshold=threshold))
+        assert_parity(expected, ColumnarAttendanceCalculator.from_meetings(
+            expected.meetings, presence_threshold=threshold
+        ))
+
+
+@pytest.mark.parametrize('threshold', [None, 0.5])
+def test_engines_match_with_custom_bot_patterns(synthetic_exports, threshold):
+    path = synthetic_exports[0]
+    patterns = ('textalize', 'notes-bot', 'user1@')
+    expected = AttendanceCalculator(ZoomCSVReader(path).read_meetings(), identity_resolver=IdentityResolver(patterns),
+                                    presence_threshold=threshold)
+    actual = ColumnarAttendanceCalculator.from_csv(path, identity_resolver=IdentityResolver(patterns),
+                                                   presence_threshold=threshold)
+    assert_parity(expected, actual)
+
+
+@pytest.mark.parametrize('threshold', [None, 0.5])
+def test_engines_match_after_deduplication(synthetic_exports, threshold):
+    python_index, columnar_index = MeetingIndex(), MeetingIndex()
+    for path in synthetic_exports:
+        source = os.path.basename(path)
+        meetings = python_index.filter_meetings(ZoomCSVReader(path).read_meetings(), source)
+        expected = AttendanceCalculator(meetings, presence_threshold=threshold)
+        actual = ColumnarAttendanceCalculator.from_csv(path, presence_threshold=threshold)
+        actual.deduplicate(columnar_index, source)
+
+        assert_parity(expected, actual)
+        assert columnar_index.skipped_summary(source) == python_index.skipped_summary(source)
+    # The overlapping pull's repeated meetings were counted from the first export only
+    assert python_index.skipped_count() == 30
@@ -0,0 +1,82 @@
+"""
+Tests for ZoomCSVReader: streaming parsing and single-file parallel parsing.
+"""
+import csv
+from datetime import datetime, timedelta
+
+import pytest
+
+from csv_reader import ZoomCSVReader, _BLANK_LINE, _count_quotes
+from synthetic_export import HEADER
+from timestamp_parser import ZOOM_DATETIME_FORMAT
+
+
+# Quoted values with embedded line breaks and blank lines, which look like meeting separators
+MULTILINE_TOPIC = 'Retro\n\nWhat went well:\n\n\n- shipping "on time"\n\nNext steps'
+MULTILINE_NAME = 'Sara\n\nSmith'
+
+
+def write_multiline_export(path: str, meetings: int = 40, participants: int = 6):
+    """Writes an export whose topics and some names are quoted fields containing blank lines."""
+    start = datetime(2025, 6, 2, 9, 0, 0)
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, lineterminator='\n')
+        writer.writerow(HEADER)
+        for m in range(meetings):
+            meeting_start = start + timedelta(days=m)
+            meeting_end = meeting_start + timedelta(minutes=45)
+            for p in range(participants):
+                name = MULTILINE_NAME if p == 1 else f'Person {p}' + (' (Host)' if p == 0 else '')
+                writer.writerow([
+                    f'{MULTILINE_TOPIC} #{m}', 'Meeting', f'822 3106 {6000 + m % 3}', 'Person', 'user0@example.com',
+                    meeting_start.strftime(ZOOM_DATETIME_FORMAT), meeting_end.strftime(ZOOM_DATETIME_FORMAT),
+                    participants, 45, 45 * participants, 'Engineering', 'Licensed',
+                    'Google Workspace', '-', '-', '09/11/2023 11:42:10 AM',
+                    name, f'user{p}@example.com' if p != 2 else '',
+                    (meeting_start + timedelta(seconds=p)).strftime(ZOOM_DATETIME_FORMAT),
+                    meeting_end.strftime(ZOOM_DATETIME_FORMAT), 45, 'No', '', 'No'
+                ])
+            file.write('\n')
+
+
+@pytest.fixture
+def multiline_export(tmp_path):
+    path = str(tmp_path / 'meetinglistdetails_2025_06_01_2025_07_31.csv')
+    write_multiline_export(path)
+    return path
+
+
+def test_iter_meetings_keeps_quoted_blank_lines(multiline_export):
+    meetings = list(ZoomCSVReader(multiline_export).iter_meetings())
+
+    assert len(meetings) == 40
+    assert meetings[0].topic == f'{MULTILINE_TOPIC} #0'
+    assert [len(meeting.participants) for meeting in meetings] == [6] * 40
+    assert meetings[0].participants[1].name == MULTILINE_NAME
+    assert meetings[0].participants[2].email is None
+
+
+@pytest.mark.parametrize('workers', [2, 3, 5])
+def test_parallel_reader_matches_serial_with_quoted_newlines(multiline_export, workers):
+    reader = ZoomCSVReader(multiline_export)
+    reader.MIN_PARALLEL_CHUNK_BYTES = 1
+    serial = list(reader.iter_meetings())
+
+    chunk_count = workers * 4
+    header, ranges = reader._split_into_ranges(chunk_count)
+    with open(multiline_export, 'rb') as file:
+        data = file.read()
+    data_start = data.index(b'\n') + 1
+    # The positions _split_into_ranges starts searching for a blank line from
+    targets = [data_start + (len(data) - data_start) * index // chunk_count for index in range(1, chunk_count)]
+    # At least one split point lands inside a quoted field, where the first blank line is not a boundary
+    assert any(_count_quotes(data, 0, target) % 2 == 1 for target in targets)
+    assert any(_count_quotes(data, 0, _BLANK_LINE.search(data, target).start()) % 2 == 1 for target in targets)
+    # ...and every range still starts right after a meeting's blank line, outside quotes
+    assert header == HEADER
+    assert len(ranges) > 1
+    for start, _ in ranges[1:]:
+        assert data[start - 2:start] == b'\n\n'
+        assert _count_quotes(data, 0, start) % 2 == 0
+
+    assert reader.read_meetings_parallel(workers) == serial
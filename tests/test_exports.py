@@ -0,0 +1,56 @@
+"""
+Tests for finding exports, including compressed copies of the same export.
+"""
+import gzip
+import os
+import shutil
+
+from main import TOOL_VERSION, find_exports, select_exports, watch_input_folder
+from manifest import RunManifest
+
+JUNE = 'meetinglistdetails_2025_06_01_2025_06_30.csv'
+
+
+class FakeWatcher:
+    """Stands in for FolderWatcher, reporting the given batches of changes."""
+
+    def __init__(self, folder, batches):
+        self.folder = folder
+        self.batches = batches
+
+    def changes(self):
+        yield from self.batches
+
+
+def test_first_copy_of_an_export_is_selected(tmp_path):
+    names = [JUNE + '.gz', 'meetinglistdetails_2025_05_01_2025_05_31.zip', JUNE,
+             'meetinglistdetails_2025_05_01_2025_05_31.csv.zst', 'notes.txt']
+    for name in names:
+        (tmp_path / name).write_bytes(b'')
+
+    assert [os.path.basename(path) for path in find_exports(str(tmp_path))] == [
+        'meetinglistdetails_2025_05_01_2025_05_31.csv.zst', JUNE
+    ]
+    assert select_exports([str(tmp_path / name) for name in names[:3]]) == [
+        str(tmp_path / 'meetinglistdetails_2025_05_01_2025_05_31.zip'), str(tmp_path / JUNE)
+    ]
+
+
+def test_watch_ignores_a_compressed_copy_of_a_processed_export(tmp_path, sample_input, capsys):
+    folder = tmp_path / 'input'
+    folder.mkdir()
+    plain = shutil.copy(os.path.join(sample_input, JUNE), folder / JUNE)
+    output_dir = str(tmp_path / 'output')
+    manifest = RunManifest(output_dir, TOOL_VERSION, {})
+    compressed = str(folder / (JUNE + '.gz'))
+    with open(plain, 'rb') as source, gzip.open(compressed, 'wb') as target:
+        shutil.copyfileobj(source, target)
+
+    watcher = FakeWatcher(str(folder), [([str(plain)], []), ([compressed], []), ([], [compressed])])
+    watch_input_folder(watcher, output_dir, manifest, {}, formats=['csv'])
+
+    output = capsys.readouterr().out
+    assert output.count('Report generated successfully: june_2025') == 1
+    assert f'Ignoring {JUNE}.gz: same export as {JUNE}' in output
+    assert 'another copy of the export remains' in output
+    assert 'june_2025' in manifest.reports
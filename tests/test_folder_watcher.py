@@ -0,0 +1,110 @@
+"""
+Tests for the folder watcher, with both the inotify and the polling backend.
+"""
+import os
+import time
+
+import pytest
+
+from folder_watcher import FolderWatcher
+
+DEBOUNCE = 0.3
+
+
+@pytest.fixture(params=['inotify', 'polling'])
+def watcher(request, tmp_path):
+    (tmp_path / 'existing.csv').write_text('a,b\n', encoding='utf-8')
+    watcher = FolderWatcher(str(tmp_path), patterns=('*.csv', '*.csv.gz'), interval=0.05, debounce=DEBOUNCE,
+                            use_inotify=request.param == 'inotify')
+    if watcher.backend != request.param:
+        watcher.close()
+        pytest.skip('inotify is not available here')
+    yield watcher
+    watcher.close()
+
+
+def wait_for_changes(watcher, timeout: float = 5.0):
+    """Polls until a batch of changes settles, or returns empty lists after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        changed, deleted = watcher.poll(0.05)
+        if changed or deleted:
+            return changed, deleted
+    return [], []
+
+
+def names(paths):
+    return [os.path.basename(path) for path in paths]
+
+
+def test_existing_files_are_the_baseline(watcher):
+    assert watcher.poll(DEBOUNCE * 2) == ([], [])
+
+
+def test_new_and_deleted_files_are_reported(watcher, tmp_path):
+    (tmp_path / 'june.csv').write_text('a,b\n', encoding='utf-8')
+    changed, deleted = wait_for_changes(watcher)
+    assert (names(changed), deleted) == (['june.csv'], [])
+
+    os.remove(tmp_path / 'existing.csv')
+    changed, deleted = wait_for_changes(watcher)
+    assert (changed, names(deleted)) == ([], ['existing.csv'])
+
+
+def test_a_file_is_reported_once_it_stops_changing(watcher, tmp_path):
+    path = tmp_path / 'june.csv'
+    started = time.monotonic()
+    with open(path, 'w', encoding='utf-8') as file:
+        # Keep writing for longer than the debounce interval
+        for row in range(8):
+            file.write(f'{row},row\n')
+            file.flush()
+            time.sleep(0.1)
+            assert watcher.poll(0) == ([], [])
+        finished = time.monotonic()
+
+    changed, _ = wait_for_changes(watcher)
+    assert names(changed) == ['june.csv']
+    assert time.monotonic() - finished >= DEBOUNCE * 0.9
+    assert finished - started > DEBOUNCE
+
+
+def test_hidden_and_temporary_files_are_ignored(watcher, tmp_path):
+    for name in ('.june.csv', '.~lock.june.csv#', 'june.csv.part', 'june.csv.tmp', 'notes.txt'):
+        (tmp_path / name).write_text('a,b\n', encoding='utf-8')
+    assert wait_for_changes(watcher, timeout=DEBOUNCE * 3) == ([], [])
+
+    # Renaming the finished upload into place reports it
+    os.rename(tmp_path / 'june.csv.part', tmp_path / 'june.csv')
+    changed, _ = wait_for_changes(watcher)
+    assert names(changed) == ['june.csv']
+
+
+def test_touched_file_is_reported_as_modified(watcher, tmp_path):
+    path = tmp_path / 'existing.csv'
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    changed, deleted = wait_for_changes(watcher)
+    assert (names(changed), deleted) == (['existing.csv'], [])
+
+
+def test_lost_inotify_events_trigger_a_rescan(watcher, tmp_path):
+    if watcher.backend != 'inotify':
+        pytest.skip('inotify only')
+    (tmp_path / 'june.csv').write_text('a,b\n', encoding='utf-8')
+    # Drop the file's events, then report a queue overflow (IN_Q_OVERFLOW) as read() does
+    assert watcher._inotify.read(1.0)
+    read = watcher._inotify.read
+    overflowed = []
+
+    def overflow(timeout):
+        if not overflowed:
+            overflowed.append(True)
+            return None
+        return read(timeout)
+
+    watcher._inotify.read = overflow
+    changed, deleted = wait_for_changes(watcher)
+    assert overflowed
+    assert (names(changed), deleted) == (['june.csv'], [])
@@ -0,0 +1,47 @@
+"""
+Tests for identity resolution and bot filtering.
+"""
+import os
+
+from attendance_calculator import AttendanceCalculator
+from csv_reader import ZoomCSVReader
+from identity import IdentityResolver, default_identity_resolver
+
+
+def test_unique_participants_use_the_given_resolver(sample_input):
+    path = os.path.join(sample_input, 'meetinglistdetails_2025_06_01_2025_06_30.csv')
+    meeting = max(ZoomCSVReader(path).read_meetings(), key=lambda meeting: len(meeting.participants))
+    default = meeting.get_unique_participants()
+    excluded = sorted(default)[0]
+
+    resolver = IdentityResolver(('textalize', 'bot@', excluded))
+    assert meeting.get_unique_participants(resolver) == default - {excluded}
+    # A later call without a resolver is not affected by the configured patterns
+    assert meeting.get_unique_participants() == default
+
+
+def test_unique_participants_agree_with_calculator(sample_input):
+    path = os.path.join(sample_input, 'meetinglistdetails_2025_05_01_2025_05_31.csv')
+    meetings = ZoomCSVReader(path).read_meetings()
+    resolver = IdentityResolver(('textalize', 'bot@', 'example.com'))
+    calculator = AttendanceCalculator(meetings, identity_resolver=resolver)
+
+    attendees = set().union(*(meeting.get_unique_participants(resolver) for meeting in meetings
+                              if len(meeting.get_unique_participants(resolver)) >= 2))
+    assert attendees
+    assert attendees == set(calculator.calculate_individual_attendance())
+
+
+def test_unique_participants_share_the_default_resolver(sample_input):
+    path = os.path.join(sample_input, 'meetinglistdetails_2025_06_01_2025_06_30.csv')
+    meetings = ZoomCSVReader(path).read_meetings()
+    for meeting in meetings:
+        meeting.get_unique_participants()
+    interned = len(default_identity_resolver.identifiers)
+    assert interned > 0
+
+    # Every identifier was interned and classified by the first pass
+    for meeting in meetings:
+        meeting.get_unique_participants()
+    assert len(default_identity_resolver.identifiers) == interned
+    assert default_identity_resolver.bot_patterns == IdentityResolver().bot_patterns
@@ -0,0 +1,37 @@
+"""
+Tests for per-stage instrumentation.
+"""
+import subprocess
+import sys
+
+import instrumentation
+from conftest import REPO_ROOT
+from instrumentation import Tracer
+
+
+def test_instrumentation_imports_without_resource():
+    # The resource module only exists on Unix
+    code = "import sys; sys.modules['resource'] = None; import main, instrumentation; print(instrumentation.peak_rss_mb())"
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'None'
+
+
+def test_trace_without_peak_rss(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'peak_rss_mb', lambda: None)
+    tracer = Tracer(enabled=True)
+    with tracer.stage('read', 'june.csv') as stage:
+        stage.count(rows=3)
+
+    assert tracer.to_dict()['totals']['read']['process_peak_rss_mb'] is None
+    assert 'n/a' in tracer.summary_table()
+
+
+def test_cpu_time_includes_finished_child_processes():
+    tracer = Tracer(enabled=True)
+    with tracer.stage('read'):
+        subprocess.run([sys.executable, '-c', 'sum(range(20_000_000))'], check=True)
+
+    record = tracer.records[0]
+    # The stage thread itself only waited for the child
+    assert record.cpu_seconds > 0.2
+    assert record.process_peak_rss_mb > 0
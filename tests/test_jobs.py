@@ -0,0 +1,54 @@
+"""
+Tests that parallel runs (--jobs, --parse-workers) produce the same reports as a serial run.
+"""
+import filecmp
+import os
+import shutil
+
+import pytest
+
+from csv_reader import ZoomCSVReader
+from main import process_csv_files
+
+FORMATS = ['csv', 'jsonl']
+
+
+@pytest.fixture
+def exports(tmp_path, sample_input):
+    folder = tmp_path / 'input'
+    folder.mkdir()
+    return [shutil.copy(os.path.join(sample_input, name), folder) for name in sorted(os.listdir(sample_input))]
+
+
+def report_files(output_dir):
+    """Returns the relative paths of the generated report files."""
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), output_dir)
+        for directory, _, names in os.walk(output_dir)
+        for name in names
+        if name.endswith(('.csv', '.jsonl', '.json')) and 'input_file' not in directory
+    )
+
+
+def assert_same_reports(expected_dir, actual_dir):
+    expected = report_files(expected_dir)
+    assert expected and report_files(actual_dir) == expected
+    _, mismatch, errors = filecmp.cmpfiles(expected_dir, actual_dir, expected, shallow=False)
+    assert (mismatch, errors) == ([], [])
+
+
+@pytest.mark.parametrize('options', [{'jobs': 2}, {'jobs': 0}, {'parse_workers': 2}, {'jobs': 2, 'parse_workers': 3}],
+                         ids=['jobs-2', 'jobs-all-cpus', 'parse-workers-2', 'both'])
+def test_parallel_run_matches_serial_run(tmp_path, exports, monkeypatch, capsys, options):
+    # Split even the small sample exports into byte ranges
+    monkeypatch.setattr(ZoomCSVReader, 'MIN_PARALLEL_CHUNK_BYTES', 1)
+    serial_dir, parallel_dir = str(tmp_path / 'serial'), str(tmp_path / 'parallel')
+
+    assert process_csv_files(exports, jobs=1, output_base_dir=serial_dir, formats=FORMATS) == (2, 0, 0)
+    serial_output = capsys.readouterr().out
+    assert process_csv_files(exports, output_base_dir=parallel_dir, formats=FORMATS, **options) == (2, 0, 0)
+    parallel_output = capsys.readouterr().out
+
+    assert_same_reports(serial_dir, parallel_dir)
+    # Each file's output is printed as one block in input order
+    assert parallel_output.replace(parallel_dir, serial_dir) == serial_output
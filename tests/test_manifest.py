@@ -0,0 +1,80 @@
+"""
+Tests for skipping unchanged reports with the run manifest.
+"""
+import os
+import shutil
+
+import pytest
+
+from main import TOOL_VERSION, process_csv_files
+from manifest import RunManifest, hash_file
+from meeting_index import MeetingIndex
+
+SETTINGS = {'formats': ['csv']}
+
+
+@pytest.fixture
+def exports(tmp_path, sample_input):
+    folder = tmp_path / 'input'
+    folder.mkdir()
+    return [shutil.copy(os.path.join(sample_input, name), folder) for name in sorted(os.listdir(sample_input))]
+
+
+def run(output_dir, csv_files, **options):
+    manifest = RunManifest(output_dir, TOOL_VERSION, SETTINGS)
+    return process_csv_files(csv_files, output_base_dir=output_dir, manifest=manifest, formats=['csv'], **options)
+
+
+def test_unchanged_files_are_skipped(tmp_path, exports):
+    output_dir = str(tmp_path / 'output')
+
+    assert run(output_dir, exports) == (2, 0, 0)
+    assert run(output_dir, exports) == (0, 0, 2)
+
+
+def test_in_memory_dedup_keeps_the_manifest(tmp_path, exports):
+    output_dir = str(tmp_path / 'output')
+    may, june = exports
+    run(output_dir, exports)
+
+    # Nothing is skipped with a fresh in-memory index, and other reports stay recorded
+    assert run(output_dir, [june], meeting_index=MeetingIndex()) == (1, 0, 0)
+    reports = RunManifest(output_dir, TOOL_VERSION, SETTINGS).reports
+    assert set(reports) == {'may_2025', 'june_2025'}
+    assert reports['june_2025']['reusable'] is False
+
+    # A later run without --dedup skips May and rebuilds the deduplicated June report
+    assert run(output_dir, exports) == (1, 0, 1)
+    assert run(output_dir, exports) == (0, 0, 2)
+
+
+def test_changed_content_with_the_same_size_and_mtime_is_reprocessed(tmp_path, exports):
+    output_dir = str(tmp_path / 'output')
+    june = exports[1]
+    assert run(output_dir, [june]) == (1, 0, 0)
+
+    # Same length, different content, mtime set back as a sync tool might
+    stat = os.stat(june)
+    with open(june, 'rb') as file:
+        content = file.read()
+    changed = content.replace(b'Team Sync', b'Team Sink', 1)
+    assert changed != content and len(changed) == len(content)
+    with open(june, 'wb') as file:
+        file.write(changed)
+    os.utime(june, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert (os.stat(june).st_size, os.stat(june).st_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+
+    assert run(output_dir, [june]) == (1, 0, 0)
+    assert RunManifest(output_dir, TOOL_VERSION, SETTINGS).reports['june_2025']['sha256'] == hash_file(june)
+    assert run(output_dir, [june]) == (0, 0, 1)
+
+
+def test_touched_file_with_the_same_content_is_skipped(tmp_path, exports):
+    output_dir = str(tmp_path / 'output')
+    june = exports[1]
+    assert run(output_dir, [june]) == (1, 0, 0)
+
+    stat = os.stat(june)
+    os.utime(june, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert run(output_dir, [june]) == (0, 0, 1)
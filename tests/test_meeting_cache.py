@@ -0,0 +1,61 @@
+"""
+Tests for the parsed-meeting cache.
+"""
+import os
+import pickle
+import shutil
+
+import pytest
+
+import meeting_cache
+from csv_reader import ZoomCSVReader
+from meeting_cache import MeetingCache
+
+JUNE = 'meetinglistdetails_2025_06_01_2025_06_30.csv'
+
+
+@pytest.fixture
+def export(tmp_path, sample_input):
+    return shutil.copy(os.path.join(sample_input, JUNE), tmp_path / JUNE)
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    calls = []
+    hash_file = meeting_cache.hash_file
+    monkeypatch.setattr(meeting_cache, 'hash_file', lambda path: calls.append(path) or hash_file(path))
+    return calls
+
+
+def entries(cache):
+    return [name for name in os.listdir(cache.cache_dir) if name.endswith(meeting_cache.CACHE_SUFFIX)]
+
+
+def test_file_is_hashed_once_per_read(tmp_path, export, hash_calls):
+    cache = MeetingCache(str(tmp_path / 'cache'))
+    expected = ZoomCSVReader(export).read_meetings()
+
+    assert ZoomCSVReader(export, cache=cache).read_meetings() == expected
+    assert len(hash_calls) == 1
+    assert ZoomCSVReader(export, cache=cache).read_meetings() == expected
+    assert len(hash_calls) == 2
+
+
+@pytest.mark.parametrize('contents', [
+    b'',
+    b'not a pickle',
+    pickle.dumps({'meetings': {}, 'participants': {}}),
+    pickle.dumps(42),
+    pickle.dumps({'meetings': {'participant_count': [1]}, 'participants': {}}),
+])
+def test_unreadable_entry_is_replaced_by_a_fresh_parse(tmp_path, export, contents):
+    cache = MeetingCache(str(tmp_path / 'cache'))
+    expected = ZoomCSVReader(export, cache=cache).read_meetings()
+    [name] = entries(cache)
+    with open(os.path.join(cache.cache_dir, name), 'wb') as file:
+        file.write(contents)
+
+    assert cache.get(export) is None
+    assert entries(cache) == []
+    assert ZoomCSVReader(export, cache=cache).read_meetings() == expected
+    assert cache.get(export) == expected
@@ -0,0 +1,96 @@
+"""
+Tests for the cross-file meeting index, including exports removed between runs.
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+from main import TOOL_VERSION, watch_input_folder
+from manifest import RunManifest
+from meeting_index import MeetingIndex
+
+MAY = 'meetinglistdetails_2025_05_01_2025_05_31.csv'
+JUNE = 'meetinglistdetails_2025_06_01_2025_06_30.csv'
+
+
+@pytest.fixture
+def folder(tmp_path, sample_input):
+    # The bundled May and June samples hold the same meetings, so June overlaps May completely
+    folder = tmp_path / 'input'
+    folder.mkdir()
+    for name in (MAY, JUNE):
+        shutil.copy(os.path.join(sample_input, name), folder)
+    return folder
+
+
+def run_main(tmp_path, folder, *args) -> str:
+    env = dict(os.environ, INPUT_FOLDER_PATH=str(folder))
+    result = subprocess.run(
+        [sys.executable, os.path.join(REPO_ROOT, 'main.py'), '--formats', 'csv', '--dedup-index', 'index.json', *args],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def test_retain_releases_removed_exports():
+    index = MeetingIndex()
+    assert index.claim_all([('1', 10), ('1', 20)], 'may.csv') == [True, True]
+    assert index.claim_all([('1', 20), ('1', 30)], 'june.csv') == [False, True]
+    assert index.dependents('may.csv') == ['june.csv']
+
+    assert index.retain(['june.csv']) == ['june.csv']
+    assert index.owner(('1', 10)) is None
+    assert index.claim_all([('1', 20), ('1', 30)], 'june.csv') == [True, True]
+
+
+def test_index_keeps_the_skipped_exports_across_runs(tmp_path):
+    path = str(tmp_path / 'index.json')
+    index = MeetingIndex(path)
+    index.claim_all([('1', 10)], 'may.csv')
+    index.claim_all([('1', 10)], 'june.csv')
+    index.save()
+
+    assert MeetingIndex(path).dependents('may.csv') == ['june.csv']
+
+
+@pytest.mark.parametrize('args', [(), ('--force',)])
+def test_deleted_export_no_longer_owns_its_meetings(tmp_path, folder, args):
+    output = run_main(tmp_path, folder)
+    assert 'Skipped overlapping meetings: 22 already counted from ' + MAY in output
+    assert 'Total Meetings: 0' in output
+
+    os.remove(folder / MAY)
+    output = run_main(tmp_path, folder, *args)
+    assert f'Processing: {JUNE}' in output
+    assert 'Skipped overlapping meetings' not in output
+    assert 'Total Meetings: 18' in output
+
+    # The rebuilt report is up to date again
+    assert 'Skipping unchanged: ' + JUNE in run_main(tmp_path, folder)
+
+
+def test_watch_rebuilds_exports_that_skipped_a_removed_export(tmp_path, folder, capsys):
+    class FakeWatcher:
+        def changes(self):
+            os.remove(folder / MAY)
+            yield [], [str(folder / MAY)]
+
+    watcher = FakeWatcher()
+    watcher.folder = str(folder)
+    output_dir = str(tmp_path / 'output')
+    manifest = RunManifest(output_dir, TOOL_VERSION, {})
+    index = MeetingIndex(str(tmp_path / 'index.json'))
+    index.claim_all([('82231066070', 1756742353)], MAY)
+    index.claim_all([('82231066070', 1756742353)], JUNE)
+
+    watch_input_folder(watcher, output_dir, manifest, {}, formats=['csv'], meeting_index=index)
+
+    output = capsys.readouterr().out
+    assert f'Rebuilding: {JUNE}' in output
+    assert 'Skipped overlapping meetings' not in output
+    assert index.dependents(MAY) == []
+    assert MAY not in MeetingIndex(str(tmp_path / 'index.json')).claims
@@ -0,0 +1,82 @@
+"""
+Tests for the struct-of-arrays MeetingTable and its meeting/participant views.
+"""
+import os
+
+import pytest
+
+from attendance_calculator import AttendanceCalculator
+from csv_reader import ZoomCSVReader
+from identity import IdentityResolver
+from models import Meeting, MeetingTable, MeetingView, Participant, ParticipantView
+
+MEETING_FIELDS = ('topic', 'meeting_id', 'host_name', 'host_email', 'start_time', 'end_time',
+                  'total_participants', 'duration_minutes')
+PARTICIPANT_FIELDS = ('name', 'email', 'join_time', 'leave_time', 'duration_minutes', 'is_guest', 'is_host')
+
+
+@pytest.fixture
+def reader(sample_input):
+    return ZoomCSVReader(os.path.join(sample_input, 'meetinglistdetails_2025_06_01_2025_06_30.csv'))
+
+
+def test_table_round_trips_the_meetings(reader):
+    meetings = reader.read_meetings()
+    table = reader.read_table()
+
+    assert len(table) == len(meetings)
+    assert table.participant_count == sum(len(meeting.participants) for meeting in meetings)
+    assert table.to_meetings() == meetings
+    assert MeetingTable.from_meetings(meetings).to_meetings() == meetings
+
+
+def test_views_have_the_model_attributes(reader):
+    meetings = reader.read_meetings()
+    table = MeetingTable.from_meetings(meetings)
+
+    for meeting, view in zip(meetings, table):
+        assert isinstance(view, MeetingView)
+        assert [getattr(view, field) for field in MEETING_FIELDS] == [getattr(meeting, field) for field in MEETING_FIELDS]
+        assert len(view.participants) == len(meeting.participants)
+        for participant, participant_view in zip(meeting.participants, view.participants):
+            assert isinstance(participant_view, ParticipantView)
+            assert ([getattr(participant_view, field) for field in PARTICIPANT_FIELDS]
+                    == [getattr(participant, field) for field in PARTICIPANT_FIELDS])
+    assert table[-1].to_meeting() == meetings[-1]
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+
+def test_views_resolve_unique_participants_like_meetings(reader):
+    meetings = reader.read_meetings()
+    table = MeetingTable.from_meetings(meetings)
+    resolver = IdentityResolver(('textalize', 'bot@', 'sara'))
+
+    for meeting, view in zip(meetings, table):
+        assert view.get_unique_participants() == meeting.get_unique_participants()
+        assert view.get_unique_participants(resolver) == meeting.get_unique_participants(resolver)
+
+
+def test_table_feeds_the_attendance_calculator(reader):
+    meetings = reader.read_meetings()
+    expected = AttendanceCalculator(meetings)
+
+    actual = AttendanceCalculator(reader.read_table())
+
+    assert actual.calculate_individual_attendance() == expected.calculate_individual_attendance()
+    assert actual.calculate_team_attendance() == expected.calculate_team_attendance()
+
+
+def test_flags_and_missing_emails_are_stored_compactly(reader):
+    start = reader.read_meetings()[0].start_time
+    meeting = Meeting('Sync', '123', 'Host', 'host@example.com', start, start, 2, 5, [
+        Participant('Host (Host)', 'host@example.com', start, start, 5, False, True),
+        Participant('Guest', None, start, start, 5, True, False),
+    ])
+    table = MeetingTable.from_meetings([meeting, meeting])
+
+    assert table.emails == ['host@example.com', None, 'host@example.com', None]
+    assert bytes(table.flags) == bytes([2, 1, 2, 1])
+    assert list(table.participant_offsets) == [0, 2, 4]
+    # Repeated strings share one object
+    assert table.names[0] is table.names[2]
@@ -0,0 +1,162 @@
+"""
+Tests for the read/compute/write thread pipeline.
+"""
+import contextlib
+import os
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from pipeline import run_pipeline
+
+
+class Abort(BaseException):
+    """A non-Exception failure, like SystemExit, that must stop the pipeline."""
+
+
+def run_with_timeout(function, timeout: float = 10):
+    """Runs function in a thread and fails the test if it hangs."""
+    result = {}
+
+    def target():
+        try:
+            result['value'] = function()
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'pipeline hung'
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def jitter():
+    time.sleep(random.uniform(0, 0.005))
+
+
+def stages(failing_stage=None, failing_item=None, error=ValueError):
+    def stage(name):
+        def run(value):
+            item = value if name == 'read' else value['item']
+            jitter()
+            print(f'{name} {item}')
+            if name == failing_stage and item == failing_item:
+                raise error(f'{name} failed for {item}')
+            return {'item': item}
+        return run
+    return stage('read'), stage('compute'), stage('write')
+
+
+def collect(items, depth=2, on_error=None, **failure):
+    read, compute, write = stages(**failure)
+    errors = []
+    on_error = on_error or (lambda item, e: (errors.append(item), print(f'error {item}: {e}')))
+    results = run_with_timeout(lambda: list(run_pipeline(items, read, compute, write, on_error, depth=depth)))
+    return results, errors
+
+
+@pytest.mark.parametrize('depth', [1, 2, 4])
+def test_results_and_output_are_in_input_order(depth):
+    results, errors = collect(range(20), depth=depth)
+
+    assert [item for item, _, _ in results] == list(range(20))
+    assert all(success for _, success, _ in results)
+    assert [output for _, _, output in results] == [f'read {i}\ncompute {i}\nwrite {i}\n' for i in range(20)]
+    assert errors == []
+
+
+@pytest.mark.parametrize('failing_stage', ['read', 'compute', 'write'])
+def test_stage_error_fails_only_that_item(failing_stage):
+    results, errors = collect(range(6), failing_stage=failing_stage, failing_item=3)
+
+    assert [(item, success) for item, success, _ in results] == [(i, i != 3) for i in range(6)]
+    assert errors == [3]
+    output = results[3][2]
+    assert output.endswith(f'error 3: {failing_stage} failed for 3\n')
+    if failing_stage != 'write':
+        assert 'write 3' not in output
+
+
+def test_failing_on_error_is_captured_and_does_not_hang():
+    def on_error(item, e):
+        raise RuntimeError('on_error broke')
+
+    results, _ = collect(range(5), on_error=on_error, failing_stage='read', failing_item=2)
+
+    assert [success for _, success, _ in results] == [True, True, False, True, True]
+    assert 'RuntimeError: on_error broke' in results[2][2]
+
+
+def test_items_error_is_raised_after_earlier_items():
+    def items():
+        yield 0
+        yield 1
+        raise OSError('listing failed')
+
+    read, compute, write = stages()
+    seen = []
+
+    def consume():
+        for item, _, _ in run_pipeline(items(), read, compute, write, lambda item, e: None):
+            seen.append(item)
+
+    with pytest.raises(OSError, match='listing failed'):
+        run_with_timeout(consume)
+    assert seen == [0, 1]
+
+
+@pytest.mark.parametrize('failing_stage', ['read', 'compute', 'write'])
+def test_base_exception_in_a_stage_stops_the_pipeline(failing_stage):
+    with pytest.raises(Abort):
+        collect(range(10), failing_stage=failing_stage, failing_item=4, error=Abort)
+
+
+def test_closing_early_stops_the_threads():
+    read, compute, write = stages()
+    stdout = sys.stdout
+
+    def consume_one():
+        results = run_pipeline(range(100), read, compute, write, lambda item, e: None, depth=1)
+        first = next(results)
+        results.close()
+        return first
+
+    assert run_with_timeout(consume_one)[0] == 0
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith('pipeline-')]
+    assert sys.stdout is stdout
+
+
+def test_process_csv_files_pipeline_matches_one_by_one(tmp_path, capsys, sample_input):
+    import shutil
+    from main import process_csv_files
+
+    csv_files = []
+    for name in sorted(os.listdir(sample_input)):
+        csv_files.append(shutil.copy(os.path.join(sample_input, name), tmp_path))
+    broken = tmp_path / 'meetinglistdetails_2025_04_01_2025_04_30.csv'
+    broken.write_text('Topic,ID\nNo header match,1\n', encoding='utf-8')
+    csv_files.insert(1, str(broken))
+
+    logs = {}
+    for depth in (0, 2):
+        output_dir = str(tmp_path / f'output_{depth}')
+        # The pipeline captures stderr into each file's output, like --jobs
+        with contextlib.redirect_stderr(sys.stdout):
+            counts = process_csv_files(csv_files, output_base_dir=output_dir, pipeline_depth=depth,
+                                       formats=['csv'])
+        output = capsys.readouterr().out.replace(output_dir, 'OUTPUT')
+        # Traceback frames differ (the pipeline adds its own); the error lines must not
+        logs[depth] = [line for line in output.splitlines()
+                       if not line.startswith((' ', 'Traceback'))]
+        assert counts == (2, 1, 0)
+
+    assert logs[2] == logs[0]
+    log = '\n'.join(logs[0])
+    assert 'KeyError' in log
+    assert log.index('2025_05_01') < log.index('2025_04_01') < log.index('2025_06_01')
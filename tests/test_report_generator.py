@@ -0,0 +1,105 @@
+"""
+Round-trip tests for the report sinks and the sink registry.
+"""
+import csv
+import importlib.util
+import json
+import os
+
+import openpyxl
+import pytest
+
+from attendance_calculator import AttendanceCalculator
+from csv_reader import ZoomCSVReader
+from report_generator import (INDIVIDUAL_SHEET, REPORT_SINKS, TEAM_SHEET, ReportGenerator, ReportSink,
+                              build_report_tables, register_sink)
+
+HAS_PARQUET_ENGINE = any(importlib.util.find_spec(module) for module in ('pyarrow', 'fastparquet'))
+
+
+@pytest.fixture(params=[None, 0.5], ids=['plain', 'time-weighted'])
+def stats(request, sample_input):
+    meetings = ZoomCSVReader(os.path.join(sample_input, 'meetinglistdetails_2025_06_01_2025_06_30.csv')).read_meetings()
+    calculator = AttendanceCalculator(meetings, presence_threshold=request.param)
+    return calculator.calculate_individual_attendance(), calculator.calculate_team_attendance()
+
+
+def generate(tmp_path, stats, format_name):
+    generator = ReportGenerator(str(tmp_path / 'attendance_report_june_2025.xlsx'))
+    written = generator.generate(*stats, formats=[format_name])
+    assert written == generator.output_paths([format_name])
+    assert all(os.path.exists(path) for path in written)
+    return written, build_report_tables(*stats)
+
+
+def test_csv_round_trip(tmp_path, stats):
+    (individual_csv, team_csv), tables = generate(tmp_path, stats, 'csv')
+
+    for path, columns, rows in ((individual_csv, tables.individual_columns, tables.individual_rows),
+                                (team_csv, tables.team_columns, tables.team_rows)):
+        with open(path, encoding='utf-8', newline='') as file:
+            assert list(csv.reader(file)) == [columns] + [[str(value) for value in row] for row in rows]
+
+
+def test_jsonl_round_trip(tmp_path, stats):
+    (individual_jsonl, team_jsonl), tables = generate(tmp_path, stats, 'jsonl')
+
+    for path, columns, rows in ((individual_jsonl, tables.individual_columns, tables.individual_rows),
+                                (team_jsonl, tables.team_columns, tables.team_rows)):
+        with open(path, encoding='utf-8') as file:
+            assert [json.loads(line) for line in file] == [dict(zip(columns, row)) for row in rows]
+
+
+@pytest.mark.skipif(not HAS_PARQUET_ENGINE, reason='needs pyarrow or fastparquet')
+def test_parquet_round_trip(tmp_path, stats):
+    import pandas as pd
+
+    (individual_parquet, team_parquet), tables = generate(tmp_path, stats, 'parquet')
+
+    individual = pd.read_parquet(individual_parquet)
+    assert list(individual.columns) == tables.individual_columns
+    assert [tuple(row) for row in individual.astype(object).itertuples(index=False)] == tables.individual_rows
+    team = pd.read_parquet(team_parquet)
+    assert list(team.columns) == tables.team_columns
+    # Team values are stored as text
+    assert [tuple(row) for row in team.itertuples(index=False)] == [
+        (metric, str(value)) for metric, value in tables.team_rows
+    ]
+
+
+@pytest.mark.parametrize('xlsx_writer', ['streaming', 'pandas'])
+def test_xlsx_round_trip(tmp_path, stats, xlsx_writer):
+    generator = ReportGenerator(str(tmp_path / 'report.xlsx'), xlsx_writer=xlsx_writer)
+    generator.generate(*stats, formats=['xlsx'])
+    tables = build_report_tables(*stats)
+
+    workbook = openpyxl.load_workbook(tmp_path / 'report.xlsx')
+    assert workbook.sheetnames == [INDIVIDUAL_SHEET, TEAM_SHEET]
+    for title, columns, rows in ((INDIVIDUAL_SHEET, tables.individual_columns, tables.individual_rows),
+                                 (TEAM_SHEET, tables.team_columns, tables.team_rows)):
+        assert list(workbook[title].values) == [tuple(columns)] + rows
+
+
+def test_registry_creates_each_registered_sink():
+    generator = ReportGenerator('report.xlsx')
+
+    assert set(REPORT_SINKS) >= {'xlsx', 'csv', 'parquet', 'jsonl'}
+    for format_name, sink_class in REPORT_SINKS.items():
+        sink = generator.create_sink(format_name)
+        assert type(sink) is sink_class and sink.format_name == format_name
+    with pytest.raises(ValueError, match="Unknown report format 'pdf'"):
+        generator.create_sink('pdf')
+    with pytest.raises(ValueError, match='Unknown xlsx writer'):
+        ReportGenerator('report.xlsx', xlsx_writer='xlsxwriter')
+
+
+def test_incomplete_sink_fails_when_created(monkeypatch):
+    monkeypatch.setattr('report_generator.REPORT_SINKS', dict(REPORT_SINKS))
+
+    @register_sink('incomplete')
+    class IncompleteSink(ReportSink):
+        def output_paths(self, base_filename):
+            return [f"{base_filename}.txt"]
+
+    with pytest.raises(TypeError, match='abstract'):
+        ReportGenerator('report.xlsx').create_sink('incomplete')
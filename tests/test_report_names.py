@@ -0,0 +1,58 @@
+"""
+Tests for report names derived from export filenames.
+"""
+import pytest
+
+from main import get_export_report_name, get_report_name
+
+MONTH = 'meetinglistdetails_2025_06_01_2025_06_30.csv'
+PULL = 'meetinglistdetails_2025_06_10_2025_06_24.csv'
+SPANNING = 'meetinglistdetails_2025_06_20_2025_07_03.csv'
+
+
+@pytest.mark.parametrize('filename, expected', [
+    (MONTH, 'june_2025'),
+    (PULL, 'june_2025'),
+    (SPANNING, 'june_2025'),
+    (PULL + '.gz', 'june_2025'),
+    ('meetinglistdetails_2025_06_10_2025_06_24.zip', 'june_2025'),
+    ('attendance_export.csv', 'attendance_export'),
+])
+def test_a_lone_export_is_named_after_its_month(filename, expected):
+    assert get_report_name(filename) == expected
+
+
+def test_exports_of_the_same_month_name_their_days():
+    exports = [MONTH, PULL, SPANNING]
+
+    assert [get_report_name(name, exports) for name in exports] == [
+        'june_2025', 'june_2025_10_to_24', 'june_2025_20_to_july_2025_03'
+    ]
+
+
+def test_other_months_and_compressed_copies_do_not_collide():
+    assert get_report_name(PULL, [PULL, PULL + '.gz', 'meetinglistdetails_2025_07_01_2025_07_31.csv']) == 'june_2025'
+
+
+def test_export_report_name_looks_at_the_folder(tmp_path):
+    for name in (MONTH, PULL):
+        (tmp_path / name).write_text('', encoding='utf-8')
+
+    assert get_export_report_name(str(tmp_path / MONTH)) == 'june_2025'
+    assert get_export_report_name(str(tmp_path / PULL)) == 'june_2025_10_to_24'
+
+
+def test_a_batch_of_exports_scans_its_folder_once(tmp_path, monkeypatch):
+    import main
+
+    names = [MONTH, PULL, SPANNING, 'meetinglistdetails_2025_07_01_2025_07_31.csv']
+    for name in names:
+        (tmp_path / name).write_text('', encoding='utf-8')
+    paths = [str(tmp_path / name) for name in names]
+    expected = {path: get_export_report_name(path) for path in paths}
+
+    scans = []
+    export_paths = main._export_paths
+    monkeypatch.setattr(main, '_export_paths', lambda folder: scans.append(folder) or export_paths(folder))
+    assert main.get_export_report_names(paths) == expected
+    assert scans == [str(tmp_path)]
@@ -0,0 +1,87 @@
+"""
+Equivalence tests of the fast timestamp parsers against datetime.strptime.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from timestamp_parser import ZOOM_DATETIME_FORMAT, parse_zoom_datetime, parse_zoom_datetimes
+
+
+def every_second_of_a_day():
+    return [(datetime(2025, 1, 1) + timedelta(seconds=second)).strftime(ZOOM_DATETIME_FORMAT)
+            for second in range(86400)]
+
+
+def every_day_1999_to_2031():
+    values = []
+    day = datetime(1999, 1, 1, 23, 59, 59)
+    while day.year < 2032:
+        values.append(day.strftime(ZOOM_DATETIME_FORMAT))
+        day += timedelta(days=1)
+    return values
+
+
+# Accepted by strptime although they are not in Zoom's fixed-width layout
+VARIANTS = ['1/5/2025 4:01:34 PM', '09/30/2025 04:01:34 pm', '09/30/2025 12:00:00 am', '09/30/2025 12:00:00 aM',
+            '02/29/2024 11:59:59 Pm', '9/30/2025 04:01:34 PM', '09/30/2025 4:01:34 AM']
+
+MALFORMED = [
+    # Wrong width
+    '', '09/30/2025', '09/30/25 04:01:34 PM', '009/30/2025 04:01:34 PM', '09/30/2025 04:01:34 PM ',
+    ' 09/30/2025 04:01:34 PM', '09/30/2025 04:01:34', '09/30/2025 04:01:34 PMX', '09/30/20250 04:01:34 PM',
+    # Out of range
+    '13/01/2025 04:01:34 PM', '00/01/2025 04:01:34 PM', '02/30/2025 04:01:34 PM', '02/29/2025 04:01:34 PM',
+    '09/00/2025 04:01:34 PM', '09/30/2025 00:01:34 PM', '09/30/2025 00:00:00 AM', '09/30/2025 13:01:34 PM',
+    '09/30/2025 04:60:34 PM', '09/30/2025 04:01:60 PM',
+    # Wrong characters
+    '09/30/2025 04:01:34 XM', '09/30/2025 04:01:34 P.M.', '09-30-2025 04:01:34 PM', '09/30/2025T04:01:34 PM',
+    '０9/30/2025 04:01:34 PM', '+9/30/2025 04:01:34 PM', '09/30/2025 04:01:3a PM',
+]
+
+
+def strptime(value):
+    return datetime.strptime(value, ZOOM_DATETIME_FORMAT)
+
+
+@pytest.mark.parametrize('values', [every_second_of_a_day(), every_day_1999_to_2031(), VARIANTS],
+                         ids=['seconds', 'days', 'variants'])
+def test_parsers_match_strptime(values):
+    expected = [strptime(value) for value in values]
+
+    assert [parse_zoom_datetime(value) for value in values] == expected
+    assert parse_zoom_datetimes(values).astype('datetime64[s]').astype(object).tolist() == expected
+
+
+@pytest.mark.parametrize('value', MALFORMED)
+def test_malformed_values_raise_like_strptime(value):
+    with pytest.raises(ValueError) as strptime_error:
+        strptime(value)
+
+    with pytest.raises(ValueError, match='expected .MM/DD/YYYY HH:MM:SS AM/PM.') as error:
+        parse_zoom_datetime(value)
+    assert type(error.value) is type(strptime_error.value)
+    with pytest.raises(type(strptime_error.value)):
+        parse_zoom_datetimes(['09/30/2025 04:01:34 PM', value])
+
+
+def test_non_string_raises_like_strptime():
+    with pytest.raises(TypeError):
+        strptime(None)
+    with pytest.raises(TypeError):
+        parse_zoom_datetime(None)
+
+
+
+@pytest.mark.parametrize('value', [None, float('nan'), 1234567890123456789012, datetime(2025, 9, 30)])
+def test_batch_with_non_strings_raises_like_strptime(value):
+    with pytest.raises(TypeError):
+        parse_zoom_datetimes(['09/30/2025 04:01:34 PM', value])
+
+
+def test_batch_mixes_fixed_width_and_other_values():
+    values = ['09/30/2025 04:01:34 PM', '9/30/2025 4:01:34 PM', '10/01/2025 12:00:00 AM', '1/5/2025 4:01:34 PM']
+
+    assert parse_zoom_datetimes(values).astype('datetime64[s]').astype(object).tolist() == [
+        strptime(value) for value in values
+    ]
@@ -0,0 +1,28 @@
+"""
+Tests for the streaming xlsx writer.
+"""
+import os
+
+import openpyxl
+
+from xlsx_writer import StreamingXlsxWriter
+
+
+def test_cell_types_match_openpyxl(tmp_path):
+    row = ['name', 3, 2.5, True, False, None, float('nan')]
+    streamed = os.path.join(tmp_path, 'streamed.xlsx')
+    with StreamingXlsxWriter(streamed) as writer:
+        writer.add_sheet('Report').append(row)
+
+    expected = os.path.join(tmp_path, 'expected.xlsx')
+    workbook = openpyxl.Workbook()
+    workbook.active.title = 'Report'
+    workbook.active.append(row[:-1] + ['nan'])
+    workbook.save(expected)
+
+    def cells(path):
+        sheet = openpyxl.load_workbook(path)['Report']
+        return [(cell.value, cell.data_type) for cell in next(sheet.iter_rows(max_col=len(row)))]
+
+    assert cells(streamed) == cells(expected)
+    assert cells(streamed)[3:5] == [(True, 'b'), (False, 'b')]
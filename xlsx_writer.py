@@ -0,0 +1,195 @@
+"""
+Constant-memory streaming writer for simple .xlsx workbooks.
+"""
+import re
+import math
+import zipfile
+import tempfile
+
+
+# Characters that are not allowed in XML 1.0 documents
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _escape(text: str, attribute: bool = False) -> str:
+    """Escapes text for XML content, or for a double-quoted attribute value."""
+    # Same as xml.sax.saxutils.escape, which would pull urllib into every startup
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return text.replace('"', '&quot;') if attribute else text
+
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def column_letter(index: int) -> str:
+    """Returns the Excel column letter for a zero-based column index (0 -> A, 26 -> AA)."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class StreamingSheet:
+    """
+    A worksheet whose rows are streamed to a temporary file as they are appended.
+
+    Column widths are tracked while rows are written (longest value + 2, as the
+    report generator has always done) and written out when the workbook closes,
+    so any number of rows and columns can be written in constant memory.
+    """
+
+    def __init__(self, title: str):
+        self.title = title
+        self.widths = []
+        self.row_count = 0
+        self._rows = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+
+    def append(self, values):
+        """Appends one row of values (str, int, float, bool or None for an empty cell)."""
+        self.row_count += 1
+        row_number = self.row_count
+        cells = []
+        for column, value in enumerate(values):
+            if value is None:
+                continue
+            reference = f"{column_letter(column)}{row_number}"
+            text = str(value)
+            if isinstance(value, bool):
+                text = 'TRUE' if value else 'FALSE'
+                cells.append(f'<c r="{reference}" t="b"><v>{int(value)}</v></c>')
+            elif isinstance(value, (int, float)) and math.isfinite(value):
+                cells.append(f'<c r="{reference}"><v>{text}</v></c>')
+            else:
+                cells.append(
+                    f'<c r="{reference}" t="inlineStr"><is><t xml:space="preserve">'
+                    f'{_escape(_ILLEGAL_XML_CHARS.sub("", text))}</t></is></c>'
+                )
+
+            width = len(text) + 2
+            if column >= len(self.widths):
+                self.widths.extend([0] * (column + 1 - len(self.widths)))
+            if width > self.widths[column]:
+                self.widths[column] = width
+        self._rows.write(f'<row r="{row_number}">{"".join(cells)}</row>')
+
+    def _write_to(self, stream):
+        """Writes the complete worksheet XML, including column widths, to a binary stream."""
+        stream.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        )
+        if self.widths:
+            cols = ''.join(
+                f'<col min="{index + 1}" max="{index + 1}" width="{width}" customWidth="1"/>'
+                for index, width in enumerate(self.widths)
+            )
+            stream.write(f'<cols>{cols}</cols>'.encode('utf-8'))
+        stream.write(b'<sheetData>')
+        self._rows.seek(0)
+        for chunk in iter(lambda: self._rows.read(1024 * 1024), ''):
+            stream.write(chunk.encode('utf-8'))
+        stream.write(b'</sheetData></worksheet>')
+        self._rows.close()
+
+
+class StreamingXlsxWriter:
+    """
+    Writes .xlsx workbooks without holding the cell data in memory.
+
+    Usage:
+        with StreamingXlsxWriter('report.xlsx') as writer:
+            sheet = writer.add_sheet('Summary')
+            sheet.append(['Metric', 'Value'])
+            sheet.append(['Total Meetings', 18])
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.sheets = []
+
+    def add_sheet(self, title: str) -> StreamingSheet:
+        sheet = StreamingSheet(title)
+        self.sheets.append(sheet)
+        return sheet
+
+    def close(self):
+        """Assembles the workbook package from the streamed sheets."""
+        content_types = _CONTENT_TYPES_HEAD + ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{index}.xml" '
+            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for index in range(1, len(self.sheets) + 1)
+        ) + '</Types>'
+        workbook = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + ''.join(
+                f'<sheet name="{_escape(sheet.title, attribute=True)}" sheetId="{index}" r:id="rId{index}"/>'
+                for index, sheet in enumerate(self.sheets, start=1)
+            )
+            + '</sheets></workbook>'
+        )
+        workbook_rels = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + ''.join(
+                f'<Relationship Id="rId{index}" '
+                f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                f'Target="worksheets/sheet{index}.xml"/>'
+                for index in range(1, len(self.sheets) + 1)
+            )
+            + f'<Relationship Id="rId{len(self.sheets) + 1}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+            'Target="styles.xml"/></Relationships>'
+        )
+
+        with zipfile.ZipFile(self.filename, 'w', zipfile.ZIP_DEFLATED) as package:
+            package.writestr('[Content_Types].xml', content_types)
+            package.writestr('_rels/.rels', _ROOT_RELS)
+            package.writestr('xl/workbook.xml', workbook)
+            package.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+            package.writestr('xl/styles.xml', _STYLES)
+            for index, sheet in enumerate(self.sheets, start=1):
+                with package.open(f'xl/worksheets/sheet{index}.xml', 'w', force_zip64=True) as stream:
+                    sheet._write_to(stream)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            for sheet in self.sheets:
+                sheet._rows.close()